@@ -0,0 +1,195 @@
+"""
+Asyncio version of HttpClient based on httpx with HTTP/2 multiplexing.
+Requires the 'async' extra: pip install mlflow-reports[async]
+
+Usage:
+    async with AsyncHttpClient("api/2.0/mlflow") as client:
+        rsps = await asyncio.gather(*[ client.get("registered-models/get", {"name": name}) for name in names ])
+"""
+
+import os
+import time
+import asyncio
+import importlib.util
+import httpx
+
+from mlflow_reports.common import MlflowReportsException
+from mlflow_reports.common import json_codec
+from . import USER_AGENT
+from . import http_client, response_cache, rate_limiter, http_metrics
+from .http_client import BaseHttpClient
+
+_TIMEOUT = 120 # per MLflow client
+_MAX_CONNECTIONS = 100
+
+_debug = os.environ.get("DEBUG")
+
+
+class AsyncHttpClient(BaseHttpClient):
+    """
+    Wrapper for async HTTP calls for MLflow Databricks APIs. Mirrors HttpClient with awaitable methods.
+    """
+    def __init__(self, api_name, host=None, token=None, http2=True, max_connections=_MAX_CONNECTIONS):
+        """
+        :param api_name: Name of base API such as 'api/2.0' or 'api/2.0/mlflow'.
+        :param host: Host name of tracking server such as 'http://localhost:5000' or 'databricks://my_profile'.
+        :param token: Databricks token if using Databricks.
+        :param http2: Use HTTP/2 if the 'h2' package is installed.
+        :param max_connections: Maximum number of open connections.
+        """
+        (host, token) = http_client.resolve_host_token(host, token)
+        self.host = host
+        self.api_uri = os.path.join(host, api_name)
+        self.token = token
+        if http2 and not importlib.util.find_spec("h2"):
+            print("WARNING: HTTP/2 requires the 'h2' package. Using HTTP/1.1.")
+            http2 = False
+        self.http2 = http2
+        self._client = httpx.AsyncClient(
+            http2 = http2,
+            timeout = _TIMEOUT,
+            limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        )
+
+
+    async def _get(self, resource, params=None):
+        uri = self._mk_uri(resource)
+        if _debug: print(f">> AsyncHttpClient: GET URI: {uri} PARAMS: {params}")
+        rsp = await self._request("GET", uri, json=params)
+        return self._check_response(rsp, params)
+
+    async def get(self, resource, params=None):
+        """ Executes an HTTP GET call
+        :param resource: Relative path name of resource such as experiments/search
+        :param params: Dict of query parameters
+        """
+        cache = response_cache.get_cache()
+        if not cache:
+            return json_codec.loads((await self._get(resource, params)).content)
+        key = cache.mk_key(self.api_uri, self.token, resource, params)
+        text = await _call_cache(cache, cache.get, key, resource)
+        if text is None:
+            rsp = await self._get(resource, params)
+            await _call_cache(cache, cache.put, key, resource, rsp.text)
+            return json_codec.loads(rsp.content)
+        return json_codec.loads(text)
+
+
+    async def _post(self, resource, data=None):
+        return await self._mutator("POST", resource, data)
+
+    async def post(self, resource, data=None):
+        """ Executes an HTTP POST call
+        :param resource: Relative path name of resource such as runs/search
+        :param data: Request payload as dict
+        """
+        return json_codec.loads((await self._post(resource, self._json_dumps(data))).content)
+
+
+    async def _put(self, resource, data=None):
+        return await self._mutator("PUT", resource, data)
+
+    async def put(self, resource, data=None):
+        """ Executes an HTTP PUT call
+        :param resource: Relative path name of resource
+        :param data: Request payload as dict
+        """
+        return json_codec.loads((await self._put(resource, self._json_dumps(data))).content)
+
+
+    async def _patch(self, resource, data=None):
+        return await self._mutator("PATCH", resource, data)
+
+    async def patch(self, resource, data=None):
+        """ Executes an HTTP PATCH call
+        :param resource: Relative path name of resource
+        :param data: Request payload as dict
+        """
+        return json_codec.loads((await self._patch(resource, self._json_dumps(data))).content)
+
+
+    async def _delete(self, resource):
+        uri = self._mk_uri(resource)
+        rsp = await self._request("DELETE", uri)
+        return self._check_response(rsp)
+
+    async def delete(self, resource):
+        """ Executes an HTTP DELETE call
+        :param resource: Relative path name of resource
+        """
+        return json_codec.loads((await self._delete(resource)).content)
+
+
+    def get_api_uri(self):
+        return self.api_uri
+
+    def get_token(self):
+        return self.token
+
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+
+    async def _mutator(self, method, resource, data=None):
+        uri = self._mk_uri(resource)
+        if _debug: print(f">> AsyncHttpClient: {method} URI: {uri} DATA: {data}")
+        rsp = await self._request(method, uri, content=data)
+        return self._check_response(rsp)
+
+    async def _request(self, method, uri, **kwargs):
+        """
+        Same rate limiting, retries and metrics as HttpClient._request() without blocking the event loop.
+        """
+        bucket = rate_limiter.get_bucket(self.host)
+        resource = uri[len(self.api_uri)+1:]
+        for attempt in range(0, http_client._MAX_RETRIES+1):
+            await bucket.acquire_async()
+            start = time.perf_counter()
+            try:
+                rsp = await self._client.request(method, uri, headers=self._mk_headers(), **kwargs)
+            except httpx.HTTPError as e:
+                http_metrics.record(method, resource, type(e).__name__, time.perf_counter()-start)
+                raise
+            http_metrics.record(method, resource, rsp.status_code, time.perf_counter()-start, len(rsp.content))
+            if not http_client._is_retryable(method, resource, rsp.status_code) or attempt == http_client._MAX_RETRIES:
+                return rsp
+            delay = http_client._get_retry_delay(rsp, attempt)
+            print(f"WARNING: HTTP {rsp.status_code} for {method} {uri}. Retrying in {round(delay,2)} seconds (retry {attempt+1} of {http_client._MAX_RETRIES}).")
+            bucket.pause(delay)
+
+    def _json_dumps(self, data):
+        return json_codec.dumps(data) if data else None
+
+    def _mk_headers(self):
+        headers = { "User-Agent": USER_AGENT, "Content-Type": "application/json" }
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return headers
+
+    def _mk_uri(self, resource):
+        return f"{self.api_uri}/{resource}"
+
+    def _check_response(self, rsp, params=None):
+        if rsp.status_code < 200 or rsp.status_code > 299:
+            raise MlflowReportsException(rsp.status_code, str(rsp.url), params, rsp.text)
+        return rsp
+
+    def __repr__(self):
+        return self.api_uri
+
+
+async def _call_cache(cache, func, *args):
+    """
+    Calls a response cache method in a worker thread when the cache has an SQLite file so its disk I/O
+    does not block the event loop. The in-memory only cache is called directly.
+    """
+    if not cache.cache_file:
+        return func(*args)
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
@@ -0,0 +1,187 @@
+"""
+Capability discovery for the MLflow tracking server host: Databricks or OSS MLflow, Unity Catalog availability
+and which Databricks-only endpoints are supported.
+
+Each host is probed once and the result is cached in memory and on disk with a TTL so that short-lived
+CLI processes do not pay the probe round trips every time.
+
+Configure with environment variables:
+  - MLFLOW_REPORTS_CAPABILITIES_FILE - cache file. Default is ~/.cache/mlflow-reports/capabilities.json. Set to '' to disable.
+  - MLFLOW_REPORTS_CAPABILITIES_TTL - TTL in seconds. Default is one day.
+or programmatically with configure().
+"""
+
+import os
+import json
+import time
+import threading
+from dataclasses import dataclass, field, asdict
+from mlflow_reports.common import MlflowReportsException
+
+_DEFAULT_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "mlflow-reports", "capabilities.json")
+_DEFAULT_TTL = 24 * 3600
+# An inconclusive probe (e.g. a transient error) is only cached in memory and retried after this many seconds
+_INCONCLUSIVE_TTL = 60
+
+# Endpoints that are not available on all hosts
+ENDPOINT_PERMISSIONS = "permissions"
+ENDPOINT_DATABRICKS_REGISTERED_MODELS = "databricks/registered-models/get"
+ENDPOINT_UNITY_CATALOG = "unity-catalog"
+# Databricks requires a model name filter for 'model-versions/search'
+ENDPOINT_SEARCH_ALL_MODEL_VERSIONS = "model-versions/search-without-filter"
+
+
+@dataclass
+class Capabilities:
+    host: str
+    is_databricks: bool
+    has_unity_catalog: bool
+    endpoints: dict = field(default_factory=dict)
+    expires_at: float = 0.0
+
+    def supports(self, endpoint):
+        return self.endpoints.get(endpoint, False)
+
+
+_ENV_CACHE_FILE = os.environ.get("MLFLOW_REPORTS_CAPABILITIES_FILE", _DEFAULT_CACHE_FILE)
+_ENV_TTL = int(os.environ.get("MLFLOW_REPORTS_CAPABILITIES_TTL", _DEFAULT_TTL))
+
+_cache_file = _ENV_CACHE_FILE
+_ttl = _ENV_TTL
+_capabilities = {}
+_probes = {} # host to threading.Event of its probe in progress
+_lock = threading.Lock()
+
+
+def configure(cache_file=_ENV_CACHE_FILE, ttl=_ENV_TTL):
+    """
+    :param cache_file: On-disk cache file. If None or '', results are only cached in memory.
+    :param ttl: TTL in seconds.
+    """
+    global _cache_file, _ttl
+    with _lock:
+        _cache_file, _ttl = cache_file, ttl
+        _capabilities.clear()
+
+
+def get_capabilities():
+    """
+    Returns the capabilities of the tracking server host, probing it only if there is no unexpired cached result.
+    Only one thread probes a host. Other threads wait for its result without holding the lock.
+    """
+    from . http_client import dbx_20_client
+    host = dbx_20_client.host
+    while True:
+        with _lock:
+            caps = _capabilities.get(host)
+            if caps and caps.expires_at > time.time():
+                return caps
+            probe = _probes.get(host)
+            is_prober = probe is None
+            if is_prober:
+                probe = threading.Event()
+                _probes[host] = probe
+        if is_prober:
+            return _probe_and_publish(host, probe)
+        probe.wait() # then re-check the cache - if the probe failed this thread probes
+
+
+def _probe_and_publish(host, probe):
+    try:
+        caps, conclusive = _read_cache_file(host), False
+        if not caps:
+            caps, conclusive = _probe(host)
+        with _lock:
+            if conclusive:
+                _write_cache_file(caps)
+            _capabilities[host] = caps
+        return caps
+    finally:
+        with _lock:
+            _probes.pop(host, None)
+        probe.set()
+
+
+def supports(endpoint):
+    return get_capabilities().supports(endpoint)
+
+
+def clear():
+    """
+    Clears the in-memory and on-disk caches.
+    """
+    with _lock:
+        _capabilities.clear()
+        if _cache_file and os.path.exists(_cache_file):
+            os.remove(_cache_file)
+
+
+def _probe(host):
+    """
+    Databricks returns 400 for 'workspace/get-status' without a path - OSS MLflow does not have the endpoint.
+    A workspace without Unity Catalog returns 404 (or 403) for 'unity-catalog/current-metastore-assignment'.
+    Any other failure, e.g. a transient 503, is inconclusive.
+    :return: Tuple of (Capabilities, whether the probe was conclusive and can be persisted)
+    """
+    from . http_client import dbx_20_client, dbx_21_client
+    try:
+        dbx_20_client.get("workspace/get-status")
+        is_databricks, conclusive = False, False # should never get here
+    except MlflowReportsException as e:
+        is_databricks = e.http_status_code == 400
+        conclusive = e.http_status_code in (400, 404)
+    has_unity_catalog = False
+    if is_databricks:
+        try:
+            dbx_21_client.get("unity-catalog/current-metastore-assignment")
+            has_unity_catalog = True
+        except MlflowReportsException as e:
+            if e.http_status_code not in (403, 404):
+                print(f"WARNING: Cannot determine if '{host}' has Unity Catalog: {e}")
+                conclusive = False
+    print(f"Calling Databricks MLflow: {is_databricks}. Unity Catalog: {has_unity_catalog}")
+    endpoints = {
+        ENDPOINT_PERMISSIONS: is_databricks,
+        ENDPOINT_DATABRICKS_REGISTERED_MODELS: is_databricks,
+        ENDPOINT_UNITY_CATALOG: has_unity_catalog,
+        ENDPOINT_SEARCH_ALL_MODEL_VERSIONS: not is_databricks
+    }
+    ttl = _ttl if conclusive else min(_ttl, _INCONCLUSIVE_TTL)
+    caps = Capabilities(host, is_databricks, has_unity_catalog, endpoints, time.time() + ttl)
+    return caps, conclusive
+
+
+def _read_cache_file(host):
+    if not _cache_file:
+        return None
+    dct = _read_json(_cache_file).get(host)
+    if not dct or dct.get("expires_at", 0) <= time.time():
+        return None
+    try:
+        return Capabilities(**dct)
+    except TypeError: # written by a different version
+        return None
+
+
+def _write_cache_file(caps):
+    if not _cache_file:
+        return
+    try:
+        dct = _read_json(_cache_file)
+        dct[caps.host] = asdict(caps)
+        os.makedirs(os.path.dirname(os.path.abspath(_cache_file)), exist_ok=True)
+        tmp_file = f"{_cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(dct, f, indent=2)
+        os.replace(tmp_file, _cache_file)
+    except OSError as e:
+        print(f"WARNING: Cannot write capabilities cache file '{_cache_file}': {e}")
+
+
+def _read_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            dct = json.load(f)
+        return dct if isinstance(dct, dict) else {}
+    except (OSError, ValueError):
+        return {}
@@ -1,12 +1,10 @@
-from databricks_cli.configure import provider
-from mlflow.utils.databricks_utils import is_in_databricks_runtime
-
-
 def get_host_token_for_profile(profile=None):
     """
     :param profile: Databricks profile as in ~/.databrickscfg or None for the default profile
     :return: tuple of (host, token) from the ~/.databrickscfg profile
     """
+    from databricks_cli.configure import provider
+    from mlflow.utils.databricks_utils import is_in_databricks_runtime
     if profile:
         cfg = provider.get_config_for_profile(profile)
         if not cfg.host and is_in_databricks_runtime():
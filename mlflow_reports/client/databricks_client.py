@@ -5,7 +5,16 @@ from . http_client import dbx_20_client, get_mlflow_client
 class DatabricksClient:
     
     def __init__(self):
-        self.mlflow_client = get_mlflow_client()
+        self._mlflow_client = None
+
+    @property
+    def mlflow_client(self):
+        """
+        Resolved on first use so that importing does not probe the tracking server.
+        """
+        if self._mlflow_client is None:
+            self._mlflow_client = get_mlflow_client()
+        return self._mlflow_client
 
     def get_workspace_status(self) -> Dict:
         return dbx_20_client.get("workspace/get-status")
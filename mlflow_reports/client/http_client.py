@@ -1,14 +1,34 @@
 from abc import abstractmethod, ABCMeta
 import os
+import sys
 import json
+import time
+import random
+from email.utils import parsedate_to_datetime
 import requests
 import click
 from mlflow_reports.common import MlflowReportsException
+from mlflow_reports.common import json_codec
 from . import USER_AGENT
 from . import mlflow_auth_utils
 from . import databricks_cli_utils
+from . import http_session
+from . import response_cache
+from . import rate_limiter
+from . import http_metrics
+from . import capabilities
 
 _TIMEOUT = 120 # per MLflow client
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Throttled requests are retried honoring Retry-After or else with jittered exponential backoff.
+# A 503 may be returned after the server applied a write, so it is only retried for reads.
+_RETRY_STATUS_CODES = { 429, 503 }
+_MUTATOR_RETRY_STATUS_CODES = { 429 }
+_READ_ONLY_POST_SUFFIXES = ( "/search", )
+_MAX_RETRIES = int(os.environ.get("MLFLOW_REPORTS_MAX_RETRIES", 5))
+_BACKOFF_SECONDS = 1.0
+_MAX_BACKOFF_SECONDS = 60.0
 
 _debug = os.environ.get("DEBUG")
 
@@ -77,28 +97,38 @@ class HttpClient(BaseHttpClient):
     """
     def __init__(self, api_name, host=None, token=None):
         """
+        Host and token are resolved on first use so that creating a client is cheap.
         :param api_name: Name of base API such as 'api/2.0' or 'api/2.0/mlflow'.
         :param host: Host name of tracking server such as 'http://localhost:5000' or 'databricks://my_profile'.
         :param token: Databricks token if using Databricks.
         """
-        if host:
-            # Assume 'host' is a Databricks profile
-            if not host.startswith("http"):
-                profile = host.replace("databricks://","")
-                (host, token) = databricks_cli_utils.get_host_token_for_profile(profile)
-        else:
-            (host, token) = mlflow_auth_utils.get_mlflow_host_token()
+        self.api_name = api_name
+        self._host_token_args = (host, token)
+        self._resolved = None
+
+    @property
+    def host(self):
+        return self._resolve()[0]
 
-        if not host:
-            raise MlflowReportsException(message="MLflow tracking URI (MLFLOW_TRACKING_URI environment variable) is not configured correctly")
-        self.api_uri = os.path.join(host, api_name)
-        self.token = token
+    @property
+    def api_uri(self):
+        return self._resolve()[1]
+
+    @property
+    def token(self):
+        return self._resolve()[2]
+
+    def _resolve(self):
+        if self._resolved is None:
+            (host, token) = resolve_host_token(*self._host_token_args)
+            self._resolved = (host, os.path.join(host, self.api_name), token)
+        return self._resolved
 
 
     def _get(self, resource, params=None):
         uri = self._mk_uri(resource)
         if _debug: print(f">> HttpClient: GET URI: {uri} PARAMS: {params}")
-        rsp = requests.get(uri, headers=self._mk_headers(), json=params, timeout=_TIMEOUT)
+        rsp = self._request("GET", uri, json=params)
         return self._check_response(rsp, params)
 
     def get(self, resource, params=None):
@@ -106,52 +136,88 @@ class HttpClient(BaseHttpClient):
         :param resource: Relative path name of resource such as experiments/search
         :param params: Dict of query parameters
         """
-        return json.loads(self._get(resource, params).text)
+        cache = response_cache.get_cache()
+        if not cache:
+            return json_codec.loads(self._get(resource, params).content)
+        key = cache.mk_key(self.api_uri, self.token, resource, params)
+        text = cache.get(key, resource)
+        if text is None:
+            rsp = self._get(resource, params)
+            cache.put(key, resource, rsp.text)
+            return json_codec.loads(rsp.content)
+        return json_codec.loads(text)
 
 
     def _post(self, resource, data=None):
-        return self._mutator(requests.post, resource, data)
+        return self._mutator("POST", resource, data)
 
     def post(self, resource, data=None):
         """ Executes an HTTP POST call
         :param resource: Relative path name of resource such as runs/search
         :param data: Request payload as dict
         """
-        return json.loads(self._post(resource, self._json_dumps(data)).text)
+        return json_codec.loads(self._post(resource, self._json_dumps(data)).content)
 
 
     def _put(self, resource, data=None):
-        return self._mutator(requests.put, resource, data)
+        return self._mutator("PUT", resource, data)
 
     def put(self, resource, data=None):
         """ Executes an HTTP PUT call
         :param resource: Relative path name of resource
         :param data: Request payload as dict
         """
-        return json.loads(self._put(resource, self._json_dumps(data)).text)
+        return json_codec.loads(self._put(resource, self._json_dumps(data)).content)
 
 
     def _patch(self, resource, data=None):
-        return self._mutator(requests.patch, resource, data)
+        return self._mutator("PATCH", resource, data)
 
     def patch(self, resource, data=None):
         """ Executes an HTTP PATCH call
         :param resource: Relative path name of resource
         :param data: Request payload as dict
         """
-        return json.loads(self._patch(resource, self._json_dumps(data)).text)
+        return json_codec.loads(self._patch(resource, self._json_dumps(data)).content)
 
 
     def _delete(self, resource):
         uri = self._mk_uri(resource)
-        rsp = requests.delete(uri, headers=self._mk_headers(), timeout=_TIMEOUT)
+        rsp = self._request("DELETE", uri)
         return self._check_response(rsp)
 
     def delete(self, resource):
         """ Executes an HTTP POST call
         :param resource: Relative path name of resource such as runs/search
         """
-        return json.loads(self._delete(resource).text)
+        return json_codec.loads(self._delete(resource).content)
+
+
+    def stream(self, method, resource, params=None, chunk_size=_STREAM_CHUNK_SIZE):
+        """ Executes an HTTP call and yields the response body as chunks of bytes as they arrive from the socket
+        instead of reading the whole body into memory.
+        :param method: GET or POST
+        :param resource: Relative path name of resource such as runs/search
+        :param params: Dict of query parameters (GET) or request payload (POST)
+        :param chunk_size: Maximum number of bytes per chunk
+        """
+        uri = self._mk_uri(resource)
+        if _debug: print(f">> HttpClient: {method} stream URI: {uri} PARAMS: {params}")
+        method = method.upper()
+        if method == "GET":
+            rsp, start = self._send("GET", uri, json=params, stream=True)
+        else:
+            rsp, start = self._send(method, uri, data=self._json_dumps(params), stream=True)
+        num_bytes = 0
+        try:
+            with rsp:
+                self._check_response(rsp, params)
+                for chunk in rsp.iter_content(chunk_size):
+                    num_bytes += len(chunk)
+                    yield chunk
+        finally:
+            # NOTE: recorded once the body is read since Content-Length is absent for chunked responses
+            http_metrics.record(method, resource, rsp.status_code, time.perf_counter()-start, num_bytes)
 
 
     def get_api_uri(self):
@@ -164,11 +230,47 @@ class HttpClient(BaseHttpClient):
     def _mutator(self, method, resource, data=None):
         uri = self._mk_uri(resource)
         if _debug: print(f">> HttpClient: {method} URI: {uri} DATA: {data}")
-        rsp = method(uri, headers=self._mk_headers(), data=data, timeout=_TIMEOUT)
+        rsp = self._request(method, uri, data=data)
         return self._check_response(rsp)
 
+    def _request(self, method, uri, **kwargs):
+        """
+        Sends a request with _send() and records the metrics of its response.
+        """
+        rsp, start = self._send(method, uri, **kwargs)
+        http_metrics.record(method, self._mk_resource(uri), rsp.status_code, time.perf_counter()-start, len(rsp.content))
+        return rsp
+
+    def _send(self, method, uri, **kwargs):
+        """
+        Sends a request after acquiring a token from the host's rate limiter.
+        Throttled requests pause the host's limiter and are retried - see _is_retryable().
+        Records the metrics of failed and retried attempts. The caller records the metrics of the returned response.
+        :return: Tuple of (response, perf_counter() at the start of its attempt)
+        """
+        bucket = rate_limiter.get_bucket(self.host)
+        resource = self._mk_resource(uri)
+        for attempt in range(0, _MAX_RETRIES+1):
+            bucket.acquire()
+            start = time.perf_counter()
+            try:
+                rsp = self._get_session().request(method, uri, headers=self._mk_headers(), timeout=_TIMEOUT, **kwargs)
+            except requests.exceptions.RequestException as e:
+                http_metrics.record(method, resource, type(e).__name__, time.perf_counter()-start)
+                raise
+            if not _is_retryable(method, resource, rsp.status_code) or attempt == _MAX_RETRIES:
+                return rsp, start
+            http_metrics.record(method, resource, rsp.status_code, time.perf_counter()-start, len(rsp.content))
+            rsp.close()
+            delay = _get_retry_delay(rsp, attempt)
+            print(f"WARNING: HTTP {rsp.status_code} for {method} {uri}. Retrying in {round(delay,2)} seconds (retry {attempt+1} of {_MAX_RETRIES}).")
+            bucket.pause(delay)
+
+    def _get_session(self):
+        return http_session.get_session(self.host)
+
     def _json_dumps(self, data):
-        return json.dumps(data) if data else None
+        return json_codec.dumps(data) if data else None
 
     def _mk_headers(self):
         headers = { "User-Agent": USER_AGENT, "Content-Type": "application/json" }
@@ -179,6 +281,9 @@ class HttpClient(BaseHttpClient):
     def _mk_uri(self, resource):
         return f"{self.api_uri}/{resource}"
 
+    def _mk_resource(self, uri):
+        return uri[len(self.api_uri)+1:]
+
     def _get_response_text(self, rsp):
         try:
             return rsp.json()
@@ -251,6 +356,10 @@ class UnityCatalogHttpClient(BaseHttpClient):
     def _delete(self, resource, data=None):
         return self._get_client(resource).delete(resource, data)
 
+
+    def stream(self, method, resource, params=None, chunk_size=_STREAM_CHUNK_SIZE):
+        return self._get_client(resource).stream(method, resource, params, chunk_size)
+
     def get_api_uri(self):
         return self._mlflow_client.get_api_uri()
 
@@ -262,24 +371,98 @@ class UnityCatalogHttpClient(BaseHttpClient):
         return str(msg)
 
 
+_profile_host_tokens = {}
+
+def resolve_host_token(host=None, token=None):
+    """
+    Resolves host and token from a Databricks profile or else from the MLflow tracking URI.
+    Credentials are looked up once per profile or tracking URI.
+    """
+    if host:
+        # Assume 'host' is a Databricks profile
+        if not host.startswith("http"):
+            profile = host.replace("databricks://","")
+            if profile not in _profile_host_tokens:
+                _profile_host_tokens[profile] = databricks_cli_utils.get_host_token_for_profile(profile)
+            (host, token) = _profile_host_tokens[profile]
+    else:
+        (host, token) = mlflow_auth_utils.get_mlflow_host_token()
+
+    if not host:
+        raise MlflowReportsException(message="MLflow tracking URI (MLFLOW_TRACKING_URI environment variable) is not configured correctly")
+    return host, token
+
+
+def _is_retryable(method, resource, status_code):
+    """
+    HTTP 429 is retried for all methods since the request was rejected before being applied.
+    HTTP 503 is only retried for GET and read-only search POSTs such as 'runs/search'
+    so that a write applied before the 503 is not duplicated.
+    """
+    if method.upper() == "GET" or (method.upper() == "POST" and resource.split("?")[0].endswith(_READ_ONLY_POST_SUFFIXES)):
+        return status_code in _RETRY_STATUS_CODES
+    return status_code in _MUTATOR_RETRY_STATUS_CODES
+
+
+def _get_retry_delay(rsp, attempt):
+    """
+    Returns seconds to wait from the Retry-After header (seconds or HTTP date),
+    or else exponential backoff with jitter.
+    """
+    retry_after = rsp.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            try:
+                return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+            except (TypeError, ValueError):
+                pass
+    backoff = min(_BACKOFF_SECONDS * 2**attempt, _MAX_BACKOFF_SECONDS)
+    return backoff/2 + random.uniform(0, backoff/2)
+
+
 dbx_20_client = HttpClient("api/2.0")
 dbx_21_client = HttpClient("api/2.1")
 mlflow_client = HttpClient("api/2.0/mlflow")
 uc_mlflow_client = UnityCatalogHttpClient()
 
+_UC_REGISTRY_URI = "databricks-uc"
+
 def get_mlflow_client():
     """
-    Returns either a UC-enabled client or not, depending if MLFLOW_REGISTRY_URI is set to 'databricks-uc://e2_demo'
+    Returns either a UC-enabled client or not, depending if MLFLOW_REGISTRY_URI is set to 'databricks-uc://e2_demo'.
+    An explicit MLFLOW_REGISTRY_URI is always honored. Otherwise, when the registry URI is UC only by default,
+    the workspace registry is used if the Databricks workspace has no Unity Catalog.
     """
-    return uc_mlflow_client if is_unity_catalog() else mlflow_client
+    if not is_unity_catalog():
+        return mlflow_client
+    if _is_uc_registry_env_var():
+        return uc_mlflow_client
+    caps = capabilities.get_capabilities()
+    if caps.is_databricks and not caps.has_unity_catalog:
+        print(f"WARNING: Unity Catalog model registry is not available for '{caps.host}'. Using workspace model registry.")
+        return mlflow_client
+    return uc_mlflow_client
 
 
 def is_unity_catalog():
-    UC_VALUE = "databricks-uc"
+    """
+    Only checks the configuration - never calls the tracking server.
+    """
+    if _is_uc_registry_env_var():
+        return True
+    # Avoid importing mlflow (slow) when the registry URI cannot be UC
+    if "mlflow" not in sys.modules and not mlflow_auth_utils.get_tracking_uri().startswith("databricks"):
+        return False
     import mlflow
-    env_var = os.environ.get("MLFLOW_REGISTRY_URI")
     api_val = mlflow.get_registry_uri()
-    return (env_var and env_var.startswith(UC_VALUE)) or (api_val and api_val.startswith(UC_VALUE))
+    return api_val and api_val.startswith(_UC_REGISTRY_URI)
+
+
+def _is_uc_registry_env_var():
+    env_var = os.environ.get("MLFLOW_REGISTRY_URI")
+    return bool(env_var and env_var.startswith(_UC_REGISTRY_URI))
 
 
 @click.command()
@@ -354,6 +537,9 @@ def main(api, resource, method, params, data, output_file):
         _write_output(rsp, output_file)
     else:
         print(f"ERROR: Unsupported HTTP method '{method}'")
+    if _debug:
+        print("Connection stats:", http_session.get_stats())
+        print("Rate limiter stats:", rate_limiter.get_stats())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,128 @@
+"""
+Per-endpoint metrics for all HTTP requests: count, latency percentiles, bytes received and status codes.
+Requests are grouped by HTTP method and resource template such as 'GET runs/get' or 'GET serving-endpoints/{name}'.
+
+The summary can be written as JSON when the process exits with the '--metrics-file' CLI option,
+the MLFLOW_REPORTS_METRICS_FILE environment variable or write_at_exit().
+"""
+
+import os
+import re
+import json
+import math
+import atexit
+import threading
+from array import array
+
+_RESOURCE_TEMPLATES = [
+    (re.compile(r"^serving-endpoints/[^/]+"), "serving-endpoints/{name}"),
+    (re.compile(r"^permissions/(experiments|registered-models)/[^/]+"), r"permissions/\1/{id}"),
+    (re.compile(r"^unity-catalog/(permissions|effective-permissions)/function/[^/]+"), r"unity-catalog/\1/function/{name}"),
+    (re.compile(r"^unity-catalog/tables/[^/]+"), "unity-catalog/tables/{name}"),
+]
+
+_endpoints = {}
+_lock = threading.Lock()
+_metrics_files = set()
+
+
+class EndpointMetrics:
+    def __init__(self):
+        self.count = 0
+        self.num_bytes = 0
+        self.status_codes = {}
+        self.latencies = array("d")
+
+    def record(self, status_code, seconds, num_bytes):
+        self.count += 1
+        self.num_bytes += num_bytes
+        self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+        self.latencies.append(seconds)
+
+    def summary(self):
+        latencies = sorted(self.latencies)
+        return {
+            "count": self.count,
+            "num_bytes": self.num_bytes,
+            "status_codes": { str(k):v for k,v in sorted(self.status_codes.items(), key=lambda x: str(x[0])) },
+            "latency": {
+                "p50": _percentile(latencies, 50),
+                "p95": _percentile(latencies, 95),
+                "p99": _percentile(latencies, 99),
+                "max": round(latencies[-1], 4) if latencies else 0.0,
+                "total": round(sum(latencies), 3)
+            }
+        }
+
+
+def to_template(resource):
+    """
+    Replaces object names and IDs in a resource path with placeholders.
+    """
+    for pattern, template in _RESOURCE_TEMPLATES:
+        if pattern.match(resource):
+            return pattern.sub(template, resource, count=1)
+    return resource
+
+
+def record(method, resource, status_code, seconds, num_bytes=0):
+    """
+    Records one request.
+    :param status_code: HTTP status code or the exception type name if no response was received.
+    """
+    key = f"{method} {to_template(resource)}"
+    with _lock:
+        metrics = _endpoints.get(key)
+        if metrics is None:
+            metrics = EndpointMetrics()
+            _endpoints[key] = metrics
+        metrics.record(status_code, seconds, num_bytes)
+
+
+def get_summary():
+    """
+    Returns metrics per endpoint sorted by total latency (descending) plus totals.
+    """
+    with _lock:
+        endpoints = { k: v.summary() for k,v in _endpoints.items() }
+    endpoints = dict(sorted(endpoints.items(), key=lambda x: x[1]["latency"]["total"], reverse=True))
+    totals = {
+        "count": sum(v["count"] for v in endpoints.values()),
+        "num_bytes": sum(v["num_bytes"] for v in endpoints.values()),
+        "latency_total": round(sum(v["latency"]["total"] for v in endpoints.values()), 3)
+    }
+    return { "totals": totals, "endpoints": endpoints }
+
+
+def reset():
+    with _lock:
+        _endpoints.clear()
+
+
+def write(path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(get_summary(), f, indent=2)
+
+
+def write_at_exit(path):
+    """
+    Writes the metrics summary to 'path' when the process exits.
+    """
+    if path and path not in _metrics_files:
+        _metrics_files.add(path)
+        atexit.register(_write_at_exit, path)
+
+
+def _write_at_exit(path):
+    write(path)
+    print(f"Metrics file: {path}")
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    idx = max(math.ceil(pct/100 * len(sorted_values)) - 1, 0)
+    return round(sorted_values[idx], 4)
+
+
+write_at_exit(os.environ.get("MLFLOW_REPORTS_METRICS_FILE"))
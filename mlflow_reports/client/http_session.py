@@ -0,0 +1,114 @@
+"""
+Shared connection-pooled HTTP sessions - one keep-alive session per host.
+All HttpClient instances that point to the same host (e.g. 'api/2.0', 'api/2.1'
+and 'api/2.0/mlflow') share the same session and therefore the same TCP/TLS connections.
+
+Pool size can be set with the MLFLOW_REPORTS_HTTP_POOL_SIZE environment variable or with set_pool_size().
+"""
+
+import os
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+_DEFAULT_POOL_SIZE = 32
+
+_pool_size = int(os.environ.get("MLFLOW_REPORTS_HTTP_POOL_SIZE", _DEFAULT_POOL_SIZE))
+_sessions = {}
+_lock = threading.Lock()
+
+
+def get_session(host):
+    """
+    Returns the shared session for a host, creating it on first use.
+    :param host: Host such as 'https://my.cloud.databricks.com' or 'http://localhost:5000'.
+    """
+    session = _sessions.get(host)
+    if session is None:
+        with _lock:
+            session = _sessions.get(host)
+            if session is None:
+                session = _mk_session(_pool_size)
+                _sessions[host] = session
+    return session
+
+
+def get_pool_size():
+    return _pool_size
+
+
+def set_pool_size(pool_size):
+    """
+    Sets the maximum number of pooled connections per host.
+    Existing sessions are closed and will be recreated with the new pool size on next use.
+    """
+    global _pool_size
+    with _lock:
+        _pool_size = pool_size
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def ensure_pool_size(pool_size):
+    """
+    Grows the per-host pool size so that 'pool_size' concurrent requests do not discard connections.
+    Existing sessions are kept since other threads may still be using them - a larger adapter is mounted
+    on them and the old adapter is closed. Connections in use by the old adapter are closed when released.
+    """
+    global _pool_size
+    if pool_size <= _pool_size:
+        return
+    with _lock:
+        if pool_size > _pool_size:
+            _pool_size = pool_size
+            for session in _sessions.values():
+                _mount_adapter(session, pool_size)
+
+
+def close_sessions():
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def get_stats():
+    """
+    Returns connection reuse statistics per host.
+    'num_connections' is the number of new connections opened, 'num_requests' the number of requests sent
+    and 'num_reused' the number of requests that reused an already open keep-alive connection.
+    """
+    stats = {}
+    for host, session in list(_sessions.items()):
+        num_requests, num_connections = (0, 0)
+        adapter = session.get_adapter(host)
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                num_requests += pool.num_requests
+                num_connections += pool.num_connections
+        stats[host] = {
+            "pool_size": _pool_size,
+            "num_requests": num_requests,
+            "num_connections": num_connections,
+            "num_reused": max(num_requests - num_connections, 0)
+        }
+    return stats
+
+
+def _mk_session(pool_size):
+    session = requests.Session()
+    _mount_adapter(session, pool_size)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+def _mount_adapter(session, pool_size):
+    old_adapters = { id(adapter): adapter for adapter in session.adapters.values() }
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    for old_adapter in old_adapters.values():
+        old_adapter.close()
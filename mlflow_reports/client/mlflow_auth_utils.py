@@ -1,6 +1,10 @@
+import os
+import sys
 from mlflow_reports.client import databricks_cli_utils
 from mlflow_reports.common import MlflowReportsException
 
+_host_tokens = {} # tracking URI -> (host, token)
+
 
 def get_mlflow_host():
     """ Returns the MLflow tracking URI (host) """
@@ -11,10 +15,32 @@ def get_mlflow_host_token():
     """
     Returns the MLflow tracking URI (host) and Databricks personal access token (PAT).
     For Databricks, expects the MLflow tracking URI in the form of 'databricks' or 'databricks://MY_PROFILE'.
+    Credentials are looked up once per tracking URI.
     """
 
+    uri = get_tracking_uri()
+    host_token = _host_tokens.get(uri)
+    if host_token is None:
+        host_token = _get_mlflow_host_token(uri)
+        if host_token[0]:
+            _host_tokens[uri] = host_token
+    return host_token
+
+
+def get_tracking_uri():
+    """
+    Returns the MLflow tracking URI. If mlflow has not been imported yet and MLFLOW_TRACKING_URI is set,
+    returns the environment variable without importing mlflow (which is slow).
+    """
+    if "mlflow" not in sys.modules:
+        uri = os.environ.get("MLFLOW_TRACKING_URI")
+        if uri:
+            return uri
     import mlflow
-    uri = mlflow.tracking.get_tracking_uri()
+    return mlflow.get_tracking_uri()
+
+
+def _get_mlflow_host_token(uri):
     if uri:
         if not uri.startswith("databricks"):
             if not uri.startswith("http"):
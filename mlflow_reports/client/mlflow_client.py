@@ -1,6 +1,8 @@
-from typing import Optional, Dict, List
+import os
+from typing import Optional, Dict, List, Iterator, Tuple
 
 from . http_client import get_mlflow_client
+from mlflow_reports.common import concurrency_utils
 from mlflow_reports.common.http_iterators import (
     SearchRegisteredModelsIterator,
     SearchModelVersionsIterator,
@@ -8,35 +10,68 @@ from mlflow_reports.common.http_iterators import (
     SearchRunsIterator
 )
 
+# Default number of concurrent calls for the batch get_*() methods
+_BATCH_MAX_WORKERS = int(os.environ.get("MLFLOW_REPORTS_BATCH_MAX_WORKERS", 8))
+
 
 class MlflowClient:
 
     def __init__(self):
-        self.client = get_mlflow_client()
+        self._client = None
+
+    @property
+    def client(self):
+        """
+        Resolved on first use so that importing does not probe the tracking server.
+        """
+        if self._client is None:
+            self._client = get_mlflow_client()
+        return self._client
 
 
     # Registered models
 
     def get_registered_model(self, model_name: str) -> Dict:
         return self.client.get("registered-models/get", {"name": model_name} )
+
+    def get_registered_models(self, model_names: List[str], max_workers: int=_BATCH_MAX_WORKERS, progress_title: Optional[str]=None) -> List[Tuple]:
+        """
+        Gets registered models concurrently.
+        :return: List of (response, exception) tuples in the same order as 'model_names'.
+        """
+        return concurrency_utils.map_ordered(self.get_registered_model, model_names, max_workers, progress_title=progress_title)
     
     def search_registered_models(self, filter: Optional[str]=None) -> List:
         return list(SearchRegisteredModelsIterator(self.client, filter=filter))
+
+    def iter_registered_models(self, filter: Optional[str]=None, prefetch: int=1, stream_pages: bool=False) -> Iterator[Dict]:
+        return _iter(SearchRegisteredModelsIterator(self.client, filter=filter), prefetch, stream_pages)
     
 
     # Model versions
 
     def get_model_version(self, model_name: str, version: str) -> Dict:
         return self.client.get("model-versions/get", {"name": model_name, "version": version} )
+
+    def get_model_versions(self, pairs: List[Tuple[str, str]], max_workers: int=_BATCH_MAX_WORKERS, progress_title: Optional[str]=None) -> List[Tuple]:
+        """
+        Gets model versions concurrently.
+        :param pairs: List of (model_name, version) tuples.
+        :return: List of (response, exception) tuples in the same order as 'pairs'.
+        """
+        return concurrency_utils.map_ordered(lambda pair: self.get_model_version(*pair), pairs, max_workers, progress_title=progress_title)
     
     def search_model_versions(self, filter: Optional[str]=None) -> List:
         return list(SearchModelVersionsIterator(self.client, filter=filter))
+
+    def iter_model_versions(self, filter: Optional[str]=None, prefetch: int=1, stream_pages: bool=False) -> Iterator[Dict]:
+        return _iter(SearchModelVersionsIterator(self.client, filter=filter), prefetch, stream_pages)
     
     def get_model_version_download_uri(self, model_name: str, version: str) -> Dict:
         return self.client.get("model-versions/get-download-uri", {"name": model_name, "version": version} )
 
-    def get_latest_versions(self, model_name: str, version: str) -> List:
-        return self.client.get("registered-models/get-latest-versions", {"name": model_name, "version": version} )
+    def get_latest_versions(self, model_name: str, stage: str) -> List:
+        return self.client.get("registered-models/get-latest-versions", {"name": model_name, "stages": [ stage ]} )
     
     def get_transition_requests(self, model_name: str, version: str) -> List:
         return self.client.get("transition-requests/list", {"name": model_name, "version": version} )
@@ -52,6 +87,9 @@ class MlflowClient:
     
     def search_experiments(self, filter: Optional[str]=None, view_type: Optional[str]=None, max_results: Optional[str]=None) -> List:
         return list(SearchExperimentsIterator(self.client, filter=filter, view_type=view_type, max_results=max_results))
+
+    def iter_experiments(self, filter: Optional[str]=None, view_type: Optional[str]=None, max_results: Optional[str]=None, prefetch: int=1, stream_pages: bool=False) -> Iterator[Dict]:
+        return _iter(SearchExperimentsIterator(self.client, filter=filter, view_type=view_type, max_results=max_results), prefetch, stream_pages)
     
 
     # Runs
@@ -61,13 +99,23 @@ class MlflowClient:
     
     def search_runs(self, experiment_ids: List[str]) -> List:
         return list(SearchRunsIterator(self.client, experiment_ids))
+
+    def iter_runs(self, experiment_ids: List[str], prefetch: int=1, stream_pages: bool=False) -> Iterator[Dict]:
+        return _iter(SearchRunsIterator(self.client, experiment_ids), prefetch, stream_pages)
     
     def list_artifacts(self, run_id: str, path: Optional[str]=None) -> List:
         return self.client.get("artifacts/list", {"run_id": run_id, "path": path })
 
     
     def __repr__(self): 
-        return self.client
+        return str(self.client)
+
+
+def _iter(iterator, prefetch, stream_pages):
+    """
+    :param stream_pages: Parse each page incrementally so memory is bounded by object size - else prefetch 'prefetch' pages.
+    """
+    return iter(iterator.with_streaming() if stream_pages else iterator.with_prefetch(prefetch))
 
 
 client = MlflowClient()
@@ -0,0 +1,156 @@
+"""
+Shared per-host token-bucket rate limiter used by all HttpClient requests.
+This is the one place where request concurrency is throttled - thread pools simply fan out
+and every request waits here for a token.
+
+When a host throttles a request (HTTP 429 or 503) the bucket is paused so that all threads
+calling that host back off together.
+
+The rate (requests per second) can be set with the MLFLOW_REPORTS_RATE_LIMIT environment variable
+or with set_rate(). The burst size defaults to the rate and can be set with MLFLOW_REPORTS_RATE_LIMIT_BURST.
+A rate of 0 (the default) means no rate limit - requests still honor pauses.
+"""
+
+import os
+import time
+import threading
+
+_rate = float(os.environ.get("MLFLOW_REPORTS_RATE_LIMIT", 0))
+_burst = float(os.environ.get("MLFLOW_REPORTS_RATE_LIMIT_BURST", 0))
+_buckets = {}
+_lock = threading.Lock()
+
+
+class TokenBucket:
+    def __init__(self, rate=0, burst=0):
+        """
+        :param rate: Requests per second. If 0, only pauses are enforced.
+        :param burst: Maximum number of tokens. Defaults to 'rate' (at least 1).
+        """
+        self.rate = rate
+        self.capacity = burst or max(rate, 1)
+        self.tokens = self.capacity
+        self.num_acquired = 0
+        self.num_waits = 0
+        self.num_pauses = 0
+        self.wait_seconds = 0.0
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+
+    def acquire(self):
+        """
+        Blocks until a request may be sent.
+        """
+        waited = False
+        while True:
+            delay = self.try_acquire(waited)
+            if delay is None:
+                return
+            waited = True
+            time.sleep(delay)
+
+
+    async def acquire_async(self):
+        """
+        Same as acquire() but waits without blocking the event loop.
+        """
+        import asyncio # only needed by AsyncHttpClient - not loaded at CLI startup
+        waited = False
+        while True:
+            delay = self.try_acquire(waited)
+            if delay is None:
+                return
+            waited = True
+            await asyncio.sleep(delay)
+
+
+    def try_acquire(self, waited=False):
+        """
+        Takes a token if one is available.
+        :param waited: True if the caller already waited for this request, so it is not counted again in 'num_waits'.
+        :return: None if a token was taken, else seconds to wait before trying again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._resume_at:
+                delay = self._resume_at - now
+            elif not self.rate:
+                delay = None
+            else:
+                self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    delay = None
+                else:
+                    delay = (1 - self.tokens) / self.rate
+            if delay is None:
+                self.num_acquired += 1
+            else:
+                if not waited:
+                    self.num_waits += 1
+                self.wait_seconds += delay
+            return delay
+
+
+    def pause(self, seconds):
+        """
+        Pauses all callers of this bucket for 'seconds'.
+        """
+        with self._lock:
+            self.num_pauses += 1
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+    def get_stats(self):
+        return {
+            "rate": self.rate,
+            "burst": self.capacity,
+            "num_acquired": self.num_acquired,
+            "num_waits": self.num_waits,
+            "num_pauses": self.num_pauses,
+            "wait_seconds": round(self.wait_seconds, 3)
+        }
+
+
+def get_bucket(host):
+    """
+    Returns the shared token bucket for a host, creating it on first use.
+    """
+    bucket = _buckets.get(host)
+    if bucket is None:
+        with _lock:
+            bucket = _buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(_rate, _burst)
+                _buckets[host] = bucket
+    return bucket
+
+
+def get_rate():
+    return _rate
+
+
+def set_rate(rate, burst=0):
+    """
+    Sets the rate limit for all hosts. Existing buckets are replaced.
+    :param rate: Requests per second per host. If 0, there is no rate limit.
+    :param burst: Maximum burst size. Defaults to 'rate'.
+    """
+    global _rate, _burst
+    with _lock:
+        _rate, _burst = rate, burst
+        _buckets.clear()
+
+
+def get_num_pauses():
+    """
+    Returns the total number of throttling pauses for all hosts.
+    """
+    return sum(bucket.num_pauses for bucket in list(_buckets.values()))
+
+
+def get_stats():
+    return { host: bucket.get_stats() for host, bucket in list(_buckets.items()) }
@@ -0,0 +1,184 @@
+"""
+Response cache for HttpClient.get() calls keyed on API URI, resource and parameters.
+
+Two levels:
+  - In-memory LRU cache.
+  - Optional on-disk SQLite cache that persists across processes, e.g. repeated 'mlflow-model-report' runs.
+
+Each resource has a TTL in seconds - see _RESOURCE_TTLS. A TTL of 0 means the resource is never cached.
+Responses are cached as JSON text so each hit returns a new object that the caller can freely modify.
+
+The cache is disabled by default. Enable it with environment variables:
+  - MLFLOW_REPORTS_CACHE=true - in-memory cache
+  - MLFLOW_REPORTS_CACHE_FILE=/tmp/mlflow_reports_cache.db - in-memory and on-disk cache
+  - MLFLOW_REPORTS_CACHE_TTL=600 - default TTL
+or programmatically with configure().
+"""
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+
+_DEFAULT_TTL = 300
+_DEFAULT_MAX_ENTRIES = 1000
+
+# Longest matching resource prefix wins
+_RESOURCE_TTLS = {
+    "experiments/get": 3600,
+    "experiments/get-by-name": 3600,
+    "registered-models/get": 600,
+    "databricks/registered-models/get": 600,
+    "model-versions/get-download-uri": 3600,
+    "artifacts/list": 3600,
+    # Search results change and are paged - do not cache
+    "registered-models/search": 0,
+    "model-versions/search": 0,
+    "experiments/search": 0,
+    "runs/search": 0,
+    "feature-store/feature-tables/search": 0,
+    "workspace/get-status": 0,
+}
+
+
+class ResponseCache:
+    def __init__(self, cache_file=None, default_ttl=_DEFAULT_TTL, ttls=None, max_entries=_DEFAULT_MAX_ENTRIES):
+        """
+        :param cache_file: SQLite file for the on-disk cache. If None, only the in-memory cache is used.
+        :param default_ttl: TTL in seconds for resources not in 'ttls'.
+        :param ttls: Dict of resource prefix to TTL in seconds. Overrides the default per-resource TTLs.
+        :param max_entries: Maximum number of entries in the in-memory LRU cache.
+        """
+        self.cache_file = cache_file
+        self.default_ttl = default_ttl
+        self.ttls = { **_RESOURCE_TTLS, **(ttls or {}) }
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._db = None
+        if cache_file:
+            self._db = sqlite3.connect(cache_file, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires_at REAL, response TEXT)")
+            self._db.commit()
+
+
+    def get_ttl(self, resource):
+        matches = [ k for k in self.ttls if resource.startswith(k) ]
+        return self.ttls[max(matches, key=len)] if matches else self.default_ttl
+
+
+    def mk_key(self, api_uri, token, resource, params=None):
+        token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16] if token else ""
+        return f"{api_uri}/{resource}?{json.dumps(params, sort_keys=True)}#{token_hash}"
+
+
+    def get(self, key, resource):
+        """
+        :return: Cached response text or None if not cached or expired.
+        """
+        if self.get_ttl(resource) <= 0:
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                expires_at, response = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._count(resource, "hits")
+                    return response
+                del self._entries[key]
+            if self._db:
+                row = self._db.execute("SELECT expires_at, response FROM responses WHERE key = ?", (key,)).fetchone()
+                if row and row[0] > now:
+                    self._put_memory(key, row[0], row[1])
+                    self._count(resource, "disk_hits")
+                    return row[1]
+            self._count(resource, "misses")
+            return None
+
+
+    def put(self, key, resource, response):
+        ttl = self.get_ttl(resource)
+        if ttl <= 0:
+            return
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._put_memory(key, expires_at, response)
+            if self._db:
+                self._db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (key, expires_at, response))
+                self._db.commit()
+
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+            if self._db:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+
+    def get_stats(self):
+        """
+        Returns hit/miss counts per resource plus totals.
+        """
+        with self._lock:
+            stats = { k: dict(v) for k,v in self._stats.items() }
+        totals = { "hits": 0, "disk_hits": 0, "misses": 0 }
+        for v in stats.values():
+            for k in totals:
+                totals[k] += v.get(k, 0)
+        return { "totals": totals, "resources": stats, "num_memory_entries": len(self._entries) }
+
+
+    def close(self):
+        if self._db:
+            self._db.close()
+            self._db = None
+
+
+    def _put_memory(self, key, expires_at, response):
+        self._entries[key] = (expires_at, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _count(self, resource, counter):
+        stats = self._stats.setdefault(resource, { "hits": 0, "disk_hits": 0, "misses": 0 })
+        stats[counter] += 1
+
+
+_cache = None
+
+def _init_from_env():
+    cache_file = os.environ.get("MLFLOW_REPORTS_CACHE_FILE")
+    enabled = os.environ.get("MLFLOW_REPORTS_CACHE", "").lower() in ("true", "1", "yes")
+    if enabled or cache_file:
+        default_ttl = int(os.environ.get("MLFLOW_REPORTS_CACHE_TTL", _DEFAULT_TTL))
+        configure(cache_file=cache_file, default_ttl=default_ttl)
+
+
+def configure(enabled=True, cache_file=None, default_ttl=_DEFAULT_TTL, ttls=None, max_entries=_DEFAULT_MAX_ENTRIES):
+    """
+    Enables (or disables) the response cache used by all HttpClient instances.
+    """
+    global _cache
+    if _cache:
+        _cache.close()
+    _cache = ResponseCache(cache_file, default_ttl, ttls, max_entries) if enabled else None
+    return _cache
+
+
+def get_cache():
+    """
+    :return: The current ResponseCache or None if caching is disabled.
+    """
+    return _cache
+
+
+_init_from_env()
@@ -1,4 +1,5 @@
 import click
+from mlflow_reports.client import http_metrics
 
 
 def opt_model_uri(function):
@@ -87,6 +88,33 @@ def opt_get_latest_versions(function):
     )(function)
     return function
 
+def opt_enrich_versions(function):
+    function = click.option("--enrich-versions",
+        help="Enrich model versions with download URIs, transition requests, links and formatted timestamps.",
+        type=bool,
+        default=False,
+        show_default=True
+    )(function)
+    return function
+
+def opt_get_download_uri(function):
+    function = click.option("--get-download-uri",
+        help="When enriching model versions, call 'get-download-uri' for the registry download URI.",
+        type=bool,
+        default=True,
+        show_default=True
+    )(function)
+    return function
+
+def opt_get_transition_requests(function):
+    function = click.option("--get-transition-requests",
+        help="When enriching non-UC Databricks model versions, get their transition requests.",
+        type=bool,
+        default=True,
+        show_default=True
+    )(function)
+    return function
+
 def opt_get_runs(function):
     function = click.option("--get-runs",
         help="Get runs.",
@@ -167,6 +195,15 @@ def opt_table(function):
     )(function)
     return function
 
+def opt_max_workers(function):
+    function = click.option("--max-workers",
+        help="Maximum number of concurrent API calls.",
+        type=int,
+        default=1,
+        show_default=True
+    )(function)
+    return function
+
 def opt_get_details(function):
     function = click.option("--get-details",
         help="Get details of each listed object.",
@@ -174,3 +211,15 @@ def opt_get_details(function):
         default=False
     )(function)
     return function
+
+def opt_metrics_file(function):
+    def _write_metrics_at_exit(ctx, param, value):
+        http_metrics.write_at_exit(value)
+    function = click.option("--metrics-file",
+        help="Write per-endpoint API call metrics (count, latency, bytes, status codes) as JSON to this file at exit.",
+        type=str,
+        required=False,
+        expose_value=False,
+        callback=_write_metrics_at_exit
+    )(function)
+    return function
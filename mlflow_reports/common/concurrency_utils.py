@@ -0,0 +1,86 @@
+"""
+Bounded thread pool helpers for fanning out many independent API calls.
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from mlflow_reports.common import MlflowReportsException
+from mlflow_reports.client import http_session, rate_limiter
+
+
+def map_ordered(func, items, max_workers=1, exceptions=(MlflowReportsException,), progress_title=None):
+    """
+    Calls 'func' for each item using at most 'max_workers' threads.
+    Throttling and retries of throttled calls are handled per host by the HTTP client's rate limiter.
+    :param func: Function that takes one item.
+    :param items: List of items.
+    :param max_workers: Maximum number of concurrent calls. If 1 or less, calls are made sequentially.
+    :param exceptions: Exception types that are captured per item. Other exceptions are raised.
+    :param progress_title: If set, print progress and a throughput report with this title.
+    :return: List of (result, exception) tuples in the same order as 'items'.
+             For a failed item, result is None and exception is set.
+    """
+    num_pauses = rate_limiter.get_num_pauses()
+    progress = Progress(progress_title, len(items)) if progress_title else None
+
+    def _call(item):
+        try:
+            res = func(item), None
+        except exceptions as e:
+            res = None, e
+        if progress:
+            progress.update(res[1] is not None)
+        return res
+
+    if not max_workers or max_workers <= 1 or len(items) <= 1:
+        results = [ _call(item) for item in items ]
+    else:
+        max_workers = min(max_workers, len(items))
+        http_session.ensure_pool_size(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_call, items))
+    if progress:
+        progress.print_report(max_workers, rate_limiter.get_num_pauses() - num_pauses)
+    return results
+
+
+class Progress:
+    """
+    Thread-safe progress counter that prints about every 10% and reports throughput at the end.
+    """
+    def __init__(self, title, total):
+        self.title = title
+        self.total = total
+        self.num_done = 0
+        self.num_failed = 0
+        self.start = time.time()
+        self._every = max(total // 10, 1)
+        self._lock = threading.Lock()
+
+    def update(self, failed=False):
+        with self._lock:
+            self.num_done += 1
+            if failed:
+                self.num_failed += 1
+            if self.num_done % self._every == 0 and self.num_done < self.total:
+                print(f"{self.title}: {self.num_done}/{self.total} ({self.throughput():.1f}/sec)")
+
+    def throughput(self):
+        duration = time.time() - self.start
+        return self.num_done / duration if duration > 0 else 0.0
+
+    def report(self, max_workers=1, num_rate_limit_pauses=0):
+        return {
+            "title": self.title,
+            "num_items": self.total,
+            "num_failed": self.num_failed,
+            "max_workers": max_workers,
+            "num_rate_limit_pauses": num_rate_limit_pauses,
+            "duration": round(time.time() - self.start, 3),
+            "items_per_second": round(self.throughput(), 2)
+        }
+
+    def print_report(self, max_workers=1, num_rate_limit_pauses=0):
+        print(f"{self.title} report: {self.report(max_workers, num_rate_limit_pauses)}")
+
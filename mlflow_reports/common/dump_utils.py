@@ -1,15 +1,24 @@
-import json
+from mlflow_reports.common import json_codec
 
 
 def obj_to_dict(obj):
     """ Recursively convert an object to a dict. """
-    return json.loads(
-        json.dumps(obj, default=lambda o: getattr(o, '__dict__', str(o)))
+    return json_codec.loads(
+        json_codec.dumps(obj, default=lambda o: getattr(o, '__dict__', str(o)))
     )   
 
 
 def dict_to_json(dct, sort_keys=None, indent=2):
-    return json.dumps(dct, sort_keys=sort_keys, indent=indent)
+    return json_codec.dumps(dct, sort_keys=sort_keys, indent=indent)
+
+
+def json_to_dict(text):
+    """ Parses a JSON object such as an exception message. Non-JSON text is returned as {"message": text}. """
+    try:
+        dct = json_codec.loads(text)
+        return dct if isinstance(dct, dict) else { "message": text }
+    except ValueError:
+        return { "message": text }
 
 
 def dump_as_json(dct, title=None, sort_keys=None, indent=2):
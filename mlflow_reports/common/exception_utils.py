@@ -1,12 +1,22 @@
-from mlflow.exceptions import RestException, MlflowException
+import sys
 from mlflow_reports.common import MlflowReportsException
 
+
+def _get_mlflow_exceptions():
+    """
+    Returns the mlflow.exceptions module if mlflow is loaded - otherwise an exception cannot be an MlflowException.
+    Avoids importing mlflow (slow) just for isinstance checks.
+    """
+    return sys.modules.get("mlflow.exceptions")
+
+
 def to_dict(e, msg, error_category="error"):
+    mlflow_exceptions = _get_mlflow_exceptions()
     if isinstance(e, MlflowReportsException):
         return to_MlflowReportsException(e, msg, error_category)
-    elif isinstance(e, MlflowException):
+    elif mlflow_exceptions and isinstance(e, mlflow_exceptions.MlflowException):
         return to_MlflowException_dict(e, msg, error_category)
-    elif isinstance(e, RestException):
+    elif mlflow_exceptions and isinstance(e, mlflow_exceptions.RestException):
         return to_RestException_dict(e, msg, error_category)
     else:
         return to_Exception_dict(e, msg, error_category)
@@ -60,7 +70,8 @@ def mk_msg_RestException(e):
 
 
 def dump_exception(ex, msg=""):
-    if issubclass(ex.__class__,MlflowException):
+    mlflow_exceptions = _get_mlflow_exceptions()
+    if mlflow_exceptions and issubclass(ex.__class__, mlflow_exceptions.MlflowException):
         _dump_MlflowException(ex, msg)
     else:
         _dump_exception(ex, msg)
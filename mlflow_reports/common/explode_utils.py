@@ -1,8 +1,9 @@
 """
-Recursively walk a dict or list and explode JSON string values and the idiosyncratic 'sparkDatasourceInfo' value.
+Walk a dict or list and explode JSON string values and the idiosyncratic 'sparkDatasourceInfo' value.
 """
 
 import json
+from mlflow_reports.common import json_codec
 
 TAG_sparkDatasourceInfo = "sparkDatasourceInfo"
 
@@ -26,39 +27,66 @@ def parse_sparkDatasourceInfo_tag(spec):
     return [ parse_datasource(tok) for tok in toks ]
 
 
+# Only JSON objects and arrays are exploded - scalar-looking strings such as '245' or 'true' stay strings
+_JSON_CLOSERS = { "{": "}", "[": "]" }
+_WHITESPACE = " \t\r\n"
+
+
+def _is_plausible_json(v):
+    """
+    Cheap check that a string may be a JSON object or array: matching first and last non-blank characters.
+    """
+    if len(v) < 2:
+        return False
+    if v[0] in _WHITESPACE or v[-1] in _WHITESPACE:
+        v = v.strip(_WHITESPACE)
+        if len(v) < 2:
+            return False
+    return _JSON_CLOSERS.get(v[0]) == v[-1]
+
+
 def _explode_string(v):
+    """
+    :return: The parsed dict or list, or else the string itself.
+    """
+    if not _is_plausible_json(v):
+        return v
     try:
-        v2 = json.loads(v)
-        if isinstance(v2,dict) or isinstance(v2,list):
-            explode_json(v2)
-        return v2
-    except json.decoder.JSONDecodeError: # not a JSON value 
+        return json_codec.loads(v)
+    except ValueError: # rare: looks like JSON but is not, e.g. '[INFO]'
         return v
 
 
-def _explode_json_dict(dct):
-    if dct.keys() == {"key", "value"} and dct.get("key") == TAG_sparkDatasourceInfo:
-        dct["value"] = parse_sparkDatasourceInfo_tag(dct["value"])
-    else:
-        for k,v in dct.items():
-            if isinstance(v,dict) or isinstance(v,list):
-                explode_json(v)
-            elif isinstance(v,str):
-                if k == TAG_sparkDatasourceInfo:
-                    dct[k] = parse_sparkDatasourceInfo_tag(v)
-                else:
-                    dct[k] = _explode_string(v)
-
-
-def explode_json(obj):
+def explode_json(obj, keys=None):
     """
-    Recursively walks a dict or list and explodes JSON string values and the idiosyncratic 'sparkDatasourceInfo' value.
+    Walks a dict or list and explodes JSON string values and the idiosyncratic 'sparkDatasourceInfo' value.
+    Exploded values are walked too. Strings directly in lists are not exploded.
+    :param obj: Dict or list, changed in place.
+    :param keys: If set, only explode string values of these keys. For {"key": k, "value": v} dicts, 'k' is the key.
     """
-    if isinstance(obj, dict):
-        _explode_json_dict(obj)
-    elif isinstance(obj, list):
-        for e in obj:
-            explode_json(e)
+    stack = [ obj ]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(e for e in node if isinstance(e, (dict, list)))
+            continue
+        if not isinstance(node, dict):
+            continue
+        if node.keys() == {"key", "value"}:
+            items = [ ("value", node["key"], node["value"]) ]
+        else:
+            items = [ (k, k, v) for k,v in node.items() ]
+        for k, name, v in items:
+            if isinstance(v, (dict, list)):
+                stack.append(v)
+            elif isinstance(v, str) and (keys is None or name in keys):
+                if name == TAG_sparkDatasourceInfo:
+                    node[k] = parse_sparkDatasourceInfo_tag(v)
+                else:
+                    v2 = _explode_string(v)
+                    if v2 is not v:
+                        node[k] = v2
+                        stack.append(v2)
 
 
 def main(path):
@@ -5,10 +5,9 @@ Iterators for MLflow search methods that handle page token magic for you.
 # ====
 # https://github.com/mlflow/mlflow/blob/master/mlflow/store/model_registry/__init__.py
 
-from mlflow.store.model_registry.__init__ import (
-    SEARCH_REGISTERED_MODEL_MAX_RESULTS_THRESHOLD, # = 1000
-    SEARCH_MODEL_VERSION_MAX_RESULTS_THRESHOLD     # = 200_000 # incorrect value per API call
-)
+# NOTE: values copied to avoid importing mlflow (slow)
+SEARCH_REGISTERED_MODEL_MAX_RESULTS_THRESHOLD = 1000
+SEARCH_MODEL_VERSION_MAX_RESULTS_THRESHOLD = 200_000 # incorrect value per API call
 #_SEARCH_MODEL_VERSION_MAX_RESULTS_THRESHOLD = SEARCH_MODEL_VERSION_MAX_RESULTS_THRESHOLD # per API error message: {"error_code": "INVALID_PARAMETER_VALUE", "message": "Invalid max results 200000, should be between 0 and 10000"}}
 _SEARCH_MODEL_VERSION_MAX_RESULTS_THRESHOLD = 10_000 
 
@@ -19,20 +18,37 @@ _SEARCH_MODEL_VERSION_MAX_RESULTS_THRESHOLD = 10_000
 # ====
 # https://github.com/mlflow/mlflow/blob/master/mlflow/store/tracking/__init__.py
 
-from mlflow.store.tracking.__init__ import (
-    SEARCH_MAX_RESULTS_THRESHOLD # = 50000
-)
+SEARCH_MAX_RESULTS_THRESHOLD = 50000
 #    SEARCH_MAX_RESULTS_DEFAULT = 1000
 
 # ====
 
-from mlflow.store.entities.paged_list import PagedList
+import queue
+import threading
 from mlflow_reports.common import MlflowReportsException
+from mlflow_reports.common.json_stream import JsonArrayStreamParser
+
+
+class PagedList(list):
+    """
+    Same as mlflow.store.entities.paged_list.PagedList - a list with a 'token' for the next page.
+    """
+    def __init__(self, items, token):
+        super().__init__(items)
+        self.token = token
 
 
 class BaseIterator():
     """
     Base class to iterate for 'search' methods that return PageList.
+
+    Optionally prefetches pages in a background thread so that fetching page N+1 overlaps
+    with consumption of page N:
+        runs = SearchRunsIterator(client, experiment_ids).with_prefetch(2)
+
+    Or optionally parses each page incrementally as it arrives from the socket so that memory is bounded
+    by object size rather than page size:
+        runs = SearchRunsIterator(client, experiment_ids).with_streaming()
     """
     def __init__(self, client, resource, object_name, max_results=None, filter=None, http_method="GET", kwargs=None):
         self.client = client
@@ -45,6 +61,28 @@ class BaseIterator():
         if filter: self.kwargs["filter"] = filter
         if max_results: self.kwargs["max_results"] = max_results
         self.http_method = http_method
+        self.prefetch_depth = 0
+        self.stream_chunk_size = 0
+
+
+    def with_prefetch(self, depth=1):
+        """
+        Opt-in to prefetch mode.
+        :param depth: Maximum number of pages fetched ahead of the page being consumed.
+        :return: self
+        """
+        self.prefetch_depth = depth
+        return self
+
+
+    def with_streaming(self, chunk_size=64*1024):
+        """
+        Opt-in to streaming mode. Takes precedence over prefetch mode. Requires an HttpClient.
+        :param chunk_size: Maximum number of bytes read from the socket at a time.
+        :return: self
+        """
+        self.stream_chunk_size = chunk_size
+        return self
 
 
     def _call_iter(self):
@@ -55,8 +93,7 @@ class BaseIterator():
 
 
     def _invoke(self, token=None):
-        params = self.kwargs.copy()
-        if token: params["page_token"] = token
+        params = self._mk_params(token)
 
         # NOTE: https://github.com/mlflow/mlflow/issues/7949
         # Some search endpoints are GET and others are POST :(
@@ -64,7 +101,14 @@ class BaseIterator():
             rsp = self.client.post(self.resource, params)
         else:
             rsp = self.client.get(self.resource, params)
+        return self._mk_paged_list(rsp)
+
+    def _mk_params(self, token=None):
+        params = self.kwargs.copy()
+        if token: params["page_token"] = token
+        return params
 
+    def _mk_paged_list(self, rsp):
         # extract the list of objects from the root key of the response
         objects = rsp.get(self.object_name, [])
 
@@ -73,6 +117,10 @@ class BaseIterator():
 
 
     def __iter__(self):
+        if self.stream_chunk_size > 0:
+            return self._iter_streaming()
+        if self.prefetch_depth > 0:
+            return self._iter_prefetch()
         try:
             self.paged_list = self._call_iter()
         except MlflowReportsException as e:
@@ -96,6 +144,74 @@ class BaseIterator():
             return self.paged_list[0]
 
 
+    def _iter_prefetch(self):
+        # NOTE: the producer takes a slot before each page request and the consumer gives it back when it starts
+        # a page, so at most 'prefetch_depth' pages are requested ahead of the page being consumed
+        pages = queue.Queue()
+        slots = threading.Semaphore(self.prefetch_depth)
+        stop = threading.Event()
+
+        def _acquire():
+            while not stop.is_set():
+                if slots.acquire(timeout=0.5):
+                    return True
+            return False
+
+        def _produce():
+            try:
+                token = None
+                while _acquire():
+                    paged_list = self._invoke(token)
+                    pages.put(paged_list)
+                    if not paged_list.token or len(paged_list) == 0:
+                        break
+                    token = paged_list.token
+                pages.put(None)
+            except Exception as e:
+                pages.put(e)
+
+        threading.Thread(target=_produce, daemon=True).start()
+        is_first_page = True
+        try:
+            while True:
+                paged_list = pages.get()
+                if paged_list is None:
+                    return
+                if isinstance(paged_list, Exception):
+                    if is_first_page and isinstance(paged_list, MlflowReportsException):
+                        print(f"WARNING: Search failed. {paged_list}")
+                        return
+                    raise paged_list
+                slots.release()
+                is_first_page = False
+                yield from paged_list
+        finally:
+            stop.set()
+
+
+    def _iter_streaming(self):
+        token = None
+        is_first_page = True
+        while True:
+            parser = JsonArrayStreamParser(self.object_name)
+            chunks = self.client.stream(self.http_method, self.resource, self._mk_params(token), self.stream_chunk_size)
+            try:
+                for chunk in chunks:
+                    yield from parser.feed(chunk)
+                parser.close()
+            except MlflowReportsException as e:
+                if not is_first_page:
+                    raise
+                print(f"WARNING: Search failed. {e}")
+                return
+            finally:
+                chunks.close()
+            token = parser.fields.get("next_page_token")
+            if not token or parser.num_objects == 0:
+                return
+            is_first_page = False
+
+
 class SearchExperimentsIterator(BaseIterator):
     """
     Usage:
@@ -158,3 +274,65 @@ class FeatureTablesIterator(BaseIterator):
     """
     def __init__(self, client, max_results=None, filter=None):
         super().__init__(client, "feature-store/feature-tables/search", "feature_tables", max_results=max_results, filter=filter)
+
+
+# ==== Async iterators for AsyncHttpClient
+
+class AsyncIteratorMixin():
+    """
+    Adds 'async for' support to a BaseIterator subclass whose client is an AsyncHttpClient.
+    Usage:
+        async for run in AsyncSearchRunsIterator(async_client, experiment_ids):
+            print(run)
+        async for page in AsyncSearchRunsIterator(async_client, experiment_ids).iter_pages():
+            print(len(page))
+    """
+    async def _invoke_async(self, token=None):
+        params = self._mk_params(token)
+        if self.http_method.upper() == "POST":
+            rsp = await self.client.post(self.resource, params)
+        else:
+            rsp = await self.client.get(self.resource, params)
+        return self._mk_paged_list(rsp)
+
+    async def iter_pages(self):
+        """
+        Yields each page as a PagedList.
+        """
+        try:
+            paged_list = await self._invoke_async()
+        except MlflowReportsException as e:
+            print(f"WARNING: Search failed. {e}")
+            return
+        while True:
+            yield paged_list
+            if not paged_list.token or len(paged_list) == 0:
+                return
+            paged_list = await self._invoke_async(paged_list.token)
+
+    async def _iter_objects(self):
+        async for paged_list in self.iter_pages():
+            for obj in paged_list:
+                yield obj
+
+    def __aiter__(self):
+        return self._iter_objects()
+
+
+class AsyncSearchExperimentsIterator(AsyncIteratorMixin, SearchExperimentsIterator):
+    pass
+
+class AsyncSearchRegisteredModelsIterator(AsyncIteratorMixin, SearchRegisteredModelsIterator):
+    pass
+
+class AsyncSearchModelVersionsIterator(AsyncIteratorMixin, SearchModelVersionsIterator):
+    pass
+
+class AsyncSearchRunsIterator(AsyncIteratorMixin, SearchRunsIterator):
+    pass
+
+class AsyncSearchUcRegisteredModelsIterator(AsyncIteratorMixin, SearchUcRegisteredModelsIterator):
+    pass
+
+class AsyncFeatureTablesIterator(AsyncIteratorMixin, FeatureTablesIterator):
+    pass
@@ -1,8 +1,8 @@
-import json
+import csv
 import yaml
-import pandas as pd
 from mlflow_reports.data import data_utils
-from mlflow_reports.list import list_utils
+from mlflow_reports.common import json_codec
+from mlflow_reports.common.timestamp_utils import fmt_ts_millis
 
 
 # Fix for PyYaml bug where yaml.safe_load() automatically converts to datetime-like fields to Python datetime
@@ -28,7 +28,7 @@ def write_file(path, content, file_type=None):
     path = mk_local_path(path)
     if path.endswith(".json") or file_type=="json":
         with open(path, "w", encoding="utf-8") as f:
-            f.write(json.dumps(content, indent=2)+"\n")
+            f.write(json_codec.dumps(content, indent=2)+"\n")
     elif _is_yaml(path, file_type):
         with open(path, "w", encoding="utf-8") as f:
             yaml.dump(content, f, sort_keys=False)
@@ -41,10 +41,11 @@ def read_file(path, file_type=None):
     """
     Read a JSON, YAML or text file.
     """
+    if path.endswith(".json") or file_type=="json":
+        with open(path, "rb") as f:
+            return json_codec.loads(f.read())
     with open(path, "r", encoding="utf-8") as f:
-        if path.endswith(".json") or file_type=="json":
-            return json.loads(f.read())
-        elif _is_yaml(path, file_type):
+        if _is_yaml(path, file_type):
             return yaml.safe_load(f)
         else:
             return f.read()
@@ -67,6 +68,8 @@ def write_csv_and_json_files(
     :param normalize_pandas_df: convert with pd.json_normalize(), else use pd.DataFrame()
     :param reorder_columns: customer reorder columns
     """
+    import pandas as pd # slow import - only needed for list commands
+    from mlflow_reports.list import list_utils
     df = pd.json_normalize(list_of_dicts) if normalize_pandas_df else pd.DataFrame(list_of_dicts)
     if reorder_columns:
         df = reorder_columns(df)
@@ -76,6 +79,48 @@ def write_csv_and_json_files(
     list_utils.to_datetime(df, ts_columns)
     list_utils.show_and_write(df, columns, csv_file)
 
-    for dct in list_of_dicts:
-        data_utils.adjust_ts(dct, ts_columns)
+    data_utils.adjust_ts_batch(list_of_dicts, ts_columns, df)
     data_utils.dump_object(list_of_dicts, f"{output_file_base}.json", silent=True)
+
+
+def write_csv_and_json_files_streaming(
+        output_file_base,
+        objects,
+        columns = None,
+        ts_columns = None
+    ):
+    """
+    Streaming version of write_csv_and_json_files().
+    Each object is written to the CSV and JSON files as it arrives so memory stays flat regardless of the number of objects.
+    No dataframe is built and nothing is displayed to stdout.
+    :param output_file_base: File base for JSON and CSV output files. For example, 'out' will result in 'out.csv' and 'out.json.
+    :param objects: Iterable of dicts
+    :param columns: CSV columns to write. If not set, the keys of the first object are used
+                    and a later object with other keys raises a ValueError instead of losing them.
+    :param ts_columns: Timestamp columns to convert from millis to human friendly format
+    :return: Number of objects written
+    """
+    csv_file = f"{output_file_base}.csv"
+    json_file = f"{output_file_base}.json"
+    print(f"Streaming objects to {csv_file} and {json_file}")
+    ts_columns = ts_columns or []
+    num_objects = 0
+    with open(csv_file, "w", encoding="utf-8", newline="") as f_csv, \
+         open(json_file, "w", encoding="utf-8") as f_json:
+        writer = None
+        f_json.write("[")
+        for dct in objects:
+            if writer is None:
+                writer = csv.DictWriter(f_csv, fieldnames=columns or list(dct.keys()), restval="",
+                    extrasaction="ignore" if columns else "raise")
+                writer.writeheader()
+            row = { k: fmt_ts_millis(int(v)) if k in ts_columns and v else v for k,v in dct.items() }
+            writer.writerow(row)
+
+            data_utils.adjust_ts(dct, ts_columns)
+            sep = ",\n  " if num_objects > 0 else "\n  "
+            f_json.write(sep + json_codec.dumps(dct, indent=2).replace("\n", "\n  "))
+            num_objects += 1
+        f_json.write("\n]\n" if num_objects > 0 else "]\n")
+    print(f"Wrote {num_objects} objects to {csv_file} and {json_file}")
+    return num_objects
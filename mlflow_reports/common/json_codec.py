@@ -0,0 +1,114 @@
+"""
+Pluggable JSON codec for HTTP responses and output files.
+
+Parses with orjson when it is installed (pip install mlflow-reports[fast-json]) - it parses response bytes directly
+without decoding to str first and is faster on large responses such as a runs/search page.
+Otherwise falls back to the standard library json module.
+
+Output is always written by the standard library unless orjson serialization is opted into with
+the 'orjson_dumps' codec, since orjson output is not the same:
+  - NaN and Infinity (e.g. metric values) are written as null
+  - non-ASCII characters are not escaped
+
+The codec can be selected with the MLFLOW_REPORTS_JSON_CODEC environment variable ('json', 'orjson' or 'orjson_dumps')
+or with set_codec().
+"""
+
+import os
+import json
+import importlib.util
+
+
+class StdlibCodec:
+    name = "json"
+
+    def loads(self, data):
+        """
+        :param data: JSON as bytes or str.
+        """
+        return json.loads(data)
+
+    def dumps(self, obj, indent=None, sort_keys=False, default=None):
+        return json.dumps(obj, indent=indent, sort_keys=sort_keys, default=default)
+
+
+class OrjsonCodec:
+    """
+    orjson rejects NaN and Infinity, which the standard library writes, so such input is parsed by the standard library.
+    orjson only indents with 2 spaces and only serializes str keys and 64-bit integers,
+    so anything else falls back to the standard library.
+    """
+    def __init__(self, fast_dumps=False):
+        """
+        :param fast_dumps: Serialize with orjson too. Output differs from the standard library - see module docstring.
+        """
+        import orjson
+        self._orjson = orjson
+        self._stdlib = StdlibCodec()
+        self.fast_dumps = fast_dumps
+        self.name = "orjson_dumps" if fast_dumps else "orjson"
+
+    def loads(self, data):
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            return self._stdlib.loads(data)
+
+    def dumps(self, obj, indent=None, sort_keys=False, default=None):
+        if not self.fast_dumps or indent not in (None, 2):
+            return self._stdlib.dumps(obj, indent, sort_keys, default)
+        option = self._orjson.OPT_PASSTHROUGH_DATETIME # pass datetimes to 'default' as the standard library does
+        if indent:
+            option |= self._orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= self._orjson.OPT_SORT_KEYS
+        try:
+            return self._orjson.dumps(obj, option=option, default=default).decode("utf-8")
+        except (TypeError, self._orjson.JSONEncodeError):
+            return self._stdlib.dumps(obj, indent, sort_keys, default)
+
+
+_CODECS = {
+    "json": StdlibCodec,
+    "orjson": OrjsonCodec,
+    "orjson_dumps": lambda: OrjsonCodec(fast_dumps=True)
+}
+
+
+def _mk_default_codec():
+    name = os.environ.get("MLFLOW_REPORTS_JSON_CODEC")
+    if not name:
+        name = "orjson" if importlib.util.find_spec("orjson") else "json"
+    return _CODECS[name]()
+
+
+_codec = _mk_default_codec()
+
+
+def get_codec():
+    return _codec
+
+
+def set_codec(codec):
+    """
+    :param codec: Codec name ('json', 'orjson' or 'orjson_dumps') or an object with loads() and dumps() methods.
+    :return: The previous codec.
+    """
+    global _codec
+    previous = _codec
+    _codec = _CODECS[codec]() if isinstance(codec, str) else codec
+    return previous
+
+
+def loads(data):
+    """
+    Parses JSON from bytes (preferred - no str decoding step) or str.
+    """
+    return _codec.loads(data)
+
+
+def dumps(obj, indent=None, sort_keys=False, default=None):
+    """
+    Serializes to a JSON str.
+    """
+    return _codec.dumps(obj, indent=indent, sort_keys=sort_keys, default=default)
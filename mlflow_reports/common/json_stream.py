@@ -0,0 +1,152 @@
+"""
+Incremental parser for search responses such as '{"runs": [ {...}, {...} ], "next_page_token": "..."}'.
+
+Objects of the array under one top-level key are yielded as soon as their bytes arrive, so memory is bounded
+by the size of the largest object rather than the size of the page. The other top-level fields
+(e.g. 'next_page_token') are collected into 'fields'.
+
+Usage:
+    parser = JsonArrayStreamParser("runs")
+    for chunk in rsp.iter_content(chunk_size):
+        for run in parser.feed(chunk):
+            print(run)
+    parser.close()
+    token = parser.fields.get("next_page_token")
+"""
+
+import re
+from mlflow_reports.common import MlflowReportsException
+from mlflow_reports.common import json_codec
+
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_NOT_STRUCTURAL = rb'[^"{}\[\]]'
+
+# A complete string, a lone quote (string not complete yet) or a structural character
+_TOKEN_PATTERN = re.compile(_STRING + rb'|"|[{}\[\],:]', re.DOTALL)
+# Everything up to the next bracket or incomplete string inside a nested value.
+# Flat objects such as {"key": "k", "value": "v"} in params, metrics and tags are skipped whole.
+_FLAT_OBJECT = rb'\{' + _NOT_STRUCTURAL + rb'*(?:' + _STRING + _NOT_STRUCTURAL + rb'*)*\}'
+_NESTED_PATTERN = re.compile(rb'(?:' + _NOT_STRUCTURAL + rb'+|' + _STRING + rb'|' + _FLAT_OBJECT + rb')*', re.DOTALL)
+_WHITESPACE = b" \t\r\n"
+
+
+class JsonArrayStreamParser:
+    def __init__(self, array_key):
+        """
+        :param array_key: Top-level key of the array whose objects are yielded, e.g. 'runs'.
+        """
+        self.array_key = array_key
+        self.fields = {}
+        self.num_objects = 0
+        self._buf = bytearray()
+        self._pos = 0           # scan position in _buf
+        self._depth = 0
+        self._key = None        # current top-level key
+        self._value_start = None
+        self._item_start = None # start of the current array object when inside the array
+        self._done = False
+
+
+    def feed(self, chunk):
+        """
+        Parses the next chunk of bytes.
+        :return: List of the array objects completed by this chunk.
+        """
+        self._buf += chunk
+        objects = []
+        while True:
+            if self._depth > 2 or (self._depth == 2 and self._item_start is None):
+                if not self._skip_nested():
+                    break
+                continue
+            match = _TOKEN_PATTERN.search(self._buf, self._pos)
+            if not match or match.group() == b'"':
+                self._pos = match.start() if match else len(self._buf) # wait for more bytes
+                break
+            self._pos = match.end()
+            if self._depth == 2:
+                self._on_array_token(match, objects)
+            else:
+                self._on_token(match)
+        self._compact()
+        return objects
+
+
+    def close(self):
+        """
+        Checks that the whole response was parsed.
+        """
+        if not self._done:
+            raise MlflowReportsException(message=f"Incomplete JSON response for '{self.array_key}' after {self.num_objects} objects")
+
+
+    def _skip_nested(self):
+        """
+        Skips strings and scalars inside nested values tracking only the depth.
+        :return: False if more bytes are needed.
+        """
+        pos = _NESTED_PATTERN.match(self._buf, self._pos).end()
+        if pos >= len(self._buf) or self._buf[pos] == ord('"'):
+            self._pos = pos
+            return False
+        self._depth += 1 if self._buf[pos] in b"{[" else -1
+        self._pos = pos + 1
+        return True
+
+    def _on_array_token(self, match, objects):
+        token = match.group()
+        if token == b",":
+            objects.append(self._decode_item(match.start()))
+            self._item_start = match.end()
+        elif token == b"]":
+            if self._buf[self._item_start:match.start()].strip(_WHITESPACE):
+                objects.append(self._decode_item(match.start()))
+            self._item_start = None
+            self._depth = 1
+        elif token in b"{[":
+            self._depth = 3
+
+    def _on_token(self, match):
+        token = match.group()
+        if self._depth == 0:
+            if token != b"{":
+                raise MlflowReportsException(message=f"Expecting a JSON object but got '{token.decode()}'")
+            self._depth = 1
+        elif token[0:1] == b'"':
+            if self._value_start is None and self._key is None:
+                self._key = json_codec.loads(token)
+        elif token == b":":
+            self._value_start = match.end()
+        elif token == b"[" and self._key == self.array_key and not self._buf[self._value_start:match.start()].strip(_WHITESPACE):
+            self._value_start = None
+            self._item_start = match.end()
+            self._depth = 2
+        elif token in b"{[":
+            self._depth = 2
+        elif token in b",}":
+            if self._value_start is not None:
+                self.fields[self._key] = json_codec.loads(bytes(self._buf[self._value_start:match.start()]))
+            self._key = None
+            self._value_start = None
+            if token == b"}":
+                self._depth = 0
+                self._done = True
+
+    def _decode_item(self, end):
+        obj = json_codec.loads(bytes(self._buf[self._item_start:end]))
+        self.num_objects += 1
+        return obj
+
+    def _compact(self):
+        """
+        Drops the bytes that have been consumed.
+        """
+        starts = [ x for x in (self._item_start, self._value_start) if x is not None ]
+        keep = min(starts + [ self._pos ])
+        if keep > 0:
+            del self._buf[:keep]
+            self._pos -= keep
+            if self._item_start is not None:
+                self._item_start -= keep
+            if self._value_start is not None:
+                self._value_start -= keep
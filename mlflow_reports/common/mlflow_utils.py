@@ -1,9 +1,10 @@
 from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-import mlflow
-from mlflow.exceptions import RestException
 from mlflow_reports.common import MlflowReportsException
 from mlflow_reports.client import mlflow_client, databricks_client
+from mlflow_reports.client import http_session, capabilities
 
 
 def get_experiment(exp_id_or_name):
@@ -14,11 +15,15 @@ def get_experiment(exp_id_or_name):
     """
     try:
         rsp = mlflow_client.get_experiment_by_name(exp_id_or_name)
-    except MlflowReportsException as e:
+    except MlflowReportsException as name_e:
         try:
             rsp = mlflow_client.get_experiment(exp_id_or_name)
-        except RestException as e:
-            raise MlflowReportsException(f"Cannot find experiment ID or name '{exp_id_or_name}'. Client: {mlflow_client}'. Ex: {e}")
+        except MlflowReportsException as e:
+            # NOTE: a name that is not a valid ID fails 'experiments/get' with 400 - the name lookup's 404 is the answer
+            raise MlflowReportsException(
+                http_status_code = name_e.http_status_code,
+                message = f"Cannot find experiment ID or name '{exp_id_or_name}'. Client: {mlflow_client}'. Ex: {e}"
+            )
     return rsp["experiment"]
 
 
@@ -29,7 +34,7 @@ def get_registered_model(model_name, get_permissions):
        2. databricks/registered-models/get - custom Databricks call that simply has an extra "id" field needed
           to subsequently call to get permissions
     """
-    if is_calling_databricks() and get_permissions and not is_unity_catalog_model(model_name):
+    if get_permissions and capabilities.supports(capabilities.ENDPOINT_DATABRICKS_REGISTERED_MODELS) and not is_unity_catalog_model(model_name):
         try:
             model = databricks_client.get_registered_model(model_name)
             return model["registered_model_databricks"]
@@ -42,27 +47,39 @@ def get_registered_model(model_name, get_permissions):
         return model["registered_model"]
 
 
-def search_registered_models(filter=None, get_search_object_again=True):
+def search_registered_models(filter=None, get_search_object_again=True, max_workers=1):
     """
     Search for registered models.
     For Databricks UC, need to call 'registered-models/get' again for each
     returned model since aliases and tags are not returned. This is much
     slower obviously especially for a large number of models. For 328 models,
     just the search takes 6 seconds and with the extra get call takes 178 seconds.
+    Use 'max_workers' to make the extra get calls concurrently.
 
     https://databricks.atlassian.net/browse/ES-834105
     UC-ML MLflow search_registered_models and search_model_versions do not return tags and aliases
     """
     models = mlflow_client.search_registered_models(filter=filter)
-    if get_search_object_again:
-        print(f"Calling get_registered_model() again for {len(models)} models")
-        models = [ mlflow_client.search_registered_models(m["name"]) for m in models ]
-        return [ m["registered_model"] for m in models]
-    else:
+    if not get_search_object_again:
         return models
 
+    print(f"Calling get_registered_model() again for {len(models)} models with {max_workers} workers")
+    results = mlflow_client.get_registered_models(
+        [ m["name"] for m in models ],
+        max_workers,
+        progress_title = "registered-models/get"
+    )
+    models2 = []
+    for model, (rsp, e) in zip(models, results):
+        if e:
+            print(f"WARNING: 'registered-models/get' failed for '{model['name']}'. Returning search object. Ex: {e}")
+            models2.append(model)
+        else:
+            models2.append(rsp["registered_model"])
+    return models2
+
 
-def search_model_versions(filter=None, get_search_object_again=False):
+def search_model_versions(filter=None, get_search_object_again=False, max_workers=1):
     """
     Search for model versions.
     See  https://github.com/mlflow/mlflow/issues/9783 (no alias)
@@ -72,23 +89,52 @@ def search_model_versions(filter=None, get_search_object_again=False):
 
     https://github.com/mlflow/mlflow/issues/9783
     MlflowClient.search_model_versions does not return aliases
+
+    :param max_workers: Number of concurrent 'model-versions/get' calls when get_search_object_again is set.
     """
 
     versions = mlflow_client.search_model_versions(filter=filter)
     if not get_search_object_again:
         return versions
 
-    print(f"Calling get_model_version() again for {len(versions)} versions")
+    print(f"Calling get_model_version() again for {len(versions)} versions with {max_workers} workers")
+    return _get_model_versions_again(versions, max_workers, "model-versions/get")
+
+
+def iter_model_versions(filter=None, get_search_object_again=False, max_workers=1):
+    """
+    Streaming version of search_model_versions(). Yields model versions as they are parsed from the search response.
+    When get_search_object_again is set, versions are fetched again in chunks of 'max_workers'.
+    """
+    versions = mlflow_client.iter_model_versions(filter=filter, stream_pages=True)
+    if not get_search_object_again:
+        yield from versions
+        return
+    chunk = []
+    for vr in versions:
+        chunk.append(vr)
+        if len(chunk) >= max(max_workers, 1):
+            yield from _get_model_versions_again(chunk, max_workers)
+            chunk = []
+    if chunk:
+        yield from _get_model_versions_again(chunk, max_workers)
+
+
+def _get_model_versions_again(versions, max_workers, progress_title=None):
+    results = mlflow_client.get_model_versions(
+        [ (vr["name"], vr["version"]) for vr in versions ],
+        max_workers,
+        progress_title = progress_title
+    )
     versions2 = []
     failed = []
-    for vr in versions:
-        try:
-            vr2 = mlflow_client.get_model_version(vr["name"], vr["version"])
-            versions2.append(vr2)
-        except MlflowReportsException as e:
+    for vr, (vr2, e) in zip(versions, results):
+        if e:
             # NOTE: Failing for: Unsupported function securable kind FUNCTION_REGISTERED_MODEL_DELTASHARING"
             print(f"ERROR: 'model-versions/get' failed. Ex: {e}")
             failed.append(vr)
+        else:
+            versions2.append(vr2)
     if len(failed) > 0:
         print(f"WARNING: {len(failed)} calls to 'model-versions/get' failed")
         for vr in failed:
@@ -97,15 +143,20 @@ def search_model_versions(filter=None, get_search_object_again=False):
     return [ vr["model_version"] for vr in versions2]
 
 
-def build_artifacts(run_id, artifact_path, artifact_max_level, level=0):
+def build_artifacts(run_id, artifact_path, artifact_max_level, level=0, max_workers=1, max_in_flight=None):
     """
     Build recursive tree of calls to 'artifacts/list' API endpoint.
     :param run_id: Run ID.
     :param artifact_path: Relative artifact path.
     :param artifact_max_level: Levels to recurse.
+    :param max_workers: If greater than 1, walk the tree breadth-first with concurrent 'artifacts/list' calls.
+    :param max_in_flight: Maximum number of outstanding 'artifacts/list' calls. Default is 2 * max_workers.
     :return: Nested dict with list of artifacts representing tree node info.
     """
-    res = _build_artifacts(run_id, artifact_path, artifact_max_level, level)
+    if max_workers > 1:
+        res = _build_artifacts_concurrent(run_id, artifact_path, artifact_max_level, level, max_workers, max_in_flight)
+    else:
+        res = _build_artifacts(run_id, artifact_path, artifact_max_level, level)
     summary = {
         "artifact_max_level": artifact_max_level,
         "num_artifacts": res.num_artifacts,
@@ -115,22 +166,49 @@ def build_artifacts(run_id, artifact_path, artifact_max_level, level=0):
     return { **{ "summary": summary }, **res.artifacts }
 
 
-def _build_artifacts(run_id, artifact_path, artifact_max_level, level=0):
-    @dataclass()
-    class Result:
-        artifacts: dict = None
-        num_bytes: int = 0
-        num_artifacts: int = 0
-        num_levels: int = 0
-        def __repr__(self):
-            return f"{self.num_bytes} {self.num_artifacts} {self.num_levels}"
+def build_artifacts_summary(run_id, artifact_path, artifact_max_level, level=0, max_workers=1, max_in_flight=None):
+    """
+    Same summary as build_artifacts() without building the artifact tree.
+    Directory listings are discarded as soon as they are counted so memory stays bounded
+    by the breadth of the tree instead of its total number of files.
+    :return: Dict with "summary" key.
+    """
+    num_bytes, num_artifacts, num_levels = (0, 0, level)
+    if level < artifact_max_level:
+        listings = _iter_artifact_listings(run_id, _ArtifactNode(artifact_path, level), artifact_max_level, max_workers, max_in_flight)
+        for node, artifacts in listings:
+            num_levels = max(num_levels, node.level+1)
+            node.children = [] # release child nodes once they are queued
+            for artifact in artifacts.get("files") or []:
+                num_bytes += int(artifact.get("file_size",0)) or 0
+                if not artifact["is_dir"]:
+                    num_artifacts += 1
+    summary = {
+        "artifact_max_level": artifact_max_level,
+        "num_artifacts": num_artifacts,
+        "num_bytes": num_bytes,
+        "num_levels": num_levels
+    }
+    return { "summary": summary }
+
+
+@dataclass()
+class _ArtifactsResult:
+    artifacts: dict = None
+    num_bytes: int = 0
+    num_artifacts: int = 0
+    num_levels: int = 0
+    def __repr__(self):
+        return f"{self.num_bytes} {self.num_artifacts} {self.num_levels}"
+
 
+def _build_artifacts(run_id, artifact_path, artifact_max_level, level=0):
     if level == artifact_max_level:
-        return Result({}, 0, 0, level)
+        return _ArtifactsResult({}, 0, 0, level)
 
     artifacts = mlflow_client.list_artifacts(run_id, artifact_path)
     if level > artifact_max_level:
-        return Result(artifacts, 0, 0, level)
+        return _ArtifactsResult(artifacts, 0, 0, level)
 
     files = artifacts.get("files", None)
     level += 1
@@ -147,7 +225,91 @@ def _build_artifacts(run_id, artifact_path, artifact_max_level, level=0):
                 artifact["artifacts"] = res.artifacts
             else:
                 num_artifacts += 1
-    return Result(artifacts, num_bytes, num_artifacts, new_level)
+    return _ArtifactsResult(artifacts, num_bytes, num_artifacts, new_level)
+
+
+class _ArtifactNode:
+    def __init__(self, path, level):
+        self.path = path
+        self.level = level
+        self.artifacts = None
+        self.children = []
+
+
+def _iter_artifact_listings(run_id, root, artifact_max_level, max_workers=1, max_in_flight=None):
+    """
+    Walks the artifact tree breadth-first and yields (node, artifacts) for each listed directory.
+    Directories at 'artifact_max_level' are not listed. Child nodes are appended to 'node.children'.
+    """
+    def _expand(node, artifacts):
+        if node.level > artifact_max_level:
+            return
+        for artifact in artifacts.get("files") or []:
+            if artifact["is_dir"]:
+                child = _ArtifactNode(artifact["path"], node.level+1)
+                node.children.append(child)
+                pending.append(child)
+
+    pending = deque([root])
+    if max_workers <= 1:
+        while pending:
+            node = pending.popleft()
+            if node.level != artifact_max_level:
+                artifacts = mlflow_client.list_artifacts(run_id, node.path)
+                _expand(node, artifacts)
+                yield node, artifacts
+        return
+
+    max_in_flight = max_in_flight or 2 * max_workers
+    http_session.ensure_pool_size(max_workers)
+    in_flight = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or in_flight:
+            while pending and len(in_flight) < max_in_flight:
+                node = pending.popleft()
+                if node.level != artifact_max_level:
+                    future = executor.submit(mlflow_client.list_artifacts, run_id, node.path)
+                    in_flight[future] = node
+            if not in_flight:
+                continue
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = in_flight.pop(future)
+                artifacts = future.result()
+                _expand(node, artifacts)
+                yield node, artifacts
+
+
+def _build_artifacts_concurrent(run_id, artifact_path, artifact_max_level, level, max_workers, max_in_flight=None):
+    """
+    Breadth-first version of _build_artifacts() that lists directories concurrently.
+    Returns the same result as _build_artifacts().
+    """
+    root = _ArtifactNode(artifact_path, level)
+    for node, artifacts in _iter_artifact_listings(run_id, root, artifact_max_level, max_workers, max_in_flight):
+        node.artifacts = artifacts
+    return _summarize_artifacts(root, artifact_max_level)
+
+
+def _summarize_artifacts(node, artifact_max_level):
+    if node.level == artifact_max_level:
+        return _ArtifactsResult({}, 0, 0, node.level)
+    if node.level > artifact_max_level:
+        return _ArtifactsResult(node.artifacts, 0, 0, node.level)
+    new_level = node.level + 1
+    num_bytes, num_artifacts = (0,0)
+    children = iter(node.children)
+    for artifact in node.artifacts.get("files") or []:
+        num_bytes += int(artifact.get("file_size",0)) or 0
+        if artifact["is_dir"]:
+            res = _summarize_artifacts(next(children), artifact_max_level)
+            new_level = max(new_level, res.num_levels)
+            num_bytes += res.num_bytes
+            num_artifacts += res.num_artifacts
+            artifact["artifacts"] = res.artifacts
+        else:
+            num_artifacts += 1
+    return _ArtifactsResult(node.artifacts, num_bytes, num_artifacts, new_level)
 
 
 def mk_tags_dict(tags_array):
@@ -177,6 +339,7 @@ def is_unity_catalog_model(model_name):
 
 
 def use_unity_catalog(_use_unity_catalog):
+    import mlflow
     if is_calling_databricks():
         if _use_unity_catalog:
             mlflow.set_registry_uri("databricks-uc")
@@ -189,19 +352,8 @@ def has_error(dct):
     return "warning" in dct or "error" in dct
 
 
-_is_calling_into_databricks = None
-
 def is_calling_databricks():
     """
-    Are we calling Databricks MLflow? Check by making call to Databricks-specific API endpoint.
+    Are we calling Databricks MLflow? Probed once per host and cached - see capabilities.
     """
-
-    global _is_calling_into_databricks
-    if _is_calling_into_databricks is None:
-        try:
-            databricks_client.get_workspace_status()
-            return False # Should never get here
-        except MlflowReportsException as e:
-            _is_calling_into_databricks =  e.http_status_code == 400
-            print(f"Calling Databricks MLflow: {_is_calling_into_databricks}")
-    return _is_calling_into_databricks
+    return capabilities.get_capabilities().is_databricks
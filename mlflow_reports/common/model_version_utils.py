@@ -1,3 +1,4 @@
+from mlflow_reports.common import MlflowReportsException
 from mlflow_reports.client import mlflow_client
 from mlflow_reports.common import mlflow_utils
 
@@ -28,15 +29,38 @@ def _get_version(model_name, version_or_stage):
     """
     Get version number for a version_or_stage
     """
-    if version_or_stage.isdigit():
-        rsp = mlflow_client.get_model_version(model_name, version_or_stage)
-        return rsp["model_version"]
-    else:
-        rsp = mlflow_client.get_latest_versions(model_name, version_or_stage)
-        versions = rsp["model_versions"]
-        if len(versions) == 0:
-            raise RuntimeError(f"No '{version_or_stage}' stage for model '{model_name}/{version_or_stage}'")
-        return versions[0]
+    version, e = get_versions([ (model_name, version_or_stage) ])[0]
+    if e:
+        raise e
+    return version
+
+
+def get_versions(pairs, max_workers=1):
+    """
+    Get model versions for a list of (model_name, version_or_stage) tuples.
+    Versions are fetched concurrently with MlflowClient.get_model_versions(). Stages are resolved one at a time.
+    :return: List of (model_version, exception) tuples in the same order as 'pairs'.
+    """
+    results = [ None ] * len(pairs)
+    idxs = [ j for j, (_, version_or_stage) in enumerate(pairs) if version_or_stage.isdigit() ]
+    rsps = mlflow_client.get_model_versions([ pairs[j] for j in idxs ], max_workers)
+    for j, (rsp, e) in zip(idxs, rsps):
+        results[j] = (rsp["model_version"], None) if rsp else (None, e)
+    for j, (model_name, version_or_stage) in enumerate(pairs):
+        if results[j] is None:
+            results[j] = _get_latest_version(model_name, version_or_stage)
+    return results
+
+
+def _get_latest_version(model_name, stage):
+    try:
+        rsp = mlflow_client.get_latest_versions(model_name, stage)
+    except MlflowReportsException as e:
+        return None, e
+    versions = rsp.get("model_versions", [])
+    if len(versions) == 0:
+        return None, RuntimeError(f"No '{stage}' stage for model '{model_name}/{stage}'")
+    return versions[0], None
 
 
 def get_reg_model_download_uri(version):
@@ -2,11 +2,11 @@ from mlflow_reports.client.http_client import dbx_20_client
 from mlflow_reports.client import unity_catalog_client as uc_client
 from mlflow_reports.common import MlflowReportsException
 from mlflow_reports.common.mlflow_utils import is_unity_catalog_model
-from mlflow_reports.common.mlflow_utils import is_calling_databricks
+from mlflow_reports.client import capabilities
 from mlflow_reports.common import exception_utils
 
 def add_experiment_permissions(experiment):
-    if not is_calling_databricks():
+    if not capabilities.supports(capabilities.ENDPOINT_PERMISSIONS):
         return
     experiment_id = experiment["experiment_id"]
     _add(experiment,
@@ -16,7 +16,7 @@ def add_experiment_permissions(experiment):
 
 
 def add_model_permissions(reg_model):
-    if not is_calling_databricks():
+    if not capabilities.supports(capabilities.ENDPOINT_PERMISSIONS):
         return
     model_name = reg_model["name"]
     if is_unity_catalog_model(model_name):
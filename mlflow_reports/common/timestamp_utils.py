@@ -13,6 +13,41 @@ def fmt_ts_millis(millis, as_utc=True):
     return fmt_ts_seconds(round(millis/1000), as_utc)
 
 
+def fmt_ts_millis_batch(millis_list):
+    """
+    Vectorized fmt_ts_millis() in UTC for a whole column of timestamps.
+    :param millis_list: List of millisecond timestamps (int or numeric str). Empty values are formatted as None.
+    :return: List of formatted timestamps.
+    """
+    import numpy as np # slow import - only needed for list commands
+    millis = np.array([ int(millis) if millis else 0 for millis in millis_list ], dtype=np.int64)
+    seconds = np.round(millis / 1000).astype(np.int64) # same half-to-even rounding as round() in fmt_ts_millis()
+    return fmt_datetime64_batch(seconds.astype("datetime64[s]"))
+
+
+def fmt_datetime64_batch(values):
+    """
+    Formats a NumPy datetime64 array in UTC at once, e.g. a DataFrame column converted by list_utils.to_datetime().
+    NaT and the epoch are formatted as None as in fmt_ts_seconds().
+    :return: List of formatted timestamps.
+    """
+    import numpy as np
+    if not len(values):
+        return []
+    seconds = values.astype("datetime64[s]")
+    formatted = np.datetime_as_string(seconds, unit="s") # 'YYYY-MM-DDTHH:MM:SS'
+    if formatted.dtype.itemsize == 19 * 4:
+        # Replace 'T' in place in the fixed-width UCS-4 buffer - np.char.replace() loops in Python
+        formatted.view(np.uint32).reshape(-1, 19)[:, 10] = ord(" ")
+    else: # years beyond 9999
+        formatted = np.char.replace(formatted, "T", " ")
+    results = formatted.tolist()
+    empty = np.isnat(seconds) | (seconds.astype(np.int64) == 0)
+    for j in np.flatnonzero(empty).tolist():
+        results[j] = None
+    return results
+
+
 def fmt_ts_seconds(seconds, as_utc=True):
     if not seconds:
         return None
@@ -1,7 +1,7 @@
 from mlflow_reports.common import dump_utils
 from mlflow_reports.common import io_utils
 from mlflow_reports.common import mlflow_utils
-from mlflow_reports.common.timestamp_utils import fmt_ts_millis
+from mlflow_reports.common.timestamp_utils import fmt_ts_millis, fmt_ts_millis_batch, fmt_datetime64_batch
 from mlflow_reports.data import enriched_tags
 
 def dump_object(dct, output_file, silent):
@@ -27,6 +27,23 @@ def adjust_ts(dct, keys):
             format_ts(dct, k)
 
 
+def adjust_ts_batch(dcts, keys, df=None):
+    """
+    Same as adjust_ts() for a list of dicts - each timestamp column is formatted at once.
+    :param df: DataFrame of 'dcts' (same row order) whose timestamp columns were converted by list_utils.to_datetime().
+               Converted columns are formatted from the DataFrame instead of reading each dict.
+    """
+    for k in keys or []:
+        if df is not None and k in df and df[k].dtype.kind == "M":
+            formatted = fmt_datetime64_batch(df[k].to_numpy())
+        else:
+            formatted = fmt_ts_millis_batch([ dct.get(k) for dct in dcts ])
+        key = f"_{k}"
+        for dct, ts in zip(dcts, formatted):
+            if dct.get(k):
+                dct[key] = ts
+
+
 def adjust_uc(reg_model_or_version):
     model_name = reg_model_or_version.get("name")
     reg_model_or_version[enriched_tags.TAG_IS_UNITY_CATALOG] = mlflow_utils.is_unity_catalog_model(model_name)
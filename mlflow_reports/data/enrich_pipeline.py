@@ -0,0 +1,124 @@
+"""
+Composable enrichment pipelines.
+
+A pipeline is a declarative list of steps for one object type (run, experiment, model version, ...).
+Each step is a callable that changes one object in place, so all steps are applied to an object in a single visit
+instead of walking a whole list of objects once per enrichment. Pipeline.map() enriches objects lazily
+as they arrive from a streaming search iterator, so list and get commands share the same path.
+
+Example:
+    pipeline = Pipeline([
+        timestamps("start_time", "end_time", path="info"),
+        link_utils.add_run_links,
+        tags(path="data"),
+        explode()
+    ])
+    for run in pipeline.map(mlflow_client.iter_runs([ experiment_id ])):
+        ...
+"""
+
+from mlflow_reports.common import explode_utils
+from mlflow_reports.data import data_utils
+
+
+class Pipeline:
+    def __init__(self, steps=None):
+        """
+        :param steps: List of callables that take an object and change it in place. None steps are skipped.
+        """
+        self.steps = [ step for step in steps or [] if step is not None ]
+
+    def __call__(self, obj):
+        """
+        Applies all steps to one object.
+        :return: The same object.
+        """
+        for step in self.steps:
+            step(obj)
+        return obj
+
+    def map(self, objects):
+        """
+        Lazily applies all steps to each object of a list or iterator.
+        """
+        for obj in objects:
+            for step in self.steps:
+                step(obj)
+            yield obj
+
+    def __add__(self, other):
+        steps = other.steps if isinstance(other, Pipeline) else other
+        return Pipeline(self.steps + list(steps))
+
+    def __repr__(self):
+        return f"Pipeline({[ getattr(step, '__name__', repr(step)) for step in self.steps ]})"
+
+
+# == Steps
+
+def tags(path=None):
+    """
+    Converts the 'tags' key/value list to a dict.
+    :param path: Dotted path of the sub-dict with the tags, e.g. 'data' for a run.
+    """
+    def _tags(obj):
+        dct = _get_path(obj, path)
+        if dct is not None:
+            data_utils.mk_tags(dct)
+    return _tags
+
+
+def timestamps(*keys, path=None):
+    """
+    Adds a formatted '_<key>' timestamp for each millisecond timestamp key.
+    """
+    def _timestamps(obj):
+        dct = _get_path(obj, path)
+        if dct is not None:
+            data_utils.adjust_ts(dct, keys)
+    return _timestamps
+
+
+def unity_catalog_flag():
+    """
+    Adds whether a registered model or model version is a Unity Catalog model.
+    """
+    return data_utils.adjust_uc
+
+
+def explode(path=None, keys=None):
+    """
+    Explodes JSON string values - see explode_utils.explode_json().
+    """
+    def _explode(obj):
+        dct = _get_path(obj, path)
+        if dct is not None:
+            explode_utils.explode_json(dct, keys)
+    return _explode
+
+
+def defaults(**values):
+    """
+    Sets keys that are not present, e.g. 'description' which the API omits when empty.
+    """
+    def _defaults(obj):
+        for k, v in values.items():
+            obj.setdefault(k, v)
+    return _defaults
+
+
+def drop(*keys):
+    def _drop(obj):
+        for k in keys:
+            obj.pop(k, None)
+    return _drop
+
+
+def _get_path(obj, path):
+    if not path:
+        return obj
+    for k in path.split("."):
+        obj = obj.get(k)
+        if obj is None:
+            return None
+    return obj
@@ -1,11 +1,9 @@
 import click
-import mlflow
 
-from mlflow_reports.client import mlflow_client
+from mlflow_reports.client import mlflow_client, mlflow_auth_utils
 from mlflow_reports.data import get_run as _get_run
 from mlflow_reports.common import mlflow_utils
 from mlflow_reports.common import permissions_utils
-from mlflow_reports.common import explode_utils
 from mlflow_reports.common.click_options import(
     opt_experiment_id_or_name,
     opt_get_runs,
@@ -13,10 +11,12 @@ from mlflow_reports.common.click_options import(
     opt_get_raw,
     opt_artifact_max_level,
     opt_silent,
-    opt_output_file
+    opt_output_file,
+    opt_metrics_file
 )
 from mlflow_reports.data import data_utils, link_utils
 from mlflow_reports.data import enriched_tags
+from mlflow_reports.data import enrich_pipeline
 
 
 def get(
@@ -29,26 +29,36 @@ def get(
     exp = mlflow_utils.get_experiment(experiment_id_or_name)
     experiment_id = exp["experiment_id"]
 
-    rsp = mlflow_client.get_experiment(experiment_id)
+    rsp = { "experiment": exp } # same as experiments/get response
     if get_raw:
         return rsp
 
     experiment = rsp["experiment"]
     dct = { "experiment": experiment }
     if get_runs:
-        runs = mlflow_client.search_runs(experiment_id)
+        _get_run.set_experiment_name(experiment_id, experiment["name"])
+        runs = mlflow_client.iter_runs([ experiment_id ])
         dct["runs"] = [ _get_run.enrich(run, artifact_max_level=artifact_max_level) for run in runs ]
     enrich(experiment, get_permissions)
 
     return dct
 
 
+def _add_tracking_uri(exp):
+    exp[enriched_tags.TAG_TRACKING_URI] = mlflow_auth_utils.get_tracking_uri()
+
+
+pipeline = enrich_pipeline.Pipeline([
+    enrich_pipeline.tags(),
+    enrich_pipeline.timestamps("creation_time", "last_update_time"),
+    _add_tracking_uri,
+    link_utils.add_experiment_links,
+    enrich_pipeline.explode()
+])
+
+
 def enrich(exp, get_permissions=False):
-    data_utils.mk_tags(exp)
-    data_utils.adjust_ts(exp, ["creation_time", "last_update_time"])
-    exp[enriched_tags.TAG_TRACKING_URI] = mlflow.get_tracking_uri()
-    link_utils.add_experiment_links(exp)
-    explode_utils.explode_json(exp)
+    pipeline(exp)
     if get_permissions:
         permissions_utils.add_experiment_permissions(exp)
 
@@ -61,6 +71,7 @@ def enrich(exp, get_permissions=False):
 @opt_get_raw
 @opt_silent
 @opt_output_file
+@opt_metrics_file
 def main(experiment_id_or_name, get_runs, get_permissions, artifact_max_level, get_raw, silent, output_file):
     print("Options:")
     for k,v in locals().items():
@@ -11,7 +11,9 @@ from mlflow_reports.common.click_options import(
     opt_get_run,
     opt_get_raw,
     opt_silent,
-    opt_output_file
+    opt_output_file,
+    opt_max_workers,
+    opt_metrics_file
 )
 from mlflow_reports.data import data_utils
 
@@ -20,7 +22,12 @@ def get(
         model_uri,
         get_run = False,
         get_raw = False,
+        max_workers = 1,
+        artifacts_summary_only = False
     ):
+    """
+    :param artifacts_summary_only: Only compute the model size and artifact counts - do not return the artifact tree.
+    """
     model_info = mlflow_model_utils.get_model_info(model_uri)
     if not isinstance(model_info, dict):
         # NOTE: maybe raise exception instead of return
@@ -33,7 +40,7 @@ def get(
     if model_info_raw:
         dct["mlflow_model_raw"] = model_info_raw
 
-    _calc_model_size(model_info, model_uri)
+    _calc_model_size(model_info, model_uri, max_workers, artifacts_summary_only)
 
     if get_run:
         run_id = model_info.get("run_id")
@@ -48,7 +55,7 @@ def get(
     return dct
 
 
-def _calc_model_size(model_info, model_uri):
+def _calc_model_size(model_info, model_uri, max_workers=1, summary_only=False):
     """
     Calculate model size in bytes.
     Sum up the artifact sizes in the run MLflow model artifact directory.
@@ -60,10 +67,12 @@ def _calc_model_size(model_info, model_uri):
         model_info["model_size_bytes"] = -1
     else:
         try:
-            artifacts = mlflow_utils.build_artifacts(
+            _build_artifacts = mlflow_utils.build_artifacts_summary if summary_only else mlflow_utils.build_artifacts
+            artifacts = _build_artifacts(
                 run_id,
                 model_info["artifact_path"],
-                sys.maxsize)
+                sys.maxsize,
+                max_workers=max_workers)
             model_info["model_size_bytes"] = artifacts["summary"]["num_bytes"]
             model_info["artifacts"] = artifacts
         except MlflowReportsException as e:
@@ -107,12 +116,14 @@ def _get_raw_model(model_uri, model_info):
 @opt_get_raw
 @opt_silent
 @opt_output_file
+@opt_max_workers
+@opt_metrics_file
 
-def main(model_uri, get_run, get_raw, silent, output_file):
+def main(model_uri, get_run, get_raw, silent, output_file, max_workers):
     print("Options:")
     for k,v in locals().items():
         print(f"  {k}: {v}")
-    dct = get(model_uri, get_run, get_raw)
+    dct = get(model_uri, get_run, get_raw, max_workers)
     data_utils.dump_object(dct, output_file, silent)
 
 
@@ -13,11 +13,13 @@ from mlflow_reports.common.click_options import(
     opt_artifact_max_level,
     opt_get_raw,
     opt_silent,
-    opt_output_file
+    opt_output_file,
+    opt_metrics_file
 )
 from mlflow_reports.data import get_run as _get_run
 from mlflow_reports.data import data_utils, link_utils
 from mlflow_reports.data import enriched_tags
+from mlflow_reports.data import enrich_pipeline
 
 
 def get(
@@ -50,8 +52,7 @@ def get(
     return dct
 
 
-def enrich(vr):
-    data_utils.mk_tags(vr)
+def _add_transition_requests(vr):
     if mlflow_utils.is_calling_databricks() and not mlflow_utils.is_unity_catalog_model(vr["name"]):
         try:
             rsp = mlflow_client.get_transition_requests(vr["name"], vr["version"])
@@ -60,11 +61,40 @@ def enrich(vr):
         except MlflowReportsException as e:
             print(f"WARNING: Databricks API call failed: {e}")
 
-    data_utils.adjust_ts(vr, [ "creation_timestamp", "last_updated_timestamp" ])
-    data_utils.adjust_uc(vr)
+
+def _add_download_uris(vr):
     vr[enriched_tags.TAG_REG_MODEL_DOWNLOAD_URI] = get_reg_model_download_uri(vr)
     vr[enriched_tags.TAG_RUN_MODEL_DOWNLOAD_URI] = get_run_model_download_uri(vr)
-    link_utils.add_model_version_links(vr)
+
+
+def _add_run_download_uri(vr):
+    vr[enriched_tags.TAG_RUN_MODEL_DOWNLOAD_URI] = get_run_model_download_uri(vr)
+
+
+def mk_pipeline(get_download_uri=True, get_transition_requests=True):
+    """
+    :param get_download_uri: Call 'get-download-uri' for the registry download URI of the model.
+    :param get_transition_requests: Call 'transition-requests/list' for non-UC Databricks models.
+    :return: Model version enrichment pipeline without the skipped API calls.
+    """
+    return enrich_pipeline.Pipeline([
+        enrich_pipeline.tags(),
+        _add_transition_requests if get_transition_requests else None,
+        enrich_pipeline.timestamps("creation_timestamp", "last_updated_timestamp"),
+        enrich_pipeline.unity_catalog_flag(),
+        _add_download_uris if get_download_uri else _add_run_download_uri,
+        link_utils.add_model_version_links
+    ])
+
+
+pipeline = mk_pipeline()
+
+
+def enrich(vr, get_download_uri=True, get_transition_requests=True):
+    if get_download_uri and get_transition_requests:
+        pipeline(vr)
+    else:
+        mk_pipeline(get_download_uri, get_transition_requests)(vr)
 
 
 def _get_mlmodel(registered_model_name, version):
@@ -101,6 +131,7 @@ def _get_vr_run(dct, artifact_max_level):
 @opt_get_raw
 @opt_silent
 @opt_output_file
+@opt_metrics_file
 def main(registered_model, version, artifact_max_level, get_expanded, get_raw, silent, output_file):
     print("Options:")
     for k,v in locals().items():
@@ -3,19 +3,26 @@ from mlflow_reports.client import mlflow_client
 from mlflow_reports.common import MlflowReportsException
 from mlflow_reports.common import mlflow_utils
 from mlflow_reports.common import permissions_utils
+from mlflow_reports.common import concurrency_utils
 from mlflow_reports.common.click_options import(
     opt_registered_model,
     opt_get_versions,
     opt_get_latest_versions,
+    opt_enrich_versions,
+    opt_get_download_uri,
+    opt_get_transition_requests,
     opt_get_run,
     opt_get_permissions,
     opt_artifact_max_level,
     opt_get_raw,
     opt_silent,
-    opt_output_file
+    opt_output_file,
+    opt_metrics_file,
+    opt_max_workers
 )
 from mlflow_reports.data import get_run, get_model_version
 from mlflow_reports.data import data_utils, link_utils
+from mlflow_reports.data import enrich_pipeline
 
 
 def get(
@@ -26,13 +33,24 @@ def get(
         get_latest_versions = False,
         get_permissions = False,
         get_raw = False,
+        enrich_versions = False,
+        get_download_uri = True,
+        get_transition_requests = True,
+        max_workers = 1
     ):
+    """
+    :param enrich_versions: Enrich the versions of 'get_versions'.
+    :param get_download_uri: When enriching versions, call 'get-download-uri' for each version.
+    :param get_transition_requests: When enriching non-UC Databricks versions, get the transition requests of each version.
+    :param max_workers: Number of versions enriched concurrently.
+    """
     if get_raw:
         return mlflow_client.get_registered_model(model_name)
 
     reg_model = mlflow_utils.get_registered_model(model_name, get_permissions)
     dct = { "registered_model": reg_model }
-    dct["versions"] = enrich(reg_model, get_permissions, get_versions)
+    dct["versions"] = enrich(reg_model, get_permissions, get_versions, enrich_versions,
+        get_download_uri, get_transition_requests, max_workers)
     if get_run:
         _get_runs(dct, artifact_max_level)
     if not get_latest_versions:
@@ -40,24 +58,41 @@ def get(
     return dct
 
 
-def enrich(reg_model, get_permissions=False, get_versions=False, enrich_versions=False):
-    model_name = reg_model["name"]
+def _mk_tags(reg_model):
     reg_model["tags"] = mlflow_utils.mk_tags_dict(reg_model.get("tags"))
-    data_utils.adjust_ts(reg_model, [ "creation_timestamp", "last_updated_timestamp" ])
-    data_utils.adjust_uc(reg_model)
-    link_utils.add_registered_model_links(reg_model)
+
+
+pipeline = enrich_pipeline.Pipeline([
+    _mk_tags,
+    enrich_pipeline.timestamps("creation_timestamp", "last_updated_timestamp"),
+    enrich_pipeline.unity_catalog_flag(),
+    link_utils.add_registered_model_links
+])
+
+
+def enrich(reg_model, get_permissions=False, get_versions=False, enrich_versions=False,
+        get_download_uri=True, get_transition_requests=True, max_workers=1
+    ):
+    """
+    :param get_download_uri: Skip the 'get-download-uri' call of each enriched version if False.
+    :param get_transition_requests: Skip the 'transition-requests/list' call of each enriched version if False.
+    :param max_workers: Number of versions enriched concurrently. Each enrichment makes up to two API calls.
+    """
+    model_name = reg_model["name"]
+    pipeline(reg_model)
+    vr_pipeline = get_model_version.mk_pipeline(get_download_uri, get_transition_requests)
 
     # get all versions
     if get_versions:
-        versions = mlflow_client.search_model_versions(filter=f"name = '{model_name}'")
+        versions = mlflow_client.iter_model_versions(filter=f"name = '{model_name}'")
+        if enrich_versions and max_workers > 1:
+            versions = _enrich_versions(vr_pipeline, list(versions), max_workers)
+        elif enrich_versions:
+            versions = vr_pipeline.map(versions)
         versions = list(versions)
-        if enrich_versions:
-            for vr in versions:
-                get_model_version.enrich(vr)
 
         if not mlflow_utils.is_unity_catalog_model(model_name):
-            for vr in reg_model.get("latest_versions",[]):
-                get_model_version.enrich(vr)
+            _enrich_versions(vr_pipeline, reg_model.get("latest_versions",[]), max_workers)
     else:
         versions = []
     if get_permissions and mlflow_utils.is_calling_databricks():
@@ -65,6 +100,17 @@ def enrich(reg_model, get_permissions=False, get_versions=False, enrich_versions
     return versions
 
 
+def _enrich_versions(vr_pipeline, versions, max_workers):
+    """
+    Enriches versions in place with a bounded thread pool. Raises the first failure as the sequential path would.
+    """
+    results = concurrency_utils.map_ordered(vr_pipeline, versions, max_workers)
+    for _, e in results:
+        if e:
+            raise e
+    return versions
+
+
 def _get_runs(dct, artifact_max_level):
     runs = {}
     for vr in dct.get("versions"):
@@ -82,15 +128,24 @@ def _get_runs(dct, artifact_max_level):
 @opt_artifact_max_level
 @opt_get_versions
 @opt_get_latest_versions
+@opt_enrich_versions
+@opt_get_download_uri
+@opt_get_transition_requests
+@opt_max_workers
 @opt_get_permissions
 @opt_get_raw
 @opt_silent
 @opt_output_file
+@opt_metrics_file
 def main(registered_model,
         get_run,
         artifact_max_level,
         get_versions,
         get_latest_versions,
+        enrich_versions,
+        get_download_uri,
+        get_transition_requests,
+        max_workers,
         get_permissions,
         get_raw,
         silent,
@@ -107,6 +162,10 @@ def main(registered_model,
         get_latest_versions = get_latest_versions,
         get_permissions = get_permissions,
         get_raw = get_raw,
+        enrich_versions = enrich_versions,
+        get_download_uri = get_download_uri,
+        get_transition_requests = get_transition_requests,
+        max_workers = max_workers
     )
     data_utils.dump_object(dct, output_file, silent)
 
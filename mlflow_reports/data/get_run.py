@@ -1,16 +1,21 @@
 import click
 
 from mlflow_reports.client import mlflow_client
-from mlflow_reports.common import mlflow_utils, explode_utils
+from mlflow_reports.common import mlflow_utils
 from mlflow_reports.common.click_options import(
     opt_run_id,
     opt_get_raw,
     opt_artifact_max_level,
     opt_silent,
-    opt_output_file
+    opt_output_file,
+    opt_metrics_file
 )
 from mlflow_reports.data import data_utils, link_utils
 from mlflow_reports.data import enriched_tags
+from mlflow_reports.data import enrich_pipeline
+
+# Per-session lookup table of experiment ID to experiment name
+_experiment_names = {}
 
 
 def get(run_id, artifact_max_level=-1, get_raw=False):
@@ -34,24 +39,45 @@ def enrich(run, artifact_max_level=-1):
         artifacts = mlflow_utils.build_artifacts(run["info"]["run_id"], "", artifact_max_level)
         dct["artifacts"] = artifacts
 
-    _adjust_times(run)
-    link_utils.add_run_links(run)
-    data_utils.mk_tags(run["data"])
-    explode_utils.explode_json(dct)
-
+    pipeline(run)
     return dct
 
 
 def _adjust_times(run):
     info = run["info"]
-    data_utils.adjust_ts(info,["start_time", "end_time"])
     start = info.get("start_time")
     end = info.get("end_time")
     if start and end:
         dur = float(int(end) - int(start))/1000
         info[enriched_tags.TAG_DURATION] = dur
-    exp = mlflow_client.get_experiment(info["experiment_id"])["experiment"]
-    run["info"][enriched_tags.TAG_EXPERIMENT_NAME] = exp["name"]
+    run["info"][enriched_tags.TAG_EXPERIMENT_NAME] = get_experiment_name(info["experiment_id"])
+
+
+pipeline = enrich_pipeline.Pipeline([
+    enrich_pipeline.timestamps("start_time", "end_time", path="info"),
+    _adjust_times,
+    link_utils.add_run_links,
+    enrich_pipeline.tags(path="data"),
+    enrich_pipeline.explode()
+])
+
+
+def get_experiment_name(experiment_id):
+    """
+    Returns the experiment name, calling the API only the first time an experiment ID is seen.
+    """
+    name = _experiment_names.get(experiment_id)
+    if name is None:
+        name = mlflow_client.get_experiment(experiment_id)["experiment"]["name"]
+        _experiment_names[experiment_id] = name
+    return name
+
+
+def set_experiment_name(experiment_id, name):
+    """
+    Pre-seeds the experiment name lookup table when the caller already has the experiment.
+    """
+    _experiment_names[experiment_id] = name
 
 
 @click.command()
@@ -60,6 +86,7 @@ def _adjust_times(run):
 @opt_get_raw
 @opt_silent
 @opt_output_file
+@opt_metrics_file
 
 def main(run_id, artifact_max_level, get_raw, silent, output_file):
     print("Options:")
@@ -1,11 +1,15 @@
-from mlflow.utils.databricks_utils import get_workspace_info_from_dbutils
+import functools
 from mlflow_reports.client.http_client import get_mlflow_client
 from mlflow_reports.common.mlflow_utils import is_unity_catalog_model
 
 
-mlflow_client = get_mlflow_client()
+@functools.lru_cache(maxsize=None)
+def _get_mlflow_client():
+    """
+    Resolved on first use so that importing does not look up credentials or probe the tracking server.
+    """
+    return get_mlflow_client()
 
-_workspace_host, _workspace_id = get_workspace_info_from_dbutils()
 
 _UI_LINK_TAG = "_web_ui_link"
 _API_LINK_TAG= "_api_link"
@@ -19,7 +23,7 @@ def add_run_links(run):
     run_id = info["run_id"]
     link = f"{_get_mlflow_ui_base()}/experiments/{experiment_id}/runs/{run_id}"
     run["info"][_UI_LINK_TAG] = link
-    link = f"{mlflow_client.get_api_uri()}/runs/get?run_id={run_id}"
+    link = f"{_get_mlflow_client().get_api_uri()}/runs/get?run_id={run_id}"
     run["info"][_API_LINK_TAG] = link
 
 
@@ -27,7 +31,7 @@ def add_experiment_links(exp):
     experiment_id = exp["experiment_id"]
     link = f"{_get_mlflow_ui_base()}/experiments/{experiment_id}"
     exp[_UI_LINK_TAG] = link
-    link = f"{mlflow_client.get_api_uri()}/experiments/get?experiment_id={experiment_id}"
+    link = f"{_get_mlflow_client().get_api_uri()}/experiments/get?experiment_id={experiment_id}"
     exp[_API_LINK_TAG] = link
 
 
@@ -64,7 +68,7 @@ def _mk_uc_links(dct, model_name, version=None):
     else:
         resource = "registered-models"
     qp = urlencode(params)
-    api_link = f"{mlflow_client.get_api_uri()}/{uc_component}{resource}/get?{qp}"
+    api_link = f"{_get_mlflow_client().get_api_uri()}/{uc_component}{resource}/get?{qp}"
 
     dct[_UI_LINK_TAG] = ui_link
     dct[_API_LINK_TAG] = api_link
@@ -75,10 +79,11 @@ def _get_mlflow_ui_base():
     Databricks: https://e2-demo-west.cloud.databricks.com#mlflow
     """
     mlflow_uri = _get_host_name()
-    if _workspace_host: # inside Databricks, e.g. "https://c3-south.mist.databricks.com"
-        mlflow_uri = f"{_workspace_host}#mlflow"
+    workspace_host, _ = _get_workspace_info()
+    if workspace_host: # inside Databricks, e.g. "https://c3-south.mist.databricks.com"
+        mlflow_uri = f"{workspace_host}#mlflow"
     else:
-        if not mlflow_client.get_token(): # calling MLflow OSS tracking server
+        if not _get_mlflow_client().get_token(): # calling MLflow OSS tracking server
             mlflow_uri += "#" # for open source
         else: # calling Databricks externally
             mlflow_uri += "#mlflow"
@@ -89,6 +94,14 @@ def _get_host_name():
     OSS:        http://localhost:5020
     Databricks: https://e2-demo-west.cloud.databricks.com
     """
-    client_uri = mlflow_client.get_api_uri()
+    client_uri = _get_mlflow_client().get_api_uri()
     idx = client_uri.find("/api/")
     return client_uri[0:idx]
+
+@functools.lru_cache(maxsize=None)
+def _get_workspace_info():
+    """
+    Returns (workspace_host, workspace_id) when running inside Databricks - looked up on first use.
+    """
+    from mlflow.utils.databricks_utils import get_workspace_info_from_dbutils
+    return get_workspace_info_from_dbutils()
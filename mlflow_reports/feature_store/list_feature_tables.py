@@ -6,16 +6,14 @@ Calls undocumented Databricks endpoint 'api/2.0/feature-store/feature-tables/sea
 from typing import Optional, List
 import click
 
-from mlflow_reports.client.http_client import get_mlflow_client
 from . import search_feature_tables
 from mlflow_reports.list import list_utils
+from mlflow_reports.common.click_options import opt_metrics_file
 from mlflow_reports.list.click_options import (
     opt_columns,
     opt_output_csv_file,
 )
 
-mlflow_client = get_mlflow_client()
-
 
 def show(columns: List, output_csv_file: Optional[str]):
     df = search_feature_tables.search_as_pandas_df()
@@ -28,6 +26,7 @@ def show(columns: List, output_csv_file: Optional[str]):
 @click.command()
 @opt_columns
 @opt_output_csv_file
+@opt_metrics_file
 
 def main(
         columns,
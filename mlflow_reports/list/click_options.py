@@ -127,3 +127,11 @@ def opt_normalize_pandas_df(function):
         default=False
     )(function)
     return function
+
+def opt_stream(function):
+    function = click.option("--stream",
+        help="Stream objects to the CSV and JSON files as they arrive instead of collecting them first. Keeps memory flat but does not display a table. Without '--columns' the CSV columns are the keys of the first object.",
+        type=bool,
+        default=False
+    )(function)
+    return function
@@ -5,7 +5,7 @@ List all experiments.
 import click
 
 from mlflow_reports.common import io_utils
-from mlflow_reports.common.click_options import opt_output_file_base
+from mlflow_reports.common.click_options import opt_output_file_base, opt_metrics_file
 from . click_options import (
     opt_filter,
     opt_tags_and_aliases_as_string,
@@ -13,6 +13,7 @@ from . click_options import (
     opt_columns,
     opt_max_description,
     opt_view_type,
+    opt_stream
 )
 from . import search_experiments
 
@@ -23,15 +24,21 @@ def show(filter,
         max_results,
         columns,
         max_description,
-        output_file_base
+        output_file_base,
+        stream = False
     ):
     if isinstance(columns, str):
         columns = columns.split(",")
+    ts_columns = [ "creation_time", "last_update_time" ]
+    if stream:
+        experiments = search_experiments.iter_search(filter, view_type, max_results, tags_and_aliases_as_string)
+        num_experiments = io_utils.write_csv_and_json_files_streaming(output_file_base, experiments, columns, ts_columns)
+        print(f"Found {num_experiments} experiments")
+        return
     experiments = search_experiments.search(filter, view_type, max_results)
     df = search_experiments.to_pandas_df(experiments)
     if "description" in df and max_description:
         df["description"] = df["description"].str[:max_description]
-    ts_columns = [ "creation_time", "last_update_time" ]
     io_utils.write_csv_and_json_files(output_file_base, experiments, columns, ts_columns)
     print(f"Found {len(experiments)} experiments")
 
@@ -44,6 +51,8 @@ def show(filter,
 @opt_columns
 @opt_max_description
 @opt_output_file_base
+@opt_stream
+@opt_metrics_file
 
 def main(
         filter,
@@ -52,7 +61,8 @@ def main(
         tags_and_aliases_as_string,
         columns,
         max_description,
-        output_file_base
+        output_file_base,
+        stream
     ):
     print("Options:")
     args = locals()
@@ -4,7 +4,7 @@ List model versions.
 
 import click
 from mlflow_reports.common import io_utils
-from mlflow_reports.common.click_options import opt_output_file_base
+from mlflow_reports.common.click_options import opt_output_file_base, opt_max_workers, opt_metrics_file
 from . import search_model_versions
 from . click_options import (
     opt_filter,
@@ -12,7 +12,8 @@ from . click_options import (
     opt_get_model_details,
     opt_unity_catalog,
     opt_columns,
-    opt_max_description
+    opt_max_description,
+    opt_stream
 )
 
 
@@ -22,13 +23,27 @@ def show(filter,
         unity_catalog,
         columns,
         max_description,
-        output_file_base
+        output_file_base,
+        max_workers = 1,
+        stream = False
     ):
+    if stream:
+        versions = search_model_versions.iter_search(
+            filter = filter,
+            get_tags_and_aliases = get_tags_and_aliases,
+            get_model_details = get_model_details,
+            unity_catalog = unity_catalog,
+            max_workers = max_workers
+        )
+        num_versions = io_utils.write_csv_and_json_files_streaming(output_file_base, versions, columns)
+        print(f"Found {num_versions} model versions")
+        return
     versions = search_model_versions.search(
         filter = filter,
         get_tags_and_aliases = get_tags_and_aliases,
         get_model_details = get_model_details,
-        unity_catalog = unity_catalog
+        unity_catalog = unity_catalog,
+        max_workers = max_workers
     )
     df = search_model_versions.to_pandas_df(versions)
     if "description" in df and max_description:
@@ -47,6 +62,9 @@ def show(filter,
 @opt_columns
 @opt_max_description
 @opt_output_file_base
+@opt_max_workers
+@opt_stream
+@opt_metrics_file
 
 def main(
         filter,
@@ -55,7 +73,9 @@ def main(
         unity_catalog,
         columns,
         max_description,
-        output_file_base
+        output_file_base,
+        max_workers,
+        stream
     ):
     print("Options:")
     args = locals()
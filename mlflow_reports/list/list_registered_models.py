@@ -4,7 +4,7 @@ List all registered models.
 
 import click
 from mlflow_reports.common import io_utils
-from mlflow_reports.common.click_options import opt_output_file_base
+from mlflow_reports.common.click_options import opt_output_file_base, opt_max_workers, opt_metrics_file
 from mlflow_reports.list import search_registered_models
 from mlflow_reports.list.click_options import (
     opt_filter,
@@ -22,11 +22,12 @@ def show(filter,
         unity_catalog,
         columns,
         max_description,
-        output_file_base
+        output_file_base,
+        max_workers = 1
     ):
     if isinstance(columns, str):
         columns = columns.split(",")
-    models = search_registered_models.search(filter, get_tags_and_aliases, unity_catalog)
+    models = search_registered_models.search(filter, get_tags_and_aliases, unity_catalog, max_workers)
     print(f"Found {len(models)} registered models")
 
     df = search_registered_models.to_pandas_df(models, prefix=prefix)
@@ -44,6 +45,8 @@ def show(filter,
 @opt_columns
 @opt_max_description
 @opt_output_file_base
+@opt_max_workers
+@opt_metrics_file
 
 def main(
         filter,
@@ -52,7 +55,8 @@ def main(
         unity_catalog,
         columns,
         max_description,
-        output_file_base
+        output_file_base,
+        max_workers
     ):
     print("Options:")
     args = locals()
@@ -6,6 +6,7 @@ import numpy as np
 import pandas as pd
 from mlflow_reports.client import mlflow_client
 from mlflow_reports.common import mlflow_utils
+from mlflow_reports.data import enrich_pipeline
 from . import list_utils
 
 
@@ -16,6 +17,16 @@ def search(filter=None, view_type=None, max_results=None):
     return experiments
 
 
+def iter_search(filter=None, view_type=None, max_results=None, tags_and_aliases_as_string=False):
+    """
+    Streaming version of search(). Yields experiments as they are parsed from the search response.
+    """
+    pipeline = enrich_pipeline.Pipeline([
+        lambda exp: list_utils.kv_list_to_dict(exp, "tags", mlflow_utils.mk_tags_dict, tags_and_aliases_as_string)
+    ])
+    yield from pipeline.map(mlflow_client.iter_experiments(filter, view_type, max_results, stream_pages=True))
+
+
 def to_pandas_df(experiments, tags_and_aliases_as_string=False):
     if len(experiments) == 0:
         return pd.DataFrame()
@@ -4,11 +4,11 @@ Search for model versions and return Pandas DataFrame.
 
 import numpy as np
 import pandas as pd
-import mlflow
 
 from mlflow_reports.data import get_mlflow_model
-from mlflow_reports.client import mlflow_client
-from mlflow_reports.common import mlflow_utils
+from mlflow_reports.data import enrich_pipeline
+from mlflow_reports.client import mlflow_client, capabilities
+from mlflow_reports.common import mlflow_utils, concurrency_utils, exception_utils
 from . import list_utils
 
 
@@ -16,16 +16,38 @@ def search(
         filter = None,
         get_tags_and_aliases = False,
         get_model_details = False,
-        unity_catalog = False
+        unity_catalog = False,
+        max_workers = 1
     ):
     mlflow_utils.use_unity_catalog(unity_catalog)
-    if mlflow_utils.is_calling_databricks():
-        versions = _list_model_versions_databricks(filter, get_tags_and_aliases, get_model_details)
+    if not capabilities.supports(capabilities.ENDPOINT_SEARCH_ALL_MODEL_VERSIONS):
+        versions = _list_model_versions_databricks(filter, get_tags_and_aliases, get_model_details, max_workers)
     else:
-        versions = _list_model_versions(filter, get_tags_and_aliases, get_model_details)
+        versions = _list_model_versions(filter, get_tags_and_aliases, get_model_details, max_workers)
     return versions
 
 
+def iter_search(
+        filter = None,
+        get_tags_and_aliases = False,
+        get_model_details = False,
+        unity_catalog = False,
+        max_workers = 1
+    ):
+    """
+    Streaming version of search(). Yields model versions as search pages arrive.
+    """
+    mlflow_utils.use_unity_catalog(unity_catalog)
+    if not filter and not capabilities.supports(capabilities.ENDPOINT_SEARCH_ALL_MODEL_VERSIONS):
+        # Databricks requires a model name in the filter - see _list_model_versions_databricks()
+        filters = ( f"name='{model['name']}'" for model in mlflow_client.iter_registered_models() )
+    else:
+        filters = [ filter ]
+    pipeline = _mk_pipeline(get_tags_and_aliases, get_model_details, max_workers)
+    for _filter in filters:
+        yield from pipeline.map(mlflow_utils.iter_model_versions(_filter, get_tags_and_aliases, max_workers))
+
+
 def to_pandas_df(versions):
     if len(versions) == 0:
         return pd.DataFrame()
@@ -36,10 +58,12 @@ def to_pandas_df(versions):
     return df
 
 
-def _list_model_versions_databricks(filter, get_tags_and_aliases, get_model_details):
+def _list_model_versions_databricks(filter, get_tags_and_aliases, get_model_details, max_workers=1):
     """
     Databricks search_model_version differs from OSS one in that it requires a filter.
     So to fetch all versions of all models, we have to loop over all models first.
+    With max_workers > 1, the per-model searches run concurrently and the results are merged in model search order.
+    A model whose search API call fails is returned as a row with an 'error' key instead of aborting the listing.
 
     https://github.com/mlflow/mlflow/issues/7967
     [BUG] search_model_versions request contract differs between OSS and Databricks - 2023-03-06
@@ -49,48 +73,65 @@ def _list_model_versions_databricks(filter, get_tags_and_aliases, get_model_deta
     """
 
     if filter:
-        return _list_model_versions(filter, get_tags_and_aliases, get_model_details)
+        return _list_model_versions(filter, get_tags_and_aliases, get_model_details, max_workers)
 
     models = mlflow_client.search_registered_models()
     num_models = len(models)
     print(f"Found {num_models} models")
-    versions = []
-    for j, model in enumerate(models):
-        print(f"Processing {j+1}/{num_models} model '{model['name']}'")
+
+    def _list(model):
         filter = f"name='{model['name']}'"
-        vrs = _list_model_versions(filter, get_tags_and_aliases, get_model_details)
-        if vrs:
+        # Avoid nested thread pools - models are processed concurrently so each model's versions are processed sequentially
+        return _list_model_versions(filter, get_tags_and_aliases, get_model_details, 1)
+
+    results = concurrency_utils.map_ordered(
+        _list,
+        models,
+        max_workers,
+        progress_title = "model-versions/search"
+    )
+    versions = []
+    for model, (vrs, e) in zip(models, results):
+        if e:
+            msg = f"Cannot list versions of model '{model['name']}'"
+            print(f"ERROR: {msg}. Ex: {e}")
+            versions.append({ "name": model["name"], **exception_utils.to_dict(e, msg) })
+        elif vrs:
             versions += vrs
     print(f"Found {len(versions)} model versions")
     return versions
 
 
-def _list_model_versions(filter, get_tags_and_aliases, get_model_details):
+def _list_model_versions(filter, get_tags_and_aliases, get_model_details, max_workers=1):
     """
     Standard OSS search_model_version documented filter.
     """
-    versions = mlflow_utils.search_model_versions(filter, get_tags_and_aliases)
+    versions = mlflow_utils.search_model_versions(filter, get_tags_and_aliases, max_workers)
     if len(versions) == 0:
         print(f"WARNING: No model versions. Filter: '{filter}'")
         return []
-    for vr in versions:
-        vr["description"] = vr.get("description","") # NOTE: not present if empty
-        vr["user_id"] = vr.get("user_id","") # NOTE: not present if empty
-        if not get_tags_and_aliases:
-            vr.pop("tags", None)
-        if get_model_details:
-            flavor, size = _get_model_details(vr)
-            vr["model_flavor"] = flavor
-            vr["model_size"] = size
+    versions = list(_mk_pipeline(get_tags_and_aliases, get_model_details, max_workers).map(versions))
     sfilter = f'for filter "{filter}"' if filter else ""
     print(f"Found {len(versions)} model versions {sfilter}")
     return versions
 
 
-def _get_model_details(vr):
+def _mk_pipeline(get_tags_and_aliases, get_model_details, max_workers=1):
+    steps = [ enrich_pipeline.defaults(description="", user_id="") ] # NOTE: not present if empty
+    if not get_tags_and_aliases:
+        steps.append(enrich_pipeline.drop("tags"))
+    if get_model_details:
+        def _add_model_details(vr):
+            vr["model_flavor"], vr["model_size"] = _get_model_details(vr, max_workers)
+        steps.append(_add_model_details)
+    return enrich_pipeline.Pipeline(steps)
+
+
+def _get_model_details(vr, max_workers=1):
+    import mlflow # already loaded by get_mlflow_model.get() to download artifacts
     model_uri = f"models:/{vr['name']}/{vr['version']}"
     try:
-        mlflow_model = get_mlflow_model.get(model_uri)
+        mlflow_model = get_mlflow_model.get(model_uri, max_workers=max_workers, artifacts_summary_only=True)
         mlflow_model = mlflow_model.get("mlflow_model")
         return mlflow_model.get("model_flavor"), mlflow_model.get("model_size_bytes")
     except mlflow.exceptions.MlflowException as e:
@@ -9,12 +9,12 @@ from mlflow_reports.common import mlflow_utils
 from . import list_utils
 
 
-def search(filter=None, get_tags_and_aliases=False, unity_catalog=False):
+def search(filter=None, get_tags_and_aliases=False, unity_catalog=False, max_workers=1):
     """
     :return: Returns registered models as list of Dicts.
     """
     mlflow_utils.use_unity_catalog(unity_catalog)
-    models = mlflow_utils.search_registered_models(filter, get_tags_and_aliases)
+    models = mlflow_utils.search_registered_models(filter, get_tags_and_aliases, max_workers)
     print(f"Found {len(models)} registered models")
     models = sorted(models, key=lambda x: x["name"])
     return models
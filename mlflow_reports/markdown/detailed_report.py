@@ -3,11 +3,13 @@ import copy
 from mdutils.mdutils import MdUtils
 
 from mlflow_reports.mlflow_model import mlflow_model_manager as model_manager
+from mlflow_reports.client import response_cache
 from mlflow_reports.common import mlflow_utils, io_utils, timestamp_utils, dump_utils
 from mlflow_reports.common.click_options import(
     opt_model_uri,
     opt_output_file,
-    opt_get_permissions
+    opt_get_permissions,
+    opt_metrics_file
 )
 from mlflow_reports.markdown.report_factory import ReportFactory, TAG_COLUMNS
 from mlflow_reports.markdown.local_utils import newline_tweak, is_primitive, escape_dict
@@ -332,12 +334,16 @@ def _build_tags(wf, tags, level):
      show_default=True
 )
 @opt_get_permissions
+@opt_metrics_file
 
 def main(model_uri, show_as_json, show_manifest, output_file, output_data_file, get_permissions):
     print("Options:")
     for k,v in locals().items():
         print(f"  {k}: {v}")
     build_report(model_uri, get_permissions, output_file, output_data_file, show_as_json, show_manifest)
+    cache = response_cache.get_cache()
+    if cache:
+        print("Response cache stats:", cache.get_stats()["totals"])
 
 if __name__ == "__main__":
     main()
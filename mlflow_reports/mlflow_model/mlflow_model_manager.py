@@ -1,5 +1,4 @@
 import click
-import mlflow
 
 from mlflow_reports.common import MlflowReportsException
 from mlflow_reports.common import (
@@ -12,7 +11,8 @@ from mlflow_reports.common.click_options import(
     opt_get_permissions,
     opt_get_raw,
     opt_silent,
-    opt_output_file
+    opt_output_file,
+    opt_metrics_file
 )
 from mlflow_reports.data import get_mlflow_model as _get_mlflow_model
 from mlflow_reports.data import (
@@ -41,6 +41,7 @@ def get(
 
 
 def _get_data_from_api(model_uri, get_permissions=False, get_raw=False):
+    import mlflow # already loaded by _get_mlflow_model.get() to download artifacts
     scheme = _get_scheme(model_uri)
     _mlflow_model = _get_mlflow_model.get(model_uri, get_raw=get_raw)
     mlflow_model = _mlflow_model.get("mlflow_model")
@@ -124,6 +125,7 @@ def _get_scheme(path):
 @opt_get_raw
 @opt_silent
 @opt_output_file
+@opt_metrics_file
 
 def main(model_uri, get_permissions, get_raw, silent, output_file):
     print("Options:")
@@ -1,6 +1,3 @@
-from mlflow.artifacts import download_artifacts
-from mlflow.utils.file_utils import TempDir
-
 from mlflow_reports.common import io_utils, explode_utils, exception_utils
 
 
@@ -17,7 +14,8 @@ def get_model_artifact(model_uri, artifact_path, file_type=None, explode_json=Tr
     """
     Returns contents of an artifact as a Python object.
     """
-
+    from mlflow.artifacts import download_artifacts
+    from mlflow.utils.file_utils import TempDir
     artifact_uri = f"{model_uri}/{artifact_path}"
     try:
         with TempDir() as tmp:
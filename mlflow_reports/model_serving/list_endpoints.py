@@ -4,6 +4,7 @@ import pandas as pd
 from mlflow_reports.client.model_serving_client import ModelServingClient
 from mlflow_reports.list.click_options import opt_columns, opt_output_csv_file
 from mlflow_reports.list import list_utils
+from mlflow_reports.common.click_options import opt_metrics_file
 
 client = ModelServingClient()
 
@@ -18,6 +19,7 @@ def create_pandas_df():
 @click.command()
 @opt_columns
 @opt_output_csv_file
+@opt_metrics_file
 def main(columns, output_csv_file):
     print("Options:")
     for k,v in locals().items():
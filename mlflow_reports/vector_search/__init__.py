@@ -1,7 +1,12 @@
-from databricks.vector_search.client import VectorSearchClient
+import functools
 from mlflow_reports.client import mlflow_auth_utils
 
 
+@functools.lru_cache(maxsize=None)
 def get_VectorSearchClient():
+    """
+    Returns the shared VectorSearchClient, created on first use.
+    """
+    from databricks.vector_search.client import VectorSearchClient
     host, token = mlflow_auth_utils.get_mlflow_host_token()
     return VectorSearchClient(disable_notice=True, workspace_url=host, personal_access_token=token)
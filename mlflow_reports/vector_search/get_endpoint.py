@@ -5,11 +5,9 @@ from mlflow_reports.model_serving.click_options import opt_endpoint
 from mlflow_reports.common.click_options import opt_get_raw, opt_silent, opt_output_file
 from . import get_VectorSearchClient
 
-client = get_VectorSearchClient()
-
 
 def get(endpoint_name, get_raw):
-    endpoint = client.get_endpoint(endpoint_name)
+    endpoint = get_VectorSearchClient().get_endpoint(endpoint_name)
     if not get_raw:
         data_utils.adjust_ts(endpoint, ["creation_timestamp", "last_updated_timestamp"])
     return endpoint
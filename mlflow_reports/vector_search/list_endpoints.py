@@ -4,11 +4,9 @@ from mlflow_reports.list.click_options import opt_columns
 from mlflow_reports.common import io_utils
 from . import get_VectorSearchClient
 
-client = get_VectorSearchClient()
-
 
 def list_endpoints(columns, output_file_base):
-    endpoints = client.list_endpoints()["endpoints"]
+    endpoints = get_VectorSearchClient().list_endpoints()["endpoints"]
     print(f"Found {len(endpoints)}")
     ts_columns = [ "creation_timestamp", "last_updated_timestamp" ]
     io_utils.write_csv_and_json_files(output_file_base, endpoints, columns, ts_columns)
@@ -25,7 +25,11 @@ setup(
         "mdutils",
         "wheel"
     ],
-    extras_require= { "tests": [ "mlflow", "pytest","pytest-html>=3.2.0", "shortuuid>=1.0.11" ] },
+    extras_require= {
+        "tests": [ "mlflow", "pytest","pytest-html>=3.2.0", "shortuuid>=1.0.11" ],
+        "async": [ "httpx[http2]" ],
+        "fast-json": [ "orjson" ]
+    },
     license = "Apache License 2.0",
     keywords = "mlflow ml ai",
     classifiers = [
@@ -0,0 +1,276 @@
+"""
+End-to-end benchmarks of the listing, enrichment and report hot paths against a synthetic registry.
+
+Creates N registered models with M versions each in the MLflow tracking server of MLFLOW_TRACKING_URI.
+Versions point at runs that have K params, metrics and tags, an MLflow model and a nested artifact tree.
+Then times:
+  - list-registered-models
+  - list-model-versions --get-model-details
+  - get-experiment --get-runs
+  - mlflow_utils.build_artifacts
+  - detailed_report.build_report
+
+Results are written as JSON. When a baseline file is given, benchmarks slower than the baseline
+beyond the tolerance are reported as regressions and the exit code is 1.
+
+To regenerate the baseline after an intended change:
+    python -m tests.benchmark --output-file tests/benchmark_baseline.json
+To check against the baseline:
+    python -m tests.benchmark --baseline-file tests/benchmark_baseline.json
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import statistics
+import contextlib
+import click
+import mlflow
+
+from mlflow_reports.client import http_metrics
+from mlflow_reports.common import mlflow_utils
+from mlflow_reports.data import get_experiment
+from mlflow_reports.list import list_registered_models, list_model_versions
+from mlflow_reports.markdown import detailed_report
+from tests.utils_test import mk_uuid
+from tests.sklearn_utils import create_sklearn_model
+
+_BASELINE_FILE = os.path.join(os.path.dirname(__file__), "benchmark_baseline.json")
+_TOLERANCE = float(os.environ.get("MLFLOW_REPORTS_BENCHMARK_TOLERANCE", 1.5))
+_SLACK_SECONDS = 0.1
+_MODEL_ARTIFACT_PATH = "model"
+_TREE_ARTIFACT_PATH = "tree"
+
+
+def create_registry(num_models=10, num_versions=3, num_runs=5, num_fields=10, artifact_depth=3, artifact_fanout=3):
+    """
+    Creates the synthetic registry.
+    :param num_fields: Number of params, of metrics and of tags per run.
+    :param artifact_depth: Depth of the artifact directory tree of each run.
+    :param artifact_fanout: Number of files and of sub-directories per artifact directory.
+    :return: Dict describing the registry.
+    """
+    prefix = f"bench_{mk_uuid()}"
+    client = mlflow.MlflowClient()
+    exp_id = client.create_experiment(prefix)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_dir = _save_model(os.path.join(tmp_dir, "model"))
+        tree_dir = os.path.join(tmp_dir, "tree")
+        _mk_artifact_tree(tree_dir, artifact_depth, artifact_fanout)
+        runs = [ _create_run(client, exp_id, j, num_fields, model_dir, tree_dir) for j in range(0, num_runs) ]
+    model_names = []
+    for j in range(0, num_models):
+        model_name = f"{prefix}_model_{j}"
+        client.create_registered_model(model_name, tags={ "model_tag": str(j) })
+        for v in range(0, num_versions):
+            run = runs[(j + v) % num_runs]
+            vr = client.create_model_version(model_name, f"{run.info.artifact_uri}/{_MODEL_ARTIFACT_PATH}", run.info.run_id)
+            client.set_model_version_tag(model_name, vr.version, "version_tag", str(v))
+        model_names.append(model_name)
+    return {
+        "prefix": prefix,
+        "experiment_id": exp_id,
+        "run_ids": [ run.info.run_id for run in runs ],
+        "model_names": model_names,
+        "artifact_max_level": artifact_depth + 1
+    }
+
+
+def delete_registry(registry):
+    """
+    Deletes the registered models (with their versions) and the experiment (with its runs) of the synthetic registry.
+    """
+    client = mlflow.MlflowClient()
+    for model_name in registry["model_names"]:
+        client.delete_registered_model(model_name)
+    client.delete_experiment(registry["experiment_id"])
+
+
+def _save_model(path):
+    import mlflow.sklearn
+    mlflow.sklearn.save_model(create_sklearn_model(), path, pip_requirements=[ "scikit-learn" ]) # skip slow requirements inference
+    return path
+
+
+def _mk_artifact_tree(path, depth, fanout, level=0):
+    os.makedirs(path)
+    for j in range(0, fanout):
+        with open(os.path.join(path, f"file_{j}.txt"), "w", encoding="utf-8") as f:
+            f.write("x" * 100 * (j+1))
+    if level+1 < depth:
+        for j in range(0, fanout):
+            _mk_artifact_tree(os.path.join(path, f"dir_{j}"), depth, fanout, level+1)
+
+
+def _log_model(client, run_id, model_dir):
+    """
+    Logs the saved model as the run's model - much faster than log_model() for each run.
+    """
+    from mlflow.models import Model
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        run_model_dir = os.path.join(tmp_dir, _MODEL_ARTIFACT_PATH)
+        shutil.copytree(model_dir, run_model_dir)
+        model = Model.load(run_model_dir)
+        model.run_id = run_id
+        model.artifact_path = _MODEL_ARTIFACT_PATH
+        model.save(os.path.join(run_model_dir, "MLmodel"))
+        client.log_artifacts(run_id, run_model_dir, _MODEL_ARTIFACT_PATH)
+
+
+def _create_run(client, exp_id, idx, num_fields, model_dir, tree_dir):
+    run = client.create_run(exp_id, run_name=f"run_{idx}")
+    run_id = run.info.run_id
+    now = int(time.time() * 1000)
+    client.log_batch(run_id,
+        metrics = [ mlflow.entities.Metric(f"metric_{j}", j/10, now, 0) for j in range(0, num_fields) ],
+        params = [ mlflow.entities.Param(f"param_{j}", str(j)) for j in range(0, num_fields) ],
+        tags = [ mlflow.entities.RunTag(f"tag_{j}", f"value_{j}") for j in range(0, num_fields) ]
+    )
+    _log_model(client, run_id, model_dir)
+    client.log_artifacts(run_id, tree_dir, _TREE_ARTIFACT_PATH)
+    client.set_terminated(run_id)
+    return client.get_run(run_id)
+
+
+def mk_benchmarks(registry, output_dir):
+    """
+    :return: Dict of benchmark name to function without arguments.
+    """
+    model_filter = f"name LIKE '{registry['prefix']}%'"
+    def _build_artifacts():
+        for run_id in registry["run_ids"]:
+            mlflow_utils.build_artifacts(run_id, "", registry["artifact_max_level"])
+    return {
+        "list_registered_models": lambda: list_registered_models.show(
+            filter = model_filter,
+            prefix = None,
+            get_tags_and_aliases = True,
+            unity_catalog = False,
+            columns = None,
+            max_description = None,
+            output_file_base = os.path.join(output_dir, "registered_models")
+        ),
+        "list_model_versions_with_details": lambda: list_model_versions.show(
+            filter = model_filter,
+            get_tags_and_aliases = True,
+            get_model_details = True,
+            unity_catalog = False,
+            columns = None,
+            max_description = None,
+            output_file_base = os.path.join(output_dir, "model_versions")
+        ),
+        "get_experiment_with_runs": lambda: get_experiment.get(registry["experiment_id"], get_runs=True),
+        "build_artifacts": _build_artifacts,
+        "build_report": lambda: detailed_report.build_report(
+            f"models:/{registry['model_names'][0]}/1",
+            get_permissions = False,
+            output_file = os.path.join(output_dir, "report.md")
+        )
+    }
+
+
+def run_benchmarks(benchmarks, num_iterations=3):
+    """
+    Times each benchmark. Output of the benchmarked commands is discarded.
+    :return: Dict of benchmark name to timings and number of mlflow-reports HTTP calls of one iteration.
+    """
+    results = {}
+    for name, func in benchmarks.items():
+        seconds = []
+        num_requests = 0
+        for _ in range(0, num_iterations):
+            http_metrics.reset()
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                func()
+                seconds.append(time.perf_counter() - start)
+            num_requests = http_metrics.get_summary()["totals"]["count"]
+        results[name] = {
+            "median_seconds": round(statistics.median(seconds), 4),
+            "min_seconds": round(min(seconds), 4),
+            "num_requests": num_requests
+        }
+        print(f"{name}: {results[name]}")
+    http_metrics.reset()
+    return results
+
+
+def compare(results, baseline, tolerance=_TOLERANCE):
+    """
+    :return: List of (name, median_seconds, baseline median_seconds) of benchmarks slower than the baseline beyond the tolerance.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base and result["median_seconds"] > base["median_seconds"] * tolerance + _SLACK_SECONDS:
+            regressions.append((name, result["median_seconds"], base["median_seconds"]))
+    return regressions
+
+
+def benchmark(num_models=10, num_versions=3, num_runs=5, num_fields=10, artifact_depth=3, artifact_fanout=3, num_iterations=3):
+    """
+    Creates a synthetic registry, runs the benchmarks and deletes the registry.
+    :return: Dict with "config" and "benchmarks" keys.
+    """
+    config = {
+        "num_models": num_models,
+        "num_versions": num_versions,
+        "num_runs": num_runs,
+        "num_fields": num_fields,
+        "artifact_depth": artifact_depth,
+        "artifact_fanout": artifact_fanout,
+        "num_iterations": num_iterations
+    }
+    registry = create_registry(num_models, num_versions, num_runs, num_fields, artifact_depth, artifact_fanout)
+    try:
+        with tempfile.TemporaryDirectory() as output_dir:
+            results = run_benchmarks(mk_benchmarks(registry, output_dir), num_iterations)
+    finally:
+        delete_registry(registry)
+    return {
+        "config": config,
+        "mlflow_version": mlflow.__version__,
+        "python_version": sys.version.split()[0],
+        "benchmarks": results
+    }
+
+
+@click.command()
+@click.option("--num-models", help="Number of registered models.", type=int, default=10, show_default=True)
+@click.option("--num-versions", help="Number of versions per model.", type=int, default=3, show_default=True)
+@click.option("--num-runs", help="Number of runs.", type=int, default=5, show_default=True)
+@click.option("--num-fields", help="Number of params, metrics and tags per run.", type=int, default=10, show_default=True)
+@click.option("--artifact-depth", help="Depth of the artifact tree of each run.", type=int, default=3, show_default=True)
+@click.option("--artifact-fanout", help="Files and directories per artifact directory.", type=int, default=3, show_default=True)
+@click.option("--num-iterations", help="Timed iterations per benchmark.", type=int, default=3, show_default=True)
+@click.option("--output-file", help="JSON results file.", type=str, required=False)
+@click.option("--baseline-file", help="JSON baseline file to compare with.", type=str, required=False)
+def main(num_models, num_versions, num_runs, num_fields, artifact_depth, artifact_fanout, num_iterations, output_file, baseline_file):
+    print("Options:")
+    for k,v in locals().items():
+        print(f"  {k}: {v}")
+    results = benchmark(num_models, num_versions, num_runs, num_fields, artifact_depth, artifact_fanout, num_iterations)
+    if output_file:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"Output file: {output_file}")
+    if baseline_file:
+        with open(baseline_file, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline["config"] != results["config"]:
+            print(f"WARNING: Benchmark config differs from baseline config {baseline['config']}")
+        regressions = compare(results["benchmarks"], baseline["benchmarks"])
+        for name, seconds, base_seconds in regressions:
+            print(f"ERROR: Regression in '{name}': {seconds} seconds versus baseline {base_seconds} seconds")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions versus baseline '{baseline_file}'")
+
+
+if __name__ == "__main__":
+    main()
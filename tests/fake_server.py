@@ -0,0 +1,495 @@
+"""
+Offline stand-in for the MLflow and Databricks REST APIs used by HttpClient.
+
+Serves a synthetic registry - experiments, runs, registered models, model versions, artifacts,
+serving endpoints and feature tables - with MLflow's pagination semantics, and can inject latency,
+jitter and HTTP 429 throttling so that throughput features can be benchmarked reproducibly without a workspace.
+
+Usage in tests:
+    with FakeServer(FakeRegistry(num_models=100), latency=0.01, throttle_rate=0.05) as server:
+        client = HttpClient("api/2.0/mlflow", host=server.uri)
+        models = list(SearchRegisteredModelsIterator(client))
+
+Standalone (point the CLI tools at it with MLFLOW_TRACKING_URI):
+    python -m tests.fake_server --port 5030 --num-models 1000 --latency 0.05
+"""
+
+import re
+import json
+import time
+import random
+import threading
+from collections import Counter
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import click
+
+_BASE_TIMESTAMP = 1700000000000
+
+# Default and maximum page sizes of OSS MLflow
+_PAGE_SIZES = {
+    "experiments/search": (1000, 50000),
+    "runs/search": (1000, 50000),
+    "registered-models/search": (100, 1000),
+    "model-versions/search": (200, 200000),
+    "feature-store/feature-tables/search": (100, 1000),
+}
+
+_NAME_FILTER_PATTERN = re.compile(r"""^\s*name\s*=\s*['"](.*)['"]\s*$""")
+
+
+class FakeRegistry:
+    """
+    Synthetic, deterministic MLflow objects.
+    Model version 'v' of model 'm' is linked to a run of experiment 'm % num_experiments'.
+    """
+    def __init__(self,
+            num_experiments=2,
+            num_runs=5,
+            num_models=5,
+            num_versions=3,
+            num_params=5,
+            num_metrics=5,
+            num_tags=5,
+            artifact_depth=2,
+            artifact_fanout=3,
+            num_endpoints=2,
+            num_feature_tables=2,
+            seed=0
+        ):
+        """
+        :param num_runs: Number of runs per experiment.
+        :param num_versions: Number of versions per registered model.
+        :param artifact_depth: Depth of the artifact directory tree of each run.
+        :param artifact_fanout: Number of files and of sub-directories per artifact directory.
+        """
+        rnd = random.Random(seed)
+        self.artifact_depth = artifact_depth
+        self.artifact_fanout = artifact_fanout
+        self.experiments = [ _mk_experiment(j) for j in range(0, num_experiments) ]
+        self.runs = {}
+        for exp in self.experiments:
+            for j in range(0, num_runs):
+                run = _mk_run(exp, j, num_params, num_metrics, num_tags, rnd)
+                self.runs[run["info"]["run_id"]] = run
+        self.runs_by_experiment = {
+            exp["experiment_id"]: [ run for run in self.runs.values() if run["info"]["experiment_id"] == exp["experiment_id"] ]
+                for exp in self.experiments
+        }
+        self.models = []
+        self.versions = []
+        for j in range(0, num_models):
+            exp_runs = self.runs_by_experiment[self.experiments[j % num_experiments]["experiment_id"]] if num_experiments else []
+            versions = [ _mk_version(j, v, exp_runs[(v-1) % len(exp_runs)] if exp_runs else None) for v in range(1, num_versions+1) ]
+            self.models.append(_mk_model(j, versions))
+            self.versions += versions
+        self.models_by_name = { model["name"]: model for model in self.models }
+        self.versions_by_key = { (vr["name"], vr["version"]): vr for vr in self.versions }
+        self.endpoints = [ _mk_endpoint(j, self.models[j % num_models] if num_models else None) for j in range(0, num_endpoints) ]
+        self.feature_tables = [ _mk_feature_table(j) for j in range(0, num_feature_tables) ]
+
+
+    def list_artifacts(self, run, path=None):
+        """
+        Each directory has 'artifact_fanout' files and, above 'artifact_depth', as many sub-directories.
+        """
+        level = len(path.split("/")) if path else 0
+        prefix = f"{path}/" if path else ""
+        files = [ { "path": f"{prefix}file_{j}.txt", "is_dir": False, "file_size": 100 * (j+1) }
+            for j in range(0, self.artifact_fanout) ]
+        if level < self.artifact_depth:
+            files += [ { "path": f"{prefix}dir_{j}", "is_dir": True } for j in range(0, self.artifact_fanout) ]
+        rsp = { "root_uri": run["info"]["artifact_uri"] }
+        if files:
+            rsp["files"] = files
+        return rsp
+
+
+def _mk_experiment(idx):
+    exp_id = str(100 + idx)
+    return {
+        "experiment_id": exp_id,
+        "name": f"/Users/fake@example.com/experiment_{idx}",
+        "artifact_location": f"dbfs:/databricks/mlflow-tracking/{exp_id}",
+        "lifecycle_stage": "active",
+        "last_update_time": _BASE_TIMESTAMP + idx,
+        "creation_time": _BASE_TIMESTAMP + idx,
+        "tags": [ { "key": "mlflow.note.content", "value": f"Experiment {idx}" } ]
+    }
+
+
+def _mk_run(exp, idx, num_params, num_metrics, num_tags, rnd):
+    run_id = f"{int(exp['experiment_id']):08x}{idx:024x}"
+    start_time = _BASE_TIMESTAMP + idx * 1000
+    return {
+        "info": {
+            "run_id": run_id,
+            "run_uuid": run_id,
+            "run_name": f"run_{idx}",
+            "experiment_id": exp["experiment_id"],
+            "user_id": "fake@example.com",
+            "status": "FINISHED",
+            "start_time": start_time,
+            "end_time": start_time + 500,
+            "artifact_uri": f"{exp['artifact_location']}/{run_id}/artifacts",
+            "lifecycle_stage": "active"
+        },
+        "data": {
+            "metrics": [ { "key": f"metric_{j}", "value": round(rnd.random(), 6), "timestamp": start_time, "step": 0 }
+                for j in range(0, num_metrics) ],
+            "params": [ { "key": f"param_{j}", "value": str(rnd.randint(0, 1000)) } for j in range(0, num_params) ],
+            "tags": [ { "key": f"tag_{j}", "value": f"value_{j}" } for j in range(0, num_tags) ]
+                + [ { "key": "mlflow.runName", "value": f"run_{idx}" } ]
+        },
+        "inputs": {}
+    }
+
+
+def _mk_version(model_idx, version, run):
+    name = f"model_{model_idx:05d}"
+    vr = {
+        "name": name,
+        "version": str(version),
+        "creation_timestamp": _BASE_TIMESTAMP + version,
+        "last_updated_timestamp": _BASE_TIMESTAMP + version,
+        "current_stage": "None",
+        "description": "",
+        "source": f"{run['info']['artifact_uri']}/model" if run else f"s3://fake-bucket/{name}/{version}/model",
+        "status": "READY",
+        "tags": [ { "key": "version_tag", "value": str(version) } ]
+    }
+    if run:
+        vr["run_id"] = run["info"]["run_id"]
+    return vr
+
+
+def _mk_model(idx, versions):
+    model = {
+        "name": f"model_{idx:05d}",
+        "creation_timestamp": _BASE_TIMESTAMP + idx,
+        "last_updated_timestamp": _BASE_TIMESTAMP + idx,
+        "description": f"Model {idx}",
+        "tags": [ { "key": "model_tag", "value": str(idx) } ]
+    }
+    if versions:
+        model["latest_versions"] = [ versions[-1] ]
+        model["aliases"] = [ { "alias": "champion", "version": versions[-1]["version"] } ]
+    return model
+
+
+def _mk_endpoint(idx, model):
+    endpoint = {
+        "name": f"endpoint_{idx}",
+        "creator": "fake@example.com",
+        "creation_timestamp": _BASE_TIMESTAMP // 1000 + idx,
+        "last_updated_timestamp": _BASE_TIMESTAMP // 1000 + idx,
+        "state": { "ready": "READY", "config_update": "NOT_UPDATING" },
+    }
+    if model:
+        endpoint["config"] = { "served_entities": [ {
+            "name": f"{model['name']}-1",
+            "entity_name": model["name"],
+            "entity_version": "1",
+            "workload_size": "Small",
+            "scale_to_zero_enabled": True
+        } ] }
+    return endpoint
+
+
+def _mk_feature_table(idx):
+    return {
+        "name": f"fake_db.feature_table_{idx}",
+        "primary_keys": [ "id" ],
+        "creation_timestamp": _BASE_TIMESTAMP + idx,
+        "features": [ { "name": f"feature_{j}", "data_type": "DOUBLE" } for j in range(0, 3) ]
+    }
+
+
+class FakeServer:
+    """
+    HTTP server for a FakeRegistry on a background thread.
+    """
+    def __init__(self, registry=None, port=0, latency=0.0, jitter=0.0, throttle_rate=0.0, retry_after="0",
+            databricks=False, unity_catalog=False, seed=0):
+        """
+        :param registry: FakeRegistry. Default is a small one.
+        :param port: Port on 127.0.0.1. Default 0 picks a free port.
+        :param latency: Seconds added to each response.
+        :param jitter: Latency is uniformly distributed in [latency-jitter, latency+jitter].
+        :param throttle_rate: Fraction (0 to 1) of requests answered with HTTP 429.
+        :param retry_after: Value of the Retry-After header of 429 responses. If None, the header is not sent.
+        :param databricks: Answer the Databricks capability probe as a Databricks workspace.
+        :param unity_catalog: Answer the Unity Catalog capability probe as available.
+        :param seed: Seed for latency and throttling.
+        """
+        self.registry = registry or FakeRegistry()
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.databricks = databricks
+        self.unity_catalog = unity_catalog
+        self.request_counts = Counter()
+        self.num_throttled = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _mk_handler_class(self))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def uri(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    @property
+    def num_requests(self):
+        return sum(self.request_counts.values())
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={ "poll_interval": 0.05 }, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self):
+        """
+        Serves on the calling thread until interrupted.
+        """
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+    def handle(self, method, api, resource, params):
+        """
+        :return: Tuple of (HTTP status code, response dict, headers dict)
+        """
+        with self._lock:
+            self.request_counts[f"{method} {api}/{resource}"] += 1
+            delay = max(self.latency + self._random.uniform(-self.jitter, self.jitter), 0.0)
+            throttle = self._random.random() < self.throttle_rate
+            if throttle:
+                self.num_throttled += 1
+        if delay:
+            time.sleep(delay)
+        if throttle:
+            headers = { "Retry-After": str(self.retry_after) } if self.retry_after is not None else {}
+            return 429, _mk_error("REQUEST_LIMIT_EXCEEDED", "Too many requests"), headers
+        route = _ROUTES.get((api, resource))
+        if not route:
+            if api == "api/2.0" and resource.startswith("serving-endpoints/"):
+                return self._get_endpoint(resource.split("/", 1)[1])
+            return 404, _mk_error("ENDPOINT_NOT_FOUND", f"No API found for '{method} /{api}/{resource}'"), {}
+        return route(self, params)
+
+
+    def _workspace_get_status(self, params):
+        if self.databricks:
+            return 400, _mk_error("INVALID_PARAMETER_VALUE", "Path must be specified"), {}
+        return 404, _mk_error("ENDPOINT_NOT_FOUND", "Not found"), {}
+
+    def _current_metastore_assignment(self, params):
+        if self.databricks and self.unity_catalog:
+            return 200, { "metastore_id": "fake_metastore", "workspace_id": 1 }, {}
+        return 404, _mk_error("METASTORE_DOES_NOT_EXIST", "No metastore assigned"), {}
+
+    def _search_experiments(self, params):
+        return _paginate("experiments/search", "experiments", self.registry.experiments, params)
+
+    def _get_experiment(self, params):
+        matches = [ exp for exp in self.registry.experiments if exp["experiment_id"] == params.get("experiment_id") ]
+        return _get_one("experiment", matches, f"experiment ID '{params.get('experiment_id')}'")
+
+    def _get_experiment_by_name(self, params):
+        matches = [ exp for exp in self.registry.experiments if exp["name"] == params.get("experiment_name") ]
+        return _get_one("experiment", matches, f"experiment '{params.get('experiment_name')}'")
+
+    def _search_runs(self, params):
+        runs = [ run for exp_id in params.get("experiment_ids", []) for run in self.registry.runs_by_experiment.get(str(exp_id), []) ]
+        return _paginate("runs/search", "runs", runs, params)
+
+    def _get_run(self, params):
+        run_id = params.get("run_id") or params.get("run_uuid")
+        run = self.registry.runs.get(run_id)
+        return _get_one("run", [ run ] if run else [], f"run ID '{run_id}'")
+
+    def _list_artifacts(self, params):
+        run = self.registry.runs.get(params.get("run_id") or params.get("run_uuid"))
+        if not run:
+            return 404, _mk_error("RESOURCE_DOES_NOT_EXIST", f"Run '{params.get('run_id')}' not found"), {}
+        return 200, self.registry.list_artifacts(run, params.get("path")), {}
+
+    def _search_registered_models(self, params):
+        return _paginate("registered-models/search", "registered_models",
+            _filter_by_name(self.registry.models, params.get("filter")), params)
+
+    def _get_registered_model(self, params):
+        model = self.registry.models_by_name.get(params.get("name"))
+        return _get_one("registered_model", [ model ] if model else [], f"registered model '{params.get('name')}'")
+
+    def _search_model_versions(self, params):
+        return _paginate("model-versions/search", "model_versions",
+            _filter_by_name(self.registry.versions, params.get("filter")), params)
+
+    def _get_model_version(self, params):
+        vr = self.registry.versions_by_key.get((params.get("name"), str(params.get("version"))))
+        return _get_one("model_version", [ vr ] if vr else [], f"model version '{params.get('name')}/{params.get('version')}'")
+
+    def _get_model_version_download_uri(self, params):
+        status, rsp, headers = self._get_model_version(params)
+        if status != 200:
+            return status, rsp, headers
+        return 200, { "artifact_uri": rsp["model_version"]["source"] }, {}
+
+    def _list_endpoints(self, params):
+        return 200, { "endpoints": self.registry.endpoints }, {}
+
+    def _get_endpoint(self, name):
+        matches = [ endpoint for endpoint in self.registry.endpoints if endpoint["name"] == name ]
+        if not matches:
+            return 404, _mk_error("RESOURCE_DOES_NOT_EXIST", f"Serving endpoint '{name}' not found"), {}
+        return 200, matches[0], {}
+
+    def _search_feature_tables(self, params):
+        return _paginate("feature-store/feature-tables/search", "feature_tables", self.registry.feature_tables, params)
+
+
+_ROUTES = {
+    ("api/2.0", "workspace/get-status"): FakeServer._workspace_get_status,
+    ("api/2.1", "unity-catalog/current-metastore-assignment"): FakeServer._current_metastore_assignment,
+    ("api/2.0/mlflow", "experiments/search"): FakeServer._search_experiments,
+    ("api/2.0/mlflow", "experiments/get"): FakeServer._get_experiment,
+    ("api/2.0/mlflow", "experiments/get-by-name"): FakeServer._get_experiment_by_name,
+    ("api/2.0/mlflow", "runs/search"): FakeServer._search_runs,
+    ("api/2.0/mlflow", "runs/get"): FakeServer._get_run,
+    ("api/2.0/mlflow", "artifacts/list"): FakeServer._list_artifacts,
+    ("api/2.0/mlflow", "registered-models/search"): FakeServer._search_registered_models,
+    ("api/2.0/mlflow", "registered-models/get"): FakeServer._get_registered_model,
+    ("api/2.0/mlflow", "model-versions/search"): FakeServer._search_model_versions,
+    ("api/2.0/mlflow", "model-versions/get"): FakeServer._get_model_version,
+    ("api/2.0/mlflow", "model-versions/get-download-uri"): FakeServer._get_model_version_download_uri,
+    ("api/2.0", "serving-endpoints"): FakeServer._list_endpoints,
+    ("api/2.0", "feature-store/feature-tables/search"): FakeServer._search_feature_tables,
+}
+
+_API_PREFIXES = [ "api/2.0/mlflow", "api/2.0", "api/2.1" ] # longest first
+
+
+def _mk_error(error_code, message):
+    return { "error_code": error_code, "message": message }
+
+
+def _get_one(object_name, matches, description):
+    if not matches:
+        return 404, _mk_error("RESOURCE_DOES_NOT_EXIST", f"Could not find {description}"), {}
+    return 200, { object_name: matches[0] }, {}
+
+
+def _filter_by_name(objects, filter):
+    """
+    Only "name='...'" filters are supported - any other filter returns all objects.
+    """
+    match = _NAME_FILTER_PATTERN.match(filter) if filter else None
+    if not match:
+        return objects
+    return [ obj for obj in objects if obj["name"] == match.group(1) ]
+
+
+def _paginate(resource, object_name, objects, params):
+    """
+    The page token is the offset of the next page. Like MLflow, 'next_page_token' is omitted on the last page.
+    """
+    default_size, max_size = _PAGE_SIZES[resource]
+    max_results = int(params.get("max_results") or default_size)
+    if max_results > max_size:
+        return 400, _mk_error("INVALID_PARAMETER_VALUE", f"Invalid value {max_results} for parameter 'max_results'"), {}
+    try:
+        offset = int(params.get("page_token") or 0)
+    except ValueError:
+        return 400, _mk_error("INVALID_PARAMETER_VALUE", f"Invalid page token '{params.get('page_token')}'"), {}
+    page = objects[offset:offset+max_results]
+    rsp = { object_name: page } if page else {}
+    if offset + max_results < len(objects):
+        rsp["next_page_token"] = str(offset + max_results)
+    return 200, rsp, {}
+
+
+def _mk_handler_class(server):
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1" # keep-alive for pooled sessions
+        disable_nagle_algorithm = True # else headers and body writes add ~40ms per response
+
+        def do_GET(self):
+            self._handle("GET")
+
+        def do_POST(self):
+            self._handle("POST")
+
+        def _handle(self, method):
+            url = urlparse(self.path)
+            params = { k: v[0] if len(v) == 1 else v for k, v in parse_qs(url.query).items() }
+            # NOTE: HttpClient sends GET parameters as a JSON body
+            num_bytes = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(num_bytes) if num_bytes else b""
+            if body:
+                try:
+                    params.update(json.loads(body))
+                except ValueError:
+                    self._send(400, _mk_error("MALFORMED_REQUEST", "Request body is not JSON"), {})
+                    return
+            path = url.path.strip("/")
+            api = next((prefix for prefix in _API_PREFIXES if path.startswith(f"{prefix}/")), None)
+            if not api:
+                self._send(404, _mk_error("ENDPOINT_NOT_FOUND", f"No API found for '{self.path}'"), {})
+                return
+            status, rsp, headers = server.handle(method, api, path[len(api)+1:], params)
+            self._send(status, rsp, headers)
+
+        def _send(self, status, rsp, headers):
+            content = json.dumps(rsp).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            for k, v in headers.items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, format, *args):
+            pass
+
+    return _Handler
+
+
+@click.command()
+@click.option("--port", help="Port.", type=int, default=5030, show_default=True)
+@click.option("--num-experiments", help="Number of experiments.", type=int, default=2, show_default=True)
+@click.option("--num-runs", help="Number of runs per experiment.", type=int, default=5, show_default=True)
+@click.option("--num-models", help="Number of registered models.", type=int, default=5, show_default=True)
+@click.option("--num-versions", help="Number of versions per model.", type=int, default=3, show_default=True)
+@click.option("--latency", help="Seconds added to each response.", type=float, default=0.0, show_default=True)
+@click.option("--jitter", help="Latency jitter in seconds.", type=float, default=0.0, show_default=True)
+@click.option("--throttle-rate", help="Fraction of requests answered with HTTP 429.", type=float, default=0.0, show_default=True)
+@click.option("--databricks", help="Answer the capability probe as a Databricks workspace.", type=bool, default=False, show_default=True)
+def main(port, num_experiments, num_runs, num_models, num_versions, latency, jitter, throttle_rate, databricks):
+    print("Options:")
+    for k,v in locals().items():
+        print(f"  {k}: {v}")
+    registry = FakeRegistry(num_experiments=num_experiments, num_runs=num_runs, num_models=num_models, num_versions=num_versions)
+    server = FakeServer(registry, port=port, latency=latency, jitter=jitter, throttle_rate=throttle_rate, databricks=databricks)
+    print(f"Serving fake MLflow REST API at {server.uri} - export MLFLOW_TRACKING_URI={server.uri}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Micro-benchmarks of explode_json, the JSON codecs and the batch timestamp formatting.
+Run as a gated test by tests/test_micro_benchmarks.py.
+
+To run them standalone:
+    python -m tests.micro_benchmarks
+"""
+
+import copy
+import json
+import importlib.util
+from mlflow_reports.common.explode_utils import explode_json
+from mlflow_reports.common.json_codec import StdlibCodec, OrjsonCodec
+from tests.timing_utils import best_time
+
+
+# ==== explode_json
+
+def _explode_json_recursive(obj):
+    """
+    Previous version: json.loads on every string and JSONDecodeError as the 'not JSON' path.
+    """
+    def _explode_string(v):
+        try:
+            v2 = json.loads(v)
+            if isinstance(v2,dict) or isinstance(v2,list):
+                _explode_json_recursive(v2)
+            return v2
+        except json.decoder.JSONDecodeError:
+            return v
+    if isinstance(obj, dict):
+        for k,v in obj.items():
+            if isinstance(v,dict) or isinstance(v,list):
+                _explode_json_recursive(v)
+            elif isinstance(v,str):
+                obj[k] = _explode_string(v)
+    elif isinstance(obj, list):
+        for e in obj:
+            _explode_json_recursive(e)
+
+
+def _mk_run(num_params=2000, num_tags=2000):
+    return { "run": {
+        "info": { "run_id": "0" * 32, "experiment_id": "1234", "status": "FINISHED", "artifact_uri": "dbfs:/a/b" },
+        "data": {
+            "params": { f"param_{j}": f"value_{j}" if j % 2 else str(j) for j in range(0, num_params) },
+            "tags": { f"tag_{j}": json.dumps({ "j": j }) if j % 100 == 0 else f"Some tag text {j}" for j in range(0, num_tags) }
+        }
+    }}
+
+
+def benchmark_explode_json(num_params=2000, num_tags=2000, number=5):
+    """
+    Returns best seconds to explode a run with many params and tags for the previous and current versions.
+    """
+    run = _mk_run(num_params, num_tags)
+    setup = lambda: copy.deepcopy(run)
+    return {
+        "recursive_json_loads": best_time(_explode_json_recursive, number, setup),
+        "explode_json": best_time(explode_json, number, setup),
+        "explode_json_whitelist": best_time(lambda obj: explode_json(obj, keys={ "tag_0" }), number, setup)
+    }
+
+
+# ==== JSON codecs
+
+def mk_runs_search_page(num_runs, num_metrics=20, num_params=30, num_tags=10):
+    """
+    Returns a synthetic runs/search response similar to what the MLflow REST API returns.
+    """
+    def mk_run(j):
+        run_id = f"{j:032x}"
+        return {
+            "info": {
+                "run_uuid": run_id,
+                "run_id": run_id,
+                "run_name": f"run_{j}",
+                "experiment_id": "1234567890",
+                "user_id": "andy@mycompany.com",
+                "status": "FINISHED",
+                "start_time": 1700000000000 + j,
+                "end_time": 1700000100000 + j,
+                "artifact_uri": f"dbfs:/databricks/mlflow-tracking/1234567890/{run_id}/artifacts",
+                "lifecycle_stage": "active"
+            },
+            "data": {
+                "metrics": [ { "key": f"metric_{k}", "value": j * 0.001 + k, "timestamp": 1700000000000 + k, "step": k }
+                    for k in range(num_metrics) ],
+                "params": [ { "key": f"param_{k}", "value": str(k * 7) } for k in range(num_params) ],
+                "tags": [ { "key": f"mlflow.tag_{k}", "value": json.dumps({"k": k, "v": "vålue"}) } for k in range(num_tags) ]
+            },
+            "inputs": {}
+        }
+    return { "runs": [ mk_run(j) for j in range(num_runs) ], "next_page_token": "eyJvZmZzZXQiOiAxMDAwfQ==" }
+
+
+def benchmark_json_codecs(num_runs=2000, number=5):
+    """
+    Returns best seconds per codec to decode a runs/search page from bytes and to dump it indented.
+    """
+    codecs = [ StdlibCodec() ]
+    if importlib.util.find_spec("orjson"):
+        codecs += [ OrjsonCodec(), OrjsonCodec(fast_dumps=True) ]
+    data = json.dumps(mk_runs_search_page(num_runs)).encode("utf-8")
+    results = { "num_bytes": len(data) }
+    for codec in codecs:
+        results[codec.name] = {
+            "loads": best_time(lambda: codec.loads(data), number),
+            "loads_text": best_time(lambda: codec.loads(data.decode("utf-8")), number),
+        }
+        dct = codec.loads(data)
+        results[codec.name]["dumps_indent"] = best_time(lambda: codec.dumps(dct, indent=2), number)
+    return results
+
+
+# ==== Timestamps
+
+def benchmark_adjust_ts(num_rows=100_000, number=3):
+    """
+    Returns best seconds to format the timestamp columns of a list command one dict at a time and at once.
+    """
+    import pandas as pd # slow import - only needed for this benchmark
+    from mlflow_reports.common import timestamp_utils
+    from mlflow_reports.data import data_utils
+    from mlflow_reports.list import list_utils
+    keys = [ "creation_timestamp", "last_updated_timestamp" ]
+    base = timestamp_utils.ts_now_seconds * 1000
+    def mk_dcts():
+        return [ { "creation_timestamp": base - j * 997, "last_updated_timestamp": base - j * 13 } for j in range(0, num_rows) ]
+    df = pd.DataFrame(mk_dcts())
+    list_utils.to_datetime(df, keys)
+    dcts = mk_dcts()
+    return {
+        "adjust_ts": best_time(lambda: [ data_utils.adjust_ts(dct, keys) for dct in dcts ], number),
+        "adjust_ts_batch": best_time(lambda: data_utils.adjust_ts_batch(dcts, keys, df), number)
+    }
+
+
+BENCHMARKS = {
+    "explode_json": benchmark_explode_json,
+    "json_codecs": benchmark_json_codecs,
+    "adjust_ts": benchmark_adjust_ts
+}
+
+
+if __name__ == "__main__":
+    for name, benchmark in BENCHMARKS.items():
+        print(f"{name}:", json.dumps(benchmark(), indent=2))
@@ -0,0 +1,68 @@
+import asyncio
+import pytest
+
+pytest.importorskip("httpx")
+
+from mlflow_reports.common import MlflowReportsException
+from mlflow_reports.client import response_cache
+from mlflow_reports.client.http_client import mlflow_client
+from mlflow_reports.client.async_http_client import AsyncHttpClient
+from tests.utils_test import create_experiment
+
+
+def test_get():
+    exp = create_experiment()
+    async def _get():
+        async with AsyncHttpClient("api/2.0/mlflow") as client:
+            return await client.get("experiments/get", { "experiment_id": exp.experiment_id })
+    rsp = asyncio.run(_get())
+    assert rsp == mlflow_client.get("experiments/get", { "experiment_id": exp.experiment_id })
+
+
+def test_get_concurrent():
+    experiments = [ create_experiment() for _ in range(0, 5) ]
+    async def _get_all():
+        async with AsyncHttpClient("api/2.0/mlflow") as client:
+            return await asyncio.gather(*[
+                client.get("experiments/get", { "experiment_id": exp.experiment_id }) for exp in experiments ])
+    rsps = asyncio.run(_get_all())
+    assert [ rsp["experiment"]["name"] for rsp in rsps ] == [ exp.name for exp in experiments ]
+
+
+def test_get_disk_cache(tmp_path):
+    exp = create_experiment()
+    params = { "experiment_id": exp.experiment_id }
+    async def _get_twice():
+        async with AsyncHttpClient("api/2.0/mlflow") as client:
+            return [ await client.get("experiments/get", params) for _ in range(0, 2) ]
+    cache = response_cache.configure(cache_file=str(tmp_path / "cache.db"))
+    try:
+        rsp1, rsp2 = asyncio.run(_get_twice())
+        assert rsp1 == rsp2
+        assert cache.get_stats()["resources"]["experiments/get"] == { "hits": 1, "disk_hits": 0, "misses": 1 }
+    finally:
+        response_cache.configure(enabled=False)
+
+
+def test_post_and_delete():
+    exp = create_experiment()
+    async def _create_and_delete_run():
+        async with AsyncHttpClient("api/2.0/mlflow") as client:
+            rsp = await client.post("runs/create", { "experiment_id": exp.experiment_id })
+            run_id = rsp["run"]["info"]["run_id"]
+            await client.post("runs/delete", { "run_id": run_id })
+            return run_id
+    run_id = asyncio.run(_create_and_delete_run())
+    rsp = mlflow_client.get("runs/get", { "run_id": run_id })
+    assert rsp["run"]["info"]["lifecycle_stage"] == "deleted"
+
+
+def test_get_fail():
+    async def _get():
+        async with AsyncHttpClient("api/2.0/mlflow") as client:
+            return await client.get("experiments/get", { "experiment_id": "foo" })
+    try:
+        asyncio.run(_get())
+        assert False
+    except MlflowReportsException as e:
+        assert e.http_status_code in (400, 404)
@@ -0,0 +1,67 @@
+"""
+Test the async MLflow HTTP object iterators against the synchronous ones.
+Requires the optional 'async' extra (httpx).
+"""
+
+import asyncio
+import pytest
+import mlflow
+
+pytest.importorskip("httpx")
+
+from mlflow_reports.client.http_client import mlflow_client as http_client
+from mlflow_reports.client.async_http_client import AsyncHttpClient
+from mlflow_reports.common.http_iterators import (
+    SearchRunsIterator,
+    AsyncSearchExperimentsIterator,
+    AsyncSearchRunsIterator
+)
+from . iterators_test_utils import (
+    list_experiments,
+    create_experiment,
+    delete_experiments,
+    TEST_OBJECT_PREFIX
+)
+
+mlflow_client = mlflow.MlflowClient()
+
+
+def _create_experiment(num_runs):
+    experiment = create_experiment(mlflow_client)
+    for _ in range(0, num_runs):
+        with mlflow.start_run():
+            mlflow.log_metric("m1", 0.1)
+    return experiment
+
+def _run_async(iterator):
+    async def _collect():
+        async with iterator.client:
+            return [ obj async for obj in iterator ]
+    return asyncio.run(_collect())
+
+
+def _run_test_search_runs_async(num_runs, max_results):
+    exp = _create_experiment(num_runs)
+    runs1 = list(SearchRunsIterator(http_client, exp.experiment_id, max_results))
+    runs2 = _run_async(AsyncSearchRunsIterator(AsyncHttpClient("api/2.0/mlflow"), exp.experiment_id, max_results))
+    assert num_runs == len(runs2)
+    assert [ r["info"]["run_id"] for r in runs1 ] == [ r["info"]["run_id"] for r in runs2 ]
+
+def test_search_runs_async():
+    _run_test_search_runs_async(50, 7)
+
+def test_search_runs_async_empty():
+    _run_test_search_runs_async(0, 7)
+
+def test_search_experiments_async():
+    num_experiments = 12
+    delete_experiments(mlflow_client)
+    assert len(list_experiments(mlflow_client)) == 0
+    for _ in range(0, num_experiments):
+        _create_experiment(0)
+    experiments = _run_async(AsyncSearchExperimentsIterator(AsyncHttpClient("api/2.0/mlflow"), max_results=5))
+    assert num_experiments == len([ exp for exp in experiments if exp["name"].startswith(TEST_OBJECT_PREFIX) ])
+
+def test_search_async_fail():
+    runs = _run_async(AsyncSearchRunsIterator(AsyncHttpClient("api/2.0/mlflow"), "foo"))
+    assert len(runs) == 0
@@ -0,0 +1,26 @@
+"""
+Smoke test of the synthetic-registry benchmark suite with a tiny registry.
+It creates runs, models and artifacts in the tracking server so it only runs when MLFLOW_REPORTS_CHECK_BENCHMARK_TIME=true.
+"""
+
+import json
+from tests import benchmark
+from tests.timing_utils import check_time
+
+
+@check_time
+def test_benchmark():
+    results = benchmark.benchmark(num_models=2, num_versions=2, num_runs=2, num_fields=2, artifact_depth=2, artifact_fanout=2, num_iterations=1)
+    with open(benchmark._BASELINE_FILE, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    assert results["benchmarks"].keys() == baseline["benchmarks"].keys()
+    for name, result in results["benchmarks"].items():
+        assert result["median_seconds"] > 0, name
+        assert result["num_requests"] > 0, name
+
+
+def test_compare():
+    baseline = { "a": { "median_seconds": 1.0 }, "b": { "median_seconds": 1.0 } }
+    results = { "a": { "median_seconds": 1.2 }, "b": { "median_seconds": 3.0 }, "c": { "median_seconds": 9.0 } }
+    assert benchmark.compare(results, baseline, tolerance=1.5) == [ ("b", 3.0, 1.0) ]
+    assert benchmark.compare(baseline, baseline) == []
@@ -1,7 +1,8 @@
+import sys
 from tempfile import NamedTemporaryFile
 import mlflow
 
-from mlflow_reports.common.mlflow_utils import build_artifacts
+from mlflow_reports.common.mlflow_utils import build_artifacts, build_artifacts_summary
 #from mlflow_reports.common.dump_utils import dump_as_json
 from . utils_test import create_experiment
 
@@ -111,6 +112,28 @@ def test_create_3_levels_check_4_level():
     _run_test_create(_create_level_3, max_level=4, num_levels=3, num_artifacts=4)
 
 
+# == Test wide tree with concurrent walker
+
+def _create_wide_tree():
+    create_experiment()
+    with mlflow.start_run() as run:
+        for j in range(0, 6):
+            for path in [ f"dir_{j}", f"dir_{j}/sub_{j}" ]:
+                with NamedTemporaryFile(prefix="file_", suffix=".txt", mode="w") as f:
+                    _log_artifact(f, path)
+    return run
+
+
+def test_wide_tree_concurrent():
+    run = _create_wide_tree()
+    res = build_artifacts(run.info.run_id, "", sys.maxsize)
+    _assert_result(res, content_size*12, 12, 3, sys.maxsize)
+    res2 = build_artifacts(run.info.run_id, "", sys.maxsize, max_workers=3, max_in_flight=2)
+    assert res2 == res
+    res3 = build_artifacts_summary(run.info.run_id, "", sys.maxsize, max_workers=3, max_in_flight=2)
+    assert res3 == { "summary": res["summary"] }
+
+
 # == Helper functions
 
 def _run_test_create(create_func, max_level, num_levels, num_artifacts):
@@ -118,6 +141,9 @@ def _run_test_create(create_func, max_level, num_levels, num_artifacts):
     res = build_artifacts(run.info.run_id, "", max_level)
     #dump_as_json(res["summary"])
     _assert_result(res, content_size*num_artifacts, num_artifacts, num_levels, max_level)
+    res2 = build_artifacts(run.info.run_id, "", max_level, max_workers=4)
+    assert res2 == res
+    assert build_artifacts_summary(run.info.run_id, "", max_level) == { "summary": res["summary"] }
 
 def _log_artifact(f, artifact_path):
     f.file.write(content)
@@ -0,0 +1,155 @@
+"""
+Test capability discovery and its on-disk cache against the OSS tracking server.
+"""
+
+import json
+import time
+import threading
+import pytest
+from mlflow_reports.common import MlflowReportsException
+from mlflow_reports.client import capabilities, http_client
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    path = tmp_path / "capabilities.json"
+    capabilities.configure(str(path), ttl=3600)
+    yield path
+    capabilities.configure()
+
+
+def _count_probes(monkeypatch):
+    calls = []
+    probe = capabilities._probe
+    def _probe(host):
+        calls.append(host)
+        return probe(host)
+    monkeypatch.setattr(capabilities, "_probe", _probe)
+    return calls
+
+
+def test_oss_capabilities(cache_file):
+    caps = capabilities.get_capabilities()
+    assert not caps.is_databricks
+    assert not caps.has_unity_catalog
+    assert not caps.supports(capabilities.ENDPOINT_PERMISSIONS)
+    assert not caps.supports(capabilities.ENDPOINT_DATABRICKS_REGISTERED_MODELS)
+    assert caps.supports(capabilities.ENDPOINT_SEARCH_ALL_MODEL_VERSIONS)
+    assert not capabilities.supports("not_an_endpoint")
+
+
+def test_probed_once(cache_file, monkeypatch):
+    calls = _count_probes(monkeypatch)
+    caps1 = capabilities.get_capabilities()
+    caps2 = capabilities.get_capabilities()
+    assert len(calls) == 1
+    assert caps1 is caps2
+    assert caps1.host in json.loads(cache_file.read_text())
+
+
+def test_disk_cache_hit(cache_file, monkeypatch):
+    caps1 = capabilities.get_capabilities()
+    capabilities._capabilities.clear() # as in a new process
+    calls = _count_probes(monkeypatch)
+    caps2 = capabilities.get_capabilities()
+    assert len(calls) == 0
+    assert caps1 == caps2
+
+
+def test_expired(cache_file, monkeypatch):
+    capabilities.configure(str(cache_file), ttl=-1)
+    calls = _count_probes(monkeypatch)
+    capabilities.get_capabilities()
+    capabilities.get_capabilities()
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("content", [ "not json", "[]", '{"http://127.0.0.1:5020": {"foo": 1, "expires_at": 9e99}}' ])
+def test_bad_cache_file(cache_file, monkeypatch, content):
+    cache_file.write_text(content)
+    calls = _count_probes(monkeypatch)
+    caps = capabilities.get_capabilities()
+    assert len(calls) == 1
+    assert not caps.is_databricks
+    assert caps.host in json.loads(cache_file.read_text())
+
+
+def test_no_cache_file(tmp_path, monkeypatch):
+    capabilities.configure("", ttl=3600)
+    try:
+        calls = _count_probes(monkeypatch)
+        capabilities.get_capabilities()
+        capabilities._capabilities.clear()
+        capabilities.get_capabilities()
+        assert len(calls) == 2
+        assert list(tmp_path.iterdir()) == []
+    finally:
+        capabilities.configure()
+
+
+def test_concurrent_single_probe(cache_file, monkeypatch):
+    calls = []
+    probe = capabilities._probe
+    def _slow_probe(host):
+        calls.append(capabilities._lock.locked())
+        time.sleep(0.2)
+        return probe(host)
+    monkeypatch.setattr(capabilities, "_probe", _slow_probe)
+    results = []
+    threads = [ threading.Thread(target=lambda: results.append(capabilities.get_capabilities())) for _ in range(0, 5) ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert calls == [ False ] # probed once without holding the lock
+    assert len(results) == 5
+    assert all(caps is results[0] for caps in results)
+
+
+def test_clear(cache_file):
+    capabilities.get_capabilities()
+    assert cache_file.exists()
+    capabilities.clear()
+    assert not cache_file.exists()
+    assert capabilities._capabilities == {}
+
+
+# == Databricks probes with faked responses
+
+def _fake_get(status_code):
+    def _get(resource, params=None):
+        if status_code == 200:
+            return {}
+        raise MlflowReportsException(http_status_code=status_code, uri=resource)
+    return _get
+
+
+def _fake_databricks(monkeypatch, uc_status_code):
+    monkeypatch.setattr(http_client.dbx_20_client, "get", _fake_get(400))
+    monkeypatch.setattr(http_client.dbx_21_client, "get", _fake_get(uc_status_code))
+
+
+@pytest.mark.parametrize("uc_status_code, has_unity_catalog", [ (200, True), (404, False), (403, False) ])
+def test_databricks_conclusive(cache_file, monkeypatch, uc_status_code, has_unity_catalog):
+    _fake_databricks(monkeypatch, uc_status_code)
+    caps = capabilities.get_capabilities()
+    assert caps.is_databricks
+    assert caps.has_unity_catalog == has_unity_catalog
+    assert caps.host in json.loads(cache_file.read_text())
+
+
+@pytest.mark.parametrize("uc_status_code", [ 500, 503 ])
+def test_databricks_uc_probe_failed_not_persisted(cache_file, monkeypatch, uc_status_code):
+    _fake_databricks(monkeypatch, uc_status_code)
+    caps = capabilities.get_capabilities()
+    assert caps.is_databricks
+    assert not caps.has_unity_catalog
+    assert not cache_file.exists()
+    assert caps.expires_at <= time.time() + capabilities._INCONCLUSIVE_TTL
+
+
+def test_explicit_uc_registry_uri_not_overridden(monkeypatch):
+    caps = capabilities.Capabilities("https://my.cloud.databricks.com", True, False)
+    monkeypatch.setattr(capabilities, "get_capabilities", lambda: caps)
+    monkeypatch.setenv("MLFLOW_REGISTRY_URI", "databricks-uc")
+    assert http_client.get_mlflow_client() is http_client.uc_mlflow_client
@@ -0,0 +1,40 @@
+import time
+from mlflow_reports.common import MlflowReportsException
+from mlflow_reports.common.concurrency_utils import map_ordered
+
+
+def _func(x):
+    time.sleep(0.01 * (10 - x))  # later items finish first
+    if x % 3 == 0:
+        raise MlflowReportsException(http_status_code=404, message=f"item {x}")
+    return x * 10
+
+
+def _do_test_map_ordered(max_workers):
+    items = list(range(1, 10))
+    results = map_ordered(_func, items, max_workers)
+    assert len(results) == len(items)
+    for x, (res, e) in zip(items, results):
+        if x % 3 == 0:
+            assert res is None
+            assert e.http_status_code == 404
+        else:
+            assert res == x * 10
+            assert e is None
+
+def test_map_ordered_sequential():
+    _do_test_map_ordered(1)
+
+def test_map_ordered_concurrent():
+    _do_test_map_ordered(4)
+
+
+def test_map_ordered_other_exception_raised():
+    def func(x):
+        raise ValueError(x)
+    try:
+        map_ordered(func, [1, 2], 2)
+        assert False
+    except ValueError:
+        pass
+
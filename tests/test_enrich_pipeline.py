@@ -0,0 +1,67 @@
+"""
+Test the composable enrichment pipeline and its steps.
+"""
+
+from mlflow_reports.data import enrich_pipeline
+from mlflow_reports.data.enrich_pipeline import Pipeline
+
+
+def _mk_run():
+    return {
+        "info": { "run_id": "1", "start_time": 1700000000000, "end_time": 1700000060000 },
+        "data": {
+            "params": [ { "key": "p1", "value": "[1, 2]" } ],
+            "tags": [ { "key": "t1", "value": '{"a": 1}' }, { "key": "t2", "value": "245" } ]
+        }
+    }
+
+
+def test_steps():
+    pipeline = Pipeline([
+        enrich_pipeline.timestamps("start_time", "end_time", "not_a_key", path="info"),
+        enrich_pipeline.tags(path="data"),
+        enrich_pipeline.explode(path="data"),
+        enrich_pipeline.defaults(description="", run_id="not_set"),
+        enrich_pipeline.drop("info")
+    ])
+    run = _mk_run()
+    assert pipeline(run) is run
+    assert run["data"]["tags"] == { "t1": { "a": 1 }, "t2": "245" }
+    assert run["data"]["params"] == [ { "key": "p1", "value": [ 1, 2 ] } ]
+    assert run["description"] == ""
+    assert run["run_id"] == "not_set"
+    assert "info" not in run
+
+
+def test_timestamps_path():
+    run = _mk_run()
+    Pipeline([ enrich_pipeline.timestamps("start_time", path="info"), enrich_pipeline.tags(path="not.a.path") ])(run)
+    assert run["info"]["_start_time"].startswith("2023-11-14")
+    assert isinstance(run["data"]["tags"], list)
+
+
+def test_unity_catalog_flag():
+    models = [ { "name": "catalog.schema.model" }, { "name": "model" } ]
+    pipeline = Pipeline([ enrich_pipeline.unity_catalog_flag() ])
+    assert [ m["_is_unity_catalog"] for m in pipeline.map(models) ] == [ True, False ]
+
+
+def test_map_is_lazy():
+    seen = []
+    def _source():
+        for j in range(0, 3):
+            seen.append(j)
+            yield { "j": j }
+    pipeline = Pipeline([ lambda obj: obj.update(k=obj["j"] * 10) ])
+    objects = pipeline.map(_source())
+    assert seen == []
+    assert next(objects) == { "j": 0, "k": 0 }
+    assert seen == [ 0 ]
+    assert [ obj["k"] for obj in objects ] == [ 10, 20 ]
+
+
+def test_add():
+    pipeline = Pipeline([ enrich_pipeline.defaults(a=1) ]) + [ enrich_pipeline.defaults(b=2) ]
+    pipeline = pipeline + Pipeline([ enrich_pipeline.drop("a") ])
+    assert len(pipeline.steps) == 3
+    assert pipeline({}) == { "b": 2 }
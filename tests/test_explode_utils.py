@@ -0,0 +1,68 @@
+"""
+Test explode_json. See tests/micro_benchmarks.py for its benchmark against the previous recursive version.
+"""
+
+import copy
+from mlflow_reports.common import explode_utils
+from mlflow_reports.common.explode_utils import explode_json
+
+
+def test_explode_objects_and_arrays():
+    dct = {
+        "a": '{"x": 1, "y": "[1, 2]"}',
+        "b": ' [ {"z": "{}"} ] ',
+        "c": [ '{"not": "exploded"}', { "d": '[3]' } ]
+    }
+    explode_json(dct)
+    assert dct == {
+        "a": { "x": 1, "y": [ 1, 2 ] },
+        "b": [ { "z": {} } ],
+        "c": [ '{"not": "exploded"}', { "d": [ 3 ] } ]
+    }
+
+
+def test_scalars_not_exploded():
+    dct = { "experiment_id": "245", "flag": "true", "null": "null", "num": "1.5", "quoted": '"x"', "empty": "", "one": "[" }
+    expected = copy.deepcopy(dct)
+    explode_json(dct)
+    assert dct == expected
+
+
+def test_not_json():
+    dct = { "a": "[INFO] started", "b": "{foo}", "c": "[1, 2" }
+    expected = copy.deepcopy(dct)
+    explode_json(dct)
+    assert dct == expected
+
+
+def test_key_value_tags():
+    tags = [
+        { "key": "mlflow.log-model.history", "value": '[{"flavors": {}}]' },
+        { "key": explode_utils.TAG_sparkDatasourceInfo, "value": "path=a,format=delta\npath=b,format=csv" },
+    ]
+    explode_json(tags)
+    assert tags[0]["value"] == [ { "flavors": {} } ]
+    assert tags[1]["value"] == [ { "path": "a", "format": "delta" }, { "path": "b", "format": "csv" } ]
+
+
+def test_keys_whitelist():
+    dct = {
+        "inputs": '[{"type": "double"}]',
+        "outputs": '[{"type": "long"}]',
+        "tags": [ { "key": "inputs", "value": '{"a": 1}' }, { "key": "other", "value": '{"b": 2}' } ]
+    }
+    explode_json(dct, keys={ "inputs" })
+    assert dct["inputs"] == [ { "type": "double" } ]
+    assert dct["outputs"] == '[{"type": "long"}]'
+    assert dct["tags"] == [ { "key": "inputs", "value": { "a": 1 } }, { "key": "other", "value": '{"b": 2}' } ]
+
+
+def test_deep_nesting():
+    dct = { "a": '{"b": "[1]"}' }
+    for _ in range(0, 5000):
+        dct = { "a": dct }
+    explode_json(dct) # no RecursionError
+    while "b" not in dct:
+        dct = dct["a"]
+    assert dct == { "b": [ 1 ] }
+
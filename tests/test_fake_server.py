@@ -0,0 +1,136 @@
+"""
+Test the offline fake MLflow REST server with the HTTP client and iterators.
+"""
+
+import time
+import pytest
+from mlflow_reports.common import MlflowReportsException
+from mlflow_reports.client import http_client, rate_limiter
+from mlflow_reports.client.http_client import HttpClient
+from mlflow_reports.common.http_iterators import (
+    SearchExperimentsIterator,
+    SearchRegisteredModelsIterator,
+    SearchModelVersionsIterator,
+    SearchRunsIterator,
+    FeatureTablesIterator
+)
+from tests.fake_server import FakeServer, FakeRegistry
+
+
+@pytest.fixture(scope="module")
+def server():
+    registry = FakeRegistry(num_experiments=3, num_runs=7, num_models=25, num_versions=4)
+    with FakeServer(registry) as server:
+        yield server
+
+
+def _mk_client(server, api_name="api/2.0/mlflow"):
+    return HttpClient(api_name, host=server.uri)
+
+
+@pytest.mark.parametrize("max_results", [ 1, 7, 10, 25, 100 ])
+def test_search_registered_models(server, max_results):
+    models = list(SearchRegisteredModelsIterator(_mk_client(server), max_results=max_results))
+    assert [ m["name"] for m in models ] == [ m["name"] for m in server.registry.models ]
+
+
+def test_search_model_versions(server):
+    client = _mk_client(server)
+    versions = list(SearchModelVersionsIterator(client, max_results=10))
+    assert len(versions) == 25 * 4
+    versions = list(SearchModelVersionsIterator(client, filter="name='model_00003'"))
+    assert [ vr["version"] for vr in versions ] == [ "1", "2", "3", "4" ]
+
+
+def test_search_runs_and_experiments(server):
+    client = _mk_client(server)
+    experiments = list(SearchExperimentsIterator(client, max_results=2))
+    assert len(experiments) == 3
+    runs = list(SearchRunsIterator(client, [ exp["experiment_id"] for exp in experiments[:2] ], max_results=3))
+    assert len(runs) == 14
+    runs2 = list(SearchRunsIterator(client, [ experiments[0]["experiment_id"] ], max_results=3).with_streaming(chunk_size=128))
+    assert runs2 == runs[:7]
+
+
+def test_get_objects(server):
+    client = _mk_client(server)
+    vr = client.get("model-versions/get", { "name": "model_00002", "version": "3" })["model_version"]
+    run = client.get("runs/get", { "run_id": vr["run_id"] })["run"]
+    assert run["info"]["run_id"] == vr["run_id"]
+    rsp = client.get("model-versions/get-download-uri", { "name": "model_00002", "version": "3" })
+    assert rsp["artifact_uri"] == vr["source"]
+    exp = client.get("experiments/get", { "experiment_id": run["info"]["experiment_id"] })["experiment"]
+    assert client.get("experiments/get-by-name", { "experiment_name": exp["name"] })["experiment"] == exp
+    with pytest.raises(MlflowReportsException) as e:
+        client.get("registered-models/get", { "name": "not_a_model" })
+    assert e.value.http_status_code == 404
+
+
+def test_list_artifacts(server):
+    client = _mk_client(server)
+    run_id = next(iter(server.registry.runs))
+    rsp = client.get("artifacts/list", { "run_id": run_id })
+    dirs = [ f["path"] for f in rsp["files"] if f["is_dir"] ]
+    assert dirs == [ "dir_0", "dir_1", "dir_2" ]
+    rsp = client.get("artifacts/list", { "run_id": run_id, "path": "dir_1/dir_0" })
+    assert [ f["path"] for f in rsp["files"] ] == [ "dir_1/dir_0/file_0.txt", "dir_1/dir_0/file_1.txt", "dir_1/dir_0/file_2.txt" ]
+
+
+def test_databricks_endpoints(server):
+    client = _mk_client(server, "api/2.0")
+    endpoints = client.get("serving-endpoints")["endpoints"]
+    assert len(endpoints) == 2
+    assert client.get(f"serving-endpoints/{endpoints[0]['name']}") == endpoints[0]
+    assert len(list(FeatureTablesIterator(client, max_results=1))) == 2
+    with pytest.raises(MlflowReportsException) as e:
+        client.get("workspace/get-status")
+    assert e.value.http_status_code == 404
+
+
+def test_latency_and_jitter():
+    with FakeServer(FakeRegistry(), latency=0.05, jitter=0.02) as server:
+        client = _mk_client(server)
+        start = time.perf_counter()
+        for _ in range(0, 5):
+            client.get("registered-models/search")
+        assert time.perf_counter() - start >= 5 * 0.03
+
+
+def test_throttling_is_retried(monkeypatch):
+    monkeypatch.setattr(http_client, "_MAX_RETRIES", 20)
+    with FakeServer(FakeRegistry(num_models=30), throttle_rate=0.3, seed=1) as server:
+        num_pauses = rate_limiter.get_num_pauses()
+        models = list(SearchRegisteredModelsIterator(_mk_client(server), max_results=3))
+        assert len(models) == 30
+        assert server.num_throttled > 0
+        assert server.num_requests == 10 + server.num_throttled
+        assert rate_limiter.get_num_pauses() - num_pauses == server.num_throttled
+
+
+def test_throttling_without_retry_after(monkeypatch):
+    monkeypatch.setattr(http_client, "_MAX_RETRIES", 1)
+    monkeypatch.setattr(http_client, "_BACKOFF_SECONDS", 0.001)
+    with FakeServer(FakeRegistry(), throttle_rate=1.0, retry_after=None) as server:
+        with pytest.raises(MlflowReportsException) as e:
+            _mk_client(server).get("registered-models/search")
+        assert e.value.http_status_code == 429
+        assert server.num_throttled == 2
+
+
+def test_reproducible(monkeypatch):
+    monkeypatch.setattr(http_client, "_MAX_RETRIES", 0)
+    def _run(seed):
+        with FakeServer(FakeRegistry(seed=seed), throttle_rate=0.5, seed=seed) as server:
+            client = _mk_client(server)
+            return [ _status(client) for _ in range(0, 10) ], server.registry.runs
+    statuses, runs = _run(3)
+    assert set(statuses) == { 200, 429 }
+    assert (statuses, runs) == _run(3)
+
+
+def _status(client):
+    try:
+        client._get("registered-models/search")
+        return 200
+    except MlflowReportsException as e:
+        return e.http_status_code
@@ -1,6 +1,8 @@
+import mlflow
+from mlflow_reports.client import mlflow_client
 from mlflow_reports.common import mlflow_utils 
 from mlflow_reports.common import MlflowReportsException
-from mlflow_reports.data import get_experiment
+from mlflow_reports.data import get_experiment, enriched_tags
 
 from . utils_test import create_experiment, create_run, assert_enriched_tags
 from . import test_get_run
@@ -75,5 +77,26 @@ def test_get_with_runs_with_artifacts():
     assert "artifacts" in run2
 
 
+def test_get_with_runs_experiment_lookups(monkeypatch):
+    exp1 = create_experiment()
+    num_runs = 3
+    for _ in range(0, num_runs):
+        with mlflow.start_run(experiment_id=exp1.experiment_id):
+            pass
+    calls = []
+    _get_experiment = mlflow_client.get_experiment
+    def _counting_get_experiment(experiment_id):
+        calls.append(experiment_id)
+        return _get_experiment(experiment_id)
+    monkeypatch.setattr(mlflow_client, "get_experiment", _counting_get_experiment)
+
+    rsp = get_experiment.get(exp1.experiment_id, get_runs=True)
+    runs = rsp["runs"]
+    assert len(runs) == num_runs
+    for run in runs:
+        assert run["run"]["info"][enriched_tags.TAG_EXPERIMENT_NAME] == exp1.name
+    assert len(calls) == 1
+
+
 def _assert_experiment(exp1, exp2):
     assert exp1.experiment_id == str(exp2["experiment_id"]) # NOTE: OSS returns int instead of string as per doc
@@ -1,7 +1,7 @@
 import mlflow
 from mlflow_reports.common import MlflowReportsException
 from mlflow_reports.data import get_registered_model
-from . utils_test import create_registered_model
+from . utils_test import create_registered_model, create_experiment, mk_uuid
 from . utils_test import assert_enriched_tags
 from mlflow_reports.common.dump_utils import dump_as_json
 
@@ -54,6 +54,41 @@ def test_get_rm_with_runs_and_artifacts():
     _do_test_get_rm_with_runs(999)
 
 
+def _create_registered_model_without_models(num_versions=5):
+    """
+    Versions of runs without a logged model - enough for enrichment which only needs the version.
+    """
+    model_name = mk_uuid()
+    client.create_registered_model(model_name)
+    exp = create_experiment()
+    for _ in range(0, num_versions):
+        run = client.create_run(exp.experiment_id)
+        client.create_model_version(model_name, run.info.artifact_uri, run.info.run_id)
+    return model_name
+
+
+def _do_test_get_rm_enrich_versions(max_workers, get_download_uri=True):
+    model_name = _create_registered_model_without_models()
+    _rm2 = get_registered_model.get(model_name, get_versions=True, enrich_versions=True,
+        get_download_uri=get_download_uri, max_workers=max_workers)
+    versions = _rm2.get("versions")
+    assert sorted(vr["version"] for vr in versions) == [ "1", "2", "3", "4", "5" ]
+    for vr in versions:
+        assert_enriched_tags(vr, True)
+        assert "_creation_timestamp" in vr
+        assert "_run_model_download_uri" in vr
+        assert ("_reg_model_download_uri" in vr) == get_download_uri
+
+def test_get_rm_enrich_versions():
+    _do_test_get_rm_enrich_versions(1)
+
+def test_get_rm_enrich_versions_concurrent():
+    _do_test_get_rm_enrich_versions(4)
+
+def test_get_rm_enrich_versions_no_download_uri():
+    _do_test_get_rm_enrich_versions(4, get_download_uri=False)
+
+
 def test_get_rm_raw():
     rm1 = create_registered_model()
     _rm2 = get_registered_model.get(rm1.name, get_raw=True)
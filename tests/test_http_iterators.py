@@ -2,6 +2,7 @@
 Test the MLflow HTTP object iterators (Run, Experiment, Registered Model and Model Versions).
 """
 
+import time
 from mlflow.entities import ViewType
 import mlflow
 
@@ -281,3 +282,56 @@ def __test_search_runs_too_many():
     iterator = SearchRunsIterator(http_client, exp.experiment_id, max_results)
     runs = list(iterator)
     assert num_runs == len(runs)
+
+
+# ==== Test prefetch mode
+
+def _run_test_search_runs_prefetch(num_runs, max_results, depth):
+    exp = _create_experiment(num_runs)
+    runs1 = list(SearchRunsIterator(http_client, exp.experiment_id, max_results))
+    runs2 = list(SearchRunsIterator(http_client, exp.experiment_id, max_results).with_prefetch(depth))
+    assert num_runs == len(runs2)
+    assert [ r["info"]["run_id"] for r in runs1 ] == [ r["info"]["run_id"] for r in runs2 ]
+
+def test_search_runs_prefetch():
+    _run_test_search_runs_prefetch(50, 7, 2)
+
+def test_search_runs_prefetch_one_page():
+    _run_test_search_runs_prefetch(5, 20, 1)
+
+def test_search_runs_prefetch_empty():
+    _run_test_search_runs_prefetch(0, 20, 1)
+
+def test_search_experiments_prefetch():
+    num_experiments = 12
+    _create_experiments(num_experiments, 0)
+    experiments = list(SearchExperimentsIterator(http_client, max_results=5).with_prefetch(3))
+    assert num_experiments == len([ exp for exp in experiments if exp["name"].startswith(TEST_OBJECT_PREFIX) ])
+
+class _PagesClient:
+    """
+    Returns 'num_pages' pages of one run each and counts the calls.
+    """
+    def __init__(self, num_pages):
+        self.num_pages = num_pages
+        self.num_calls = 0
+
+    def post(self, resource, params):
+        self.num_calls += 1
+        page = int(params.get("page_token", 0))
+        token = str(page+1) if page+1 < self.num_pages else None
+        return { "runs": [ { "page": page } ], "next_page_token": token }
+
+def test_search_prefetch_look_ahead():
+    depth = 2
+    client = _PagesClient(10)
+    runs = iter(SearchRunsIterator(client, "1").with_prefetch(depth))
+    assert next(runs) == { "page": 0 }
+    time.sleep(0.5)
+    assert client.num_calls == 1 + depth
+    assert [ r["page"] for r in runs ] == list(range(1, 10))
+
+def test_search_prefetch_fail():
+    runs = list(SearchRunsIterator(http_client, "foo").with_prefetch(1))
+    assert len(runs) == 0
+
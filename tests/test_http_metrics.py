@@ -0,0 +1,64 @@
+import os
+import sys
+import json
+import subprocess
+from mlflow_reports.client import http_metrics
+from mlflow_reports.client.http_client import mlflow_client
+from tests.utils_test import create_experiment
+
+
+def test_to_template():
+    assert http_metrics.to_template("runs/get") == "runs/get"
+    assert http_metrics.to_template("serving-endpoints/my_endpoint") == "serving-endpoints/{name}"
+    assert http_metrics.to_template("permissions/registered-models/123/permissionLevels") == "permissions/registered-models/{id}/permissionLevels"
+    assert http_metrics.to_template("unity-catalog/tables/a.b.c") == "unity-catalog/tables/{name}"
+
+
+def test_summary():
+    http_metrics.reset()
+    for j in range(1, 101):
+        http_metrics.record("GET", "runs/get", 200 if j <= 98 else 404, j/1000, 10)
+    http_metrics.record("POST", "runs/search", 429, 0.5)
+    summary = http_metrics.get_summary()
+    assert list(summary["endpoints"].keys()) == [ "GET runs/get", "POST runs/search" ]
+    metrics = summary["endpoints"]["GET runs/get"]
+    assert metrics["count"] == 100
+    assert metrics["num_bytes"] == 1000
+    assert metrics["status_codes"] == { "200": 98, "404": 2 }
+    assert metrics["latency"]["p50"] == 0.05
+    assert metrics["latency"]["p95"] == 0.095
+    assert metrics["latency"]["p99"] == 0.099
+    assert metrics["latency"]["max"] == 0.1
+    assert summary["totals"]["count"] == 101
+
+
+def test_http_client_metrics():
+    exp = create_experiment()
+    http_metrics.reset()
+    for _ in range(0, 3):
+        mlflow_client.get("experiments/get", { "experiment_id": exp.experiment_id })
+    metrics = http_metrics.get_summary()["endpoints"]["GET experiments/get"]
+    assert metrics["count"] == 3
+    assert metrics["status_codes"] == { "200": 3 }
+    assert metrics["num_bytes"] > 0
+
+
+def test_http_client_stream_metrics():
+    exp = create_experiment()
+    http_metrics.reset()
+    data = b"".join(mlflow_client.stream("POST", "runs/search", { "experiment_ids": [ exp.experiment_id ] }))
+    metrics = http_metrics.get_summary()["endpoints"]["POST runs/search"]
+    assert metrics["count"] == 1
+    assert metrics["status_codes"] == { "200": 1 }
+    assert metrics["num_bytes"] == len(data)
+
+
+def test_metrics_file_option(tmp_path):
+    metrics_file = str(tmp_path / "metrics.json")
+    subprocess.run(
+        [ sys.executable, "-m", "mlflow_reports.list.list_experiments",
+          "--output-file-base", str(tmp_path / "out"), "--metrics-file", metrics_file ],
+        check=True, capture_output=True, env=os.environ.copy())
+    with open(metrics_file, encoding="utf-8") as f:
+        summary = json.load(f)
+    assert summary["endpoints"]["GET experiments/search"]["count"] >= 1
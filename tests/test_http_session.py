@@ -0,0 +1,47 @@
+from mlflow_reports.client import http_session
+from mlflow_reports.client.http_client import mlflow_client, dbx_20_client
+
+
+def test_session_shared_per_host():
+    assert mlflow_client._get_session() is dbx_20_client._get_session()
+
+
+def test_connection_reuse():
+    http_session.close_sessions()
+    num_calls = 5
+    for _ in range(0, num_calls):
+        mlflow_client.get("experiments/search", {"max_results": 10})
+    stats = http_session.get_stats()[mlflow_client.host]
+    assert stats["num_requests"] == num_calls
+    assert stats["num_connections"] == 1
+    assert stats["num_reused"] == num_calls - 1
+
+
+def test_set_pool_size():
+    pool_size = http_session.get_pool_size()
+    session = mlflow_client._get_session()
+    http_session.set_pool_size(4)
+    try:
+        assert http_session.get_pool_size() == 4
+        assert mlflow_client._get_session() is not session
+    finally:
+        http_session.set_pool_size(pool_size)
+
+
+def test_ensure_pool_size():
+    pool_size = http_session.get_pool_size()
+    session = mlflow_client._get_session()
+    mlflow_client.get("experiments/search", {"max_results": 10})
+    old_adapter = session.get_adapter(mlflow_client.host)
+    assert len(old_adapter.poolmanager.pools) == 1
+    try:
+        http_session.ensure_pool_size(pool_size + 8)
+        assert http_session.get_pool_size() == pool_size + 8
+        assert mlflow_client._get_session() is session
+        adapter = session.get_adapter(mlflow_client.host)
+        assert adapter is not old_adapter
+        assert adapter._pool_maxsize == pool_size + 8
+        assert len(old_adapter.poolmanager.pools) == 0
+        mlflow_client.get("experiments/search", {"max_results": 10})
+    finally:
+        http_session.set_pool_size(pool_size)
@@ -0,0 +1,120 @@
+"""
+Import-time benchmark of the console script entry points with 'python -X importtime'.
+
+Fails when an entry point starts importing a heavy module (mlflow, pandas, ...) that it did not import
+in the baseline. This check is deterministic and always runs.
+
+Baseline import times are wall-clock seconds of the machine that wrote the baseline, so the timing check
+only runs when MLFLOW_REPORTS_CHECK_IMPORT_TIME=true, e.g. on the machine that wrote the baseline.
+The tolerance factor can be overridden with the MLFLOW_REPORTS_IMPORT_TIME_TOLERANCE environment variable.
+
+To regenerate the baseline after an intended change:
+    python -m tests.test_import_time
+"""
+
+import os
+import sys
+import json
+import subprocess
+import pytest
+
+_BASELINE_FILE = os.path.join(os.path.dirname(__file__), "import_time_baseline.json")
+_CHECK_TIME = os.environ.get("MLFLOW_REPORTS_CHECK_IMPORT_TIME", "false").lower() == "true"
+_TOLERANCE = float(os.environ.get("MLFLOW_REPORTS_IMPORT_TIME_TOLERANCE", 1.5))
+_SLACK_SECONDS = 0.25
+_NUM_TRIES = 3
+
+_HEAVY_MODULES = [
+    "mlflow",
+    "pandas",
+    "numpy",
+    "tabulate",
+    "mdutils",
+    "IPython",
+    "databricks_cli.configure",
+    "databricks.vector_search",
+]
+
+# Console scripts from setup.py plus 'python -m' modules.
+# NOTE: list_gateway_routes is excluded since it needs a gateway server at import time.
+_ENTRY_POINTS = [
+    "mlflow_reports.markdown.detailed_report",
+    "mlflow_reports.data.get_run",
+    "mlflow_reports.data.get_experiment",
+    "mlflow_reports.data.get_model_version",
+    "mlflow_reports.data.get_registered_model",
+    "mlflow_reports.data.get_mlflow_model",
+    "mlflow_reports.mlflow_model.mlflow_model_manager",
+    "mlflow_reports.list.list_registered_models",
+    "mlflow_reports.list.list_model_versions",
+    "mlflow_reports.list.list_experiments",
+    "mlflow_reports.model_serving.list_endpoints",
+    "mlflow_reports.deployments.list_endpoints",
+    "mlflow_reports.vector_search.list_endpoints",
+    "mlflow_reports.feature_store.list_feature_tables",
+]
+
+
+def measure(module):
+    """
+    Imports a module in a fresh interpreter.
+    :return: tuple of (cumulative import seconds, sorted list of heavy modules imported)
+    """
+    env = { **os.environ, "MLFLOW_DISABLE_AGENT_HINT": "1" }
+    env.setdefault("MLFLOW_TRACKING_URI", "http://localhost:5000")
+    proc = subprocess.run([ sys.executable, "-X", "importtime", "-c", f"import {module}" ],
+        check=True, capture_output=True, text=True, env=env)
+    seconds = 0.0
+    heavy_modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        name = name.strip()
+        if name in _HEAVY_MODULES:
+            heavy_modules.add(name)
+        if name == module:
+            seconds = int(cumulative_us) / 1_000_000
+    return seconds, sorted(heavy_modules)
+
+
+def _measure_best(module):
+    results = [ measure(module) for _ in range(0, _NUM_TRIES) ]
+    return min(r[0] for r in results), results[0][1]
+
+
+def _read_baseline():
+    with open(_BASELINE_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("module", _ENTRY_POINTS)
+def test_heavy_modules(module):
+    baseline = _read_baseline()[module]
+    _, heavy_modules = measure(module)
+    new_heavy_modules = set(heavy_modules) - set(baseline["heavy_modules"])
+    assert not new_heavy_modules, f"'{module}' now imports {sorted(new_heavy_modules)} at startup"
+
+
+@pytest.mark.skipif(not _CHECK_TIME, reason="Set MLFLOW_REPORTS_CHECK_IMPORT_TIME=true to compare with baseline wall-clock times")
+@pytest.mark.parametrize("module", _ENTRY_POINTS)
+def test_import_time(module):
+    baseline = _read_baseline()[module]
+    seconds, heavy_modules = _measure_best(module)
+    print(f"{module}: {round(seconds,3)} seconds (baseline {baseline['seconds']}). Heavy modules: {heavy_modules}")
+    assert seconds < baseline["seconds"] * _TOLERANCE + _SLACK_SECONDS
+
+
+def _write_baseline():
+    baseline = {}
+    for module in _ENTRY_POINTS:
+        seconds, heavy_modules = _measure_best(module)
+        baseline[module] = { "seconds": round(seconds, 3), "heavy_modules": heavy_modules }
+        print(f"{module}: {baseline[module]}")
+    with open(_BASELINE_FILE, "w", encoding="utf-8") as f:
+        f.write(json.dumps(baseline, indent=2)+"\n")
+    print(f"Wrote {_BASELINE_FILE}")
+
+
+if __name__ == "__main__":
+    _write_baseline()
@@ -1,3 +1,8 @@
+import os
+import csv
+import copy
+import tempfile
+import pytest
 from tempfile import NamedTemporaryFile as TempFile
 from mlflow_reports.common import io_utils
 
@@ -38,3 +43,38 @@ def test_text_filetype():
         io_utils.write_file(f.name, txt)
         obj = io_utils.read_file(f.name)
         assert obj == txt
+
+
+def test_write_csv_and_json_files_streaming():
+    objects = [ { "name": f"model_{j}", "creation_timestamp": 1703291776610 + j } for j in range(0, 3) ]
+    expected = [ { **dct, "_creation_timestamp": "2023-12-23 00:36:17" } for dct in copy.deepcopy(objects) ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        base = os.path.join(tmp_dir, "out")
+        num = io_utils.write_csv_and_json_files_streaming(base, iter(objects), ts_columns=["creation_timestamp"])
+        assert num == 3
+        objs = io_utils.read_file(f"{base}.json")
+        assert objs == expected
+        with open(f"{base}.csv", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [ r["name"] for r in rows ] == [ "model_0", "model_1", "model_2" ]
+        assert rows[0]["creation_timestamp"] == "2023-12-23 00:36:17"
+
+
+def test_write_csv_and_json_files_streaming_empty():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        base = os.path.join(tmp_dir, "out")
+        assert io_utils.write_csv_and_json_files_streaming(base, iter([])) == 0
+        assert io_utils.read_file(f"{base}.json") == []
+
+
+def test_write_csv_and_json_files_streaming_new_keys():
+    objects = [ { "name": "model_0" }, { "name": "model_1", "error": "RESOURCE_DOES_NOT_EXIST" } ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        base = os.path.join(tmp_dir, "out")
+        with pytest.raises(ValueError):
+            io_utils.write_csv_and_json_files_streaming(base, iter(copy.deepcopy(objects)))
+        num = io_utils.write_csv_and_json_files_streaming(base, iter(objects), columns=[ "name", "error" ])
+        assert num == 2
+        with open(f"{base}.csv", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert rows[1]["error"] == "RESOURCE_DOES_NOT_EXIST"
@@ -1,4 +1,5 @@
 import os
+import pytest
 import mlflow
 from mlflow_reports.client.http_client import (
     is_unity_catalog,
@@ -10,6 +11,16 @@ from mlflow_reports.client.http_client import (
 UC_VALUE = "databricks-uc"
 
 
+@pytest.fixture(autouse=True)
+def restore_registry_uri():
+    """
+    Don't leak the UC registry URI into later tests - clients are resolved on first use.
+    """
+    yield
+    os.environ.pop("MLFLOW_REGISTRY_URI", None)
+    mlflow.set_registry_uri(None)
+
+
 def test_not_set_uc():
     _init()
     assert not is_unity_catalog()
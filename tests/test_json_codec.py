@@ -0,0 +1,99 @@
+"""
+Tests of the JSON codecs. See tests/micro_benchmarks.py for their benchmark.
+"""
+
+import math
+import json
+import datetime
+import importlib.util
+from tempfile import NamedTemporaryFile as TempFile
+import pytest
+from mlflow_reports.common import json_codec, io_utils
+from mlflow_reports.common.json_codec import StdlibCodec, OrjsonCodec
+from tests.micro_benchmarks import mk_runs_search_page
+
+_has_orjson = importlib.util.find_spec("orjson") is not None
+_CODECS = [ StdlibCodec(), OrjsonCodec(), OrjsonCodec(fast_dumps=True) ] if _has_orjson else [ StdlibCodec() ]
+_DEFAULT_CODECS = _CODECS[:2]
+_CODEC_IDS = [ c.name for c in _CODECS ]
+
+
+@pytest.mark.parametrize("codec", _CODECS, ids=_CODEC_IDS)
+def test_loads_bytes_and_str(codec):
+    dct = mk_runs_search_page(5)
+    data = json.dumps(dct)
+    assert codec.loads(data) == dct
+    assert codec.loads(data.encode("utf-8")) == dct
+
+
+@pytest.mark.parametrize("codec", _CODECS, ids=_CODEC_IDS)
+def test_dumps_indent_same_as_stdlib(codec):
+    dct = { "b": [ 1, 2.5, None, True ], "a": { "nested": [], "empty": {} }, "s": "plain" }
+    assert codec.dumps(dct, indent=2) == json.dumps(dct, indent=2)
+    assert codec.dumps(dct, indent=2, sort_keys=True) == json.dumps(dct, indent=2, sort_keys=True)
+
+
+@pytest.mark.parametrize("codec", _CODECS, ids=_CODEC_IDS)
+def test_dumps_compact(codec):
+    dct = { "b": [ 1, 2.5, None, True ], "a": { "nested": [], "empty": {} }, "s": "plain" }
+    assert json.loads(codec.dumps(dct)) == dct
+
+
+@pytest.mark.skipif(not _has_orjson, reason="orjson not installed")
+def test_orjson_fallback_to_stdlib():
+    codec = OrjsonCodec()
+    dct = { 1: "int key", "big": 2**70 }
+    assert codec.dumps(dct) == json.dumps(dct)
+    assert codec.dumps(dct, indent=4) == json.dumps(dct, indent=4)
+
+
+@pytest.mark.parametrize("codec", _CODECS, ids=_CODEC_IDS)
+def test_dumps_default(codec):
+    class Obj:
+        def __init__(self):
+            self.name = "obj"
+    assert json.loads(codec.dumps({"obj": Obj()}, default=lambda o: o.__dict__)) == { "obj": { "name": "obj" } }
+
+
+@pytest.mark.parametrize("codec", _DEFAULT_CODECS, ids=_CODEC_IDS[:2])
+def test_nan_and_infinity_round_trip(codec):
+    dct = { "metrics": [ math.nan, math.inf, -math.inf, 0.5 ] }
+    data = codec.dumps(dct, indent=2)
+    assert data == json.dumps(dct, indent=2)
+    metrics = codec.loads(data)["metrics"]
+    assert math.isnan(metrics[0])
+    assert metrics[1:] == [ math.inf, -math.inf, 0.5 ]
+    assert math.isnan(codec.loads(data.encode("utf-8"))["metrics"][0])
+
+
+@pytest.mark.parametrize("codec", _CODECS, ids=_CODEC_IDS)
+def test_datetime_default(codec):
+    dct = { "ts": datetime.datetime(2024, 1, 2, 3, 4, 5) }
+    assert codec.dumps(dct, indent=2, default=str) == json.dumps(dct, indent=2, default=str)
+    assert codec.loads(codec.dumps(dct, default=str)) == { "ts": "2024-01-02 03:04:05" }
+
+
+@pytest.mark.parametrize("codec", _DEFAULT_CODECS, ids=_CODEC_IDS[:2])
+def test_non_ascii_escaped(codec):
+    dct = { "name": "vålue ✓" }
+    assert codec.dumps(dct, indent=2) == json.dumps(dct, indent=2)
+    assert codec.loads(codec.dumps(dct)) == dct
+
+
+def test_read_file_with_nan():
+    dct = { "metric": math.nan }
+    with TempFile(prefix="file_", suffix=".json", mode="w") as f:
+        f.write(json.dumps(dct))
+        f.flush()
+        assert math.isnan(io_utils.read_file(f.name)["metric"])
+
+
+def test_set_codec():
+    previous = json_codec.set_codec("json")
+    try:
+        assert json_codec.get_codec().name == "json"
+        assert json_codec.loads(b'{"a": 1}') == { "a": 1 }
+    finally:
+        json_codec.set_codec(previous)
+    assert json_codec.get_codec() is previous
+
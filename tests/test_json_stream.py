@@ -0,0 +1,115 @@
+"""
+Test incremental parsing of search responses and the streaming mode of the HTTP iterators.
+"""
+
+import json
+import pytest
+import mlflow
+
+from mlflow_reports.common import MlflowReportsException
+from mlflow_reports.common.json_stream import JsonArrayStreamParser
+from mlflow_reports.client.http_client import mlflow_client as http_client
+from mlflow_reports.common.http_iterators import SearchExperimentsIterator, SearchRunsIterator
+from tests.utils_test import create_experiment
+
+
+def _mk_page(num_runs, token="tok_123"):
+    runs = [ {
+        "info": { "run_id": f"run_{j}", "status": "FINISHED", "start_time": 1700000000000 + j },
+        "data": {
+            "params": [ { "key": "p", "value": f"va\\lue \"{j}\" , ] }} ü" } ],
+            "tags": [ { "key": "t", "value": json.dumps({"nested": [ j, { "x": "]" } ]}) } ]
+        }
+    } for j in range(num_runs) ]
+    page = { "runs": runs }
+    if token:
+        page["next_page_token"] = token
+    return page
+
+
+def _parse(data, array_key, chunk_size):
+    parser = JsonArrayStreamParser(array_key)
+    objects = []
+    max_buf = 0
+    for j in range(0, len(data), chunk_size):
+        objects += parser.feed(data[j:j+chunk_size])
+        max_buf = max(max_buf, len(parser._buf))
+    parser.close()
+    return objects, parser.fields, max_buf
+
+
+@pytest.mark.parametrize("chunk_size", [ 1, 3, 7, 64, 100_000 ])
+def test_parse_chunks(chunk_size):
+    page = _mk_page(20)
+    data = json.dumps(page, indent=2, ensure_ascii=False).encode("utf-8")
+    objects, fields, _ = _parse(data, "runs", chunk_size)
+    assert objects == page["runs"]
+    assert fields == { "next_page_token": "tok_123" }
+
+
+def test_parse_token_before_array():
+    data = b'{ "next_page_token": "abc", "other": { "a": [1, 2] }, "runs": [ {"a": 1}, 2, "three", [4] ] }'
+    objects, fields, _ = _parse(data, "runs", 5)
+    assert objects == [ {"a": 1}, 2, "three", [4] ]
+    assert fields == { "next_page_token": "abc", "other": { "a": [1, 2] } }
+
+
+@pytest.mark.parametrize("data", [ b'{}', b'{"runs": []}', b'{ "runs" : [ ] , "next_page_token": null }' ])
+def test_parse_empty(data):
+    objects, fields, _ = _parse(data, "runs", 2)
+    assert objects == []
+    assert fields.get("next_page_token") is None
+
+
+def test_parse_other_array_key():
+    data = json.dumps({ "experiments": [ { "id": 1 } ], "runs": [ { "id": 2 } ] }).encode("utf-8")
+    objects, fields, _ = _parse(data, "runs", 4)
+    assert objects == [ { "id": 2 } ]
+    assert fields == { "experiments": [ { "id": 1 } ] }
+
+
+def test_memory_bounded_by_object_size():
+    page = _mk_page(2000)
+    data = json.dumps(page).encode("utf-8")
+    max_object_size = max(len(json.dumps(run)) for run in page["runs"])
+    chunk_size = 1024
+    _, _, max_buf = _parse(data, "runs", chunk_size)
+    assert max_buf <= max_object_size + chunk_size
+    assert max_buf < len(data) / 100
+
+
+def test_incomplete_response():
+    data = json.dumps(_mk_page(3)).encode("utf-8")
+    with pytest.raises(MlflowReportsException):
+        _parse(data[:-10], "runs", 16)
+
+
+def test_not_an_object():
+    with pytest.raises(MlflowReportsException):
+        _parse(b'[ 1, 2 ]', "runs", 16)
+
+
+# ==== Streaming mode of the HTTP iterators against the tracking server
+
+def test_search_runs_streaming():
+    exp = create_experiment()
+    for _ in range(0, 7):
+        with mlflow.start_run():
+            mlflow.log_param("p1", "v1")
+    runs1 = list(SearchRunsIterator(http_client, exp.experiment_id, max_results=3))
+    runs2 = list(SearchRunsIterator(http_client, exp.experiment_id, max_results=3).with_streaming(chunk_size=256))
+    assert len(runs2) == 7
+    assert runs1 == runs2
+
+
+def test_search_experiments_streaming():
+    create_experiment()
+    experiments1 = list(SearchExperimentsIterator(http_client, max_results=2))
+    experiments2 = list(SearchExperimentsIterator(http_client, max_results=2).with_streaming(chunk_size=128))
+    assert len(experiments2) > 1
+    assert [ exp["experiment_id"] for exp in experiments1 ] == [ exp["experiment_id"] for exp in experiments2 ]
+
+
+def test_search_streaming_not_found():
+    iterator = SearchRunsIterator(http_client, "not_an_experiment_id").with_streaming()
+    assert list(iterator) == []
@@ -0,0 +1,20 @@
+"""
+Wall-clock checks of the micro-benchmarks. Only run when MLFLOW_REPORTS_CHECK_BENCHMARK_TIME=true.
+"""
+
+import json
+import pytest
+from tests import micro_benchmarks
+from tests.timing_utils import check_time
+
+
+@check_time
+@pytest.mark.parametrize("name, kwargs, check", [
+    ("explode_json", { "number": 2 }, lambda r: r["explode_json"] < r["recursive_json_loads"]),
+    ("json_codecs", { "num_runs": 500, "number": 2 }, lambda r: r["num_bytes"] > 0),
+    ("adjust_ts", { "num_rows": 20_000, "number": 2 }, lambda r: r["adjust_ts_batch"] < r["adjust_ts"]),
+], ids=[ "explode_json", "json_codecs", "adjust_ts" ])
+def test_benchmark(name, kwargs, check):
+    results = micro_benchmarks.BENCHMARKS[name](**kwargs)
+    print(f"{name} benchmark:", json.dumps(results, indent=2))
+    assert check(results)
@@ -0,0 +1,47 @@
+"""
+Test the batch get methods of MlflowClient.
+"""
+
+from mlflow_reports.common import MlflowReportsException
+from mlflow_reports.client import mlflow_client
+from mlflow_reports.common import model_version_utils
+from tests.utils_test import mlflow_client as client, mk_uuid
+
+
+def _create_model_versions(num_versions):
+    model_name = mk_uuid()
+    client.create_registered_model(model_name)
+    for _ in range(0, num_versions):
+        client.create_model_version(model_name, f"s3://mlflow-reports-tests/{model_name}/model")
+    return model_name
+
+
+def test_get_registered_models():
+    names = [ _create_model_versions(0) for _ in range(0, 3) ]
+    names.insert(1, "not_a_model")
+    results = mlflow_client.get_registered_models(names, max_workers=4)
+    assert len(results) == len(names)
+    for name, (rsp, e) in zip(names, results):
+        if name == "not_a_model":
+            assert rsp is None
+            assert isinstance(e, MlflowReportsException)
+        else:
+            assert e is None
+            assert rsp["registered_model"]["name"] == name
+
+
+def test_get_model_versions():
+    model_name = _create_model_versions(5)
+    pairs = [ (model_name, str(v)) for v in [ 5, 1, 3, 99, 2 ] ]
+    results = mlflow_client.get_model_versions(pairs, max_workers=4)
+    assert [ rsp["model_version"]["version"] if rsp else None for rsp, _ in results ] == [ "5", "1", "3", None, "2" ]
+    assert isinstance(results[3][1], MlflowReportsException)
+
+
+def test_get_versions_with_stage():
+    model_name = _create_model_versions(3)
+    client.transition_model_version_stage(model_name, "2", "production")
+    pairs = [ (model_name, "3"), (model_name, "production"), (model_name, "staging"), (model_name, "1") ]
+    results = model_version_utils.get_versions(pairs, max_workers=2)
+    assert [ vr["version"] if vr else None for vr, _ in results ] == [ "3", "2", None, "1" ]
+    assert isinstance(results[2][1], RuntimeError)
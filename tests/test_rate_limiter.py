@@ -0,0 +1,134 @@
+import time
+import requests
+from email.utils import formatdate
+from mlflow_reports.common import MlflowReportsException
+from mlflow_reports.client import http_client, rate_limiter
+from mlflow_reports.client.http_client import HttpClient
+from mlflow_reports.client.rate_limiter import TokenBucket
+
+
+def test_token_bucket_rate():
+    bucket = TokenBucket(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(0, 11):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.18
+    assert bucket.num_acquired == 11
+    assert bucket.num_waits == 10
+
+
+def test_token_bucket_no_rate():
+    bucket = TokenBucket()
+    start = time.monotonic()
+    for _ in range(0, 100):
+        bucket.acquire()
+    assert time.monotonic() - start < 0.1
+    assert bucket.num_waits == 0
+
+
+def test_token_bucket_pause():
+    bucket = TokenBucket()
+    bucket.pause(0.2)
+    start = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - start >= 0.15
+    assert bucket.num_pauses == 1
+
+
+def test_bucket_shared_per_host():
+    assert rate_limiter.get_bucket("http://foo") is rate_limiter.get_bucket("http://foo")
+    assert rate_limiter.get_bucket("http://foo") is not rate_limiter.get_bucket("http://bar")
+
+
+# == HttpClient retries
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = responses
+        self.num_calls = 0
+    def request(self, method, uri, **kwargs):
+        status_code, headers = self.responses[min(self.num_calls, len(self.responses)-1)]
+        self.num_calls += 1
+        rsp = requests.Response()
+        rsp.status_code = status_code
+        rsp.headers.update(headers)
+        rsp._content = b'{"experiment": {"name": "foo"}}'
+        rsp.url = uri
+        return rsp
+
+
+def _mk_client(monkeypatch, responses):
+    monkeypatch.setattr(http_client, "_BACKOFF_SECONDS", 0.001)
+    client = HttpClient("api/2.0/mlflow")
+    session = _FakeSession(responses)
+    monkeypatch.setattr(client, "_get_session", lambda: session)
+    return client, session
+
+
+def test_retry_after(monkeypatch):
+    client, session = _mk_client(monkeypatch, [ (429, {"Retry-After": "0"}), (503, {}), (200, {}) ])
+    num_pauses = rate_limiter.get_num_pauses()
+    rsp = client.get("experiments/get", { "experiment_id": "1" })
+    assert rsp["experiment"]["name"] == "foo"
+    assert session.num_calls == 3
+    assert rate_limiter.get_num_pauses() - num_pauses == 2
+
+
+def test_retries_exhausted(monkeypatch):
+    monkeypatch.setattr(http_client, "_MAX_RETRIES", 2)
+    client, session = _mk_client(monkeypatch, [ (503, {}) ])
+    try:
+        client.post("runs/search", { "experiment_ids": [ "1" ] })
+        assert False
+    except MlflowReportsException as e:
+        assert e.http_status_code == 503
+    assert session.num_calls == 3
+
+
+def test_no_retry_503_for_mutators(monkeypatch):
+    client, session = _mk_client(monkeypatch, [ (503, {}), (200, {}) ])
+    try:
+        client.post("runs/create", { "experiment_id": "1" })
+        assert False
+    except MlflowReportsException as e:
+        assert e.http_status_code == 503
+    assert session.num_calls == 1
+
+
+def test_retry_429_for_mutators(monkeypatch):
+    client, session = _mk_client(monkeypatch, [ (429, {"Retry-After": "0"}), (200, {}) ])
+    client.post("registered-models/create", { "name": "foo" })
+    assert session.num_calls == 2
+
+
+def test_is_retryable():
+    assert http_client._is_retryable("GET", "experiments/get", 503)
+    assert http_client._is_retryable("POST", "runs/search", 503)
+    assert http_client._is_retryable("POST", "runs/create", 429)
+    for method in [ "POST", "PUT", "PATCH", "DELETE" ]:
+        assert not http_client._is_retryable(method, "registered-models/create", 503)
+    assert not http_client._is_retryable("GET", "experiments/get", 500)
+
+
+def test_no_retry_on_other_errors(monkeypatch):
+    client, session = _mk_client(monkeypatch, [ (404, {}) ])
+    try:
+        client.get("experiments/get", { "experiment_id": "1" })
+        assert False
+    except MlflowReportsException as e:
+        assert e.http_status_code == 404
+    assert session.num_calls == 1
+
+
+def test_retry_delay():
+    def _mk_rsp(headers):
+        rsp = requests.Response()
+        rsp.headers.update(headers)
+        return rsp
+    assert http_client._get_retry_delay(_mk_rsp({"Retry-After": "7"}), 0) == 7
+    delay = http_client._get_retry_delay(_mk_rsp({"Retry-After": formatdate(time.time() + 30, usegmt=True)}), 0)
+    assert 25 < delay <= 30
+    for attempt in range(0, 4):
+        delay = http_client._get_retry_delay(_mk_rsp({}), attempt)
+        backoff = http_client._BACKOFF_SECONDS * 2**attempt
+        assert backoff/2 <= delay <= backoff
@@ -0,0 +1,60 @@
+import time
+from mlflow_reports.client import response_cache, http_session
+from mlflow_reports.client.response_cache import ResponseCache
+from mlflow_reports.client.http_client import mlflow_client
+from tests.utils_test import create_experiment
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    for j in range(0, 3):
+        cache.put(f"key_{j}", "experiments/get", f"value_{j}")
+    assert cache.get("key_0", "experiments/get") is None
+    assert cache.get("key_2", "experiments/get") == "value_2"
+    stats = cache.get_stats()["totals"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_ttl():
+    cache = ResponseCache(default_ttl=60, ttls={"experiments/get": 0.1, "runs/get": 0})
+    assert cache.get_ttl("experiments/get") == 0.1
+    assert cache.get_ttl("registered-models/search") == 0
+    assert cache.get_ttl("unknown/resource") == 60
+    cache.put("key", "experiments/get", "value")
+    cache.put("key2", "runs/get", "value")
+    assert cache.get("key", "experiments/get") == "value"
+    assert cache.get("key2", "runs/get") is None
+    time.sleep(0.2)
+    assert cache.get("key", "experiments/get") is None
+
+
+def test_disk_cache(tmp_path):
+    cache_file = str(tmp_path / "cache.db")
+    cache = ResponseCache(cache_file)
+    cache.put("key", "experiments/get", "value")
+    cache.close()
+    cache = ResponseCache(cache_file)
+    assert cache.get("key", "experiments/get") == "value"
+    assert cache.get("key", "experiments/get") == "value"
+    stats = cache.get_stats()["totals"]
+    assert stats["disk_hits"] == 1
+    assert stats["hits"] == 1
+    cache.close()
+
+
+def test_http_client_get():
+    exp = create_experiment()
+    params = { "experiment_id": exp.experiment_id }
+    cache = response_cache.configure()
+    try:
+        http_session.close_sessions()
+        rsp1 = mlflow_client.get("experiments/get", params)
+        rsp1["experiment"]["name"] = "modified"
+        rsp2 = mlflow_client.get("experiments/get", params)
+        assert rsp2["experiment"]["name"] == exp.name
+        assert http_session.get_stats()[mlflow_client.host]["num_requests"] == 1
+        stats = cache.get_stats()["resources"]["experiments/get"]
+        assert stats == { "hits": 1, "disk_hits": 0, "misses": 1 }
+    finally:
+        response_cache.configure(enabled=False)
@@ -0,0 +1,36 @@
+import pytest
+from mlflow_reports.common import MlflowReportsException
+from mlflow_reports.list import search_model_versions
+
+models = [ { "name": "model_a" }, { "name": "model_b" }, { "name": "model_c" } ]
+
+
+def _mk_list_model_versions(error):
+    def _list_model_versions(filter, get_tags_and_aliases, get_model_details, max_workers=1):
+        if "model_b" in filter:
+            raise error
+        name = filter.split("'")[1]
+        return [ { "name": name, "version": "1" } ]
+    return _list_model_versions
+
+
+@pytest.fixture
+def _patch_models(monkeypatch):
+    monkeypatch.setattr(search_model_versions.mlflow_client, "search_registered_models", lambda: models)
+
+
+@pytest.mark.parametrize("max_workers", [ 1, 3 ])
+def test_databricks_api_error_captured(monkeypatch, _patch_models, max_workers):
+    error = MlflowReportsException(http_status_code=403, message="Forbidden")
+    monkeypatch.setattr(search_model_versions, "_list_model_versions", _mk_list_model_versions(error))
+    versions = search_model_versions._list_model_versions_databricks(None, False, False, max_workers)
+    assert [ vr["name"] for vr in versions ] == [ "model_a", "model_b", "model_c" ]
+    assert "error" in versions[1]
+    assert "error" not in versions[0]
+
+
+@pytest.mark.parametrize("max_workers", [ 1, 3 ])
+def test_databricks_programming_error_raised(monkeypatch, _patch_models, max_workers):
+    monkeypatch.setattr(search_model_versions, "_list_model_versions", _mk_list_model_versions(KeyError("version")))
+    with pytest.raises(KeyError):
+        search_model_versions._list_model_versions_databricks(None, False, False, max_workers)
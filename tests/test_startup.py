@@ -0,0 +1,74 @@
+"""
+Startup cost of CLI commands: clients and credentials must be resolved lazily.
+The startup-time budget can be overridden with the MLFLOW_REPORTS_STARTUP_BUDGET environment variable.
+"""
+
+import os
+import sys
+import json
+import subprocess
+import mlflow
+from tests.utils_test import create_experiment
+
+_STARTUP_BUDGET_SECONDS = float(os.environ.get("MLFLOW_REPORTS_STARTUP_BUDGET", 4.0))
+
+_SCRIPT = """
+import sys, time, json
+start = time.perf_counter()
+from mlflow_reports.client import mlflow_auth_utils
+lookups = []
+_lookup = mlflow_auth_utils._get_mlflow_host_token
+def _counting_lookup(uri):
+    lookups.append(uri)
+    return _lookup(uri)
+mlflow_auth_utils._get_mlflow_host_token = _counting_lookup
+from mlflow_reports.data import get_run
+import_seconds = time.perf_counter() - start
+num_lookups_at_import = len(lookups)
+if len(sys.argv) > 1:
+    get_run.get(sys.argv[1])
+print(json.dumps({
+    "import_seconds": import_seconds,
+    "num_lookups_at_import": num_lookups_at_import,
+    "num_lookups": len(lookups)
+}))
+"""
+
+
+def _run_script(*args, env=None):
+    env = { **os.environ, "MLFLOW_DISABLE_AGENT_HINT": "1", **(env or {}) }
+    proc = subprocess.run([ sys.executable, "-c", _SCRIPT, *args ], check=True, capture_output=True, text=True, env=env)
+    return json.loads(proc.stdout.strip().split("\n")[-1])
+
+
+def test_import_without_credentials():
+    rsp = _run_script(env={ "MLFLOW_TRACKING_URI": "sqlite:///not_an_http_uri.db" })
+    assert rsp["num_lookups_at_import"] == 0
+
+
+def test_import_databricks_without_credentials():
+    """
+    A Databricks tracking URI must not trigger credential lookups or capability probes at import.
+    """
+    rsp = _run_script(env={
+        "MLFLOW_TRACKING_URI": "databricks",
+        "DATABRICKS_HOST": "http://127.0.0.1:9",
+        "DATABRICKS_TOKEN": "not_a_token",
+        "MLFLOW_REPORTS_CAPABILITIES_FILE": ""
+    })
+    assert rsp["num_lookups_at_import"] == 0
+
+
+def test_one_credential_lookup():
+    create_experiment()
+    with mlflow.start_run() as run:
+        pass
+    rsp = _run_script(run.info.run_id)
+    assert rsp["num_lookups_at_import"] == 0
+    assert rsp["num_lookups"] == 1
+
+
+def test_startup_time_budget():
+    seconds = min(_run_script()["import_seconds"] for _ in range(0, 3))
+    print(f"Startup time: {round(seconds,3)} seconds. Budget: {_STARTUP_BUDGET_SECONDS} seconds.")
+    assert seconds < _STARTUP_BUDGET_SECONDS
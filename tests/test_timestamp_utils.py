@@ -0,0 +1,58 @@
+"""
+Test the vectorized timestamp formatting of list commands against the per-dict version.
+"""
+
+import pandas as pd
+from mlflow_reports.common.timestamp_utils import fmt_ts_millis, fmt_ts_millis_batch, fmt_datetime64_batch
+from mlflow_reports.data import data_utils
+from mlflow_reports.list import list_utils
+
+
+millis_list = [ 1700000000000, 1700000000499, 1700000000500, 1700000001500, 1000, 1, 0, None, 253402300799000 ]
+
+
+def test_batch_same_as_single():
+    assert fmt_ts_millis_batch(millis_list) == [ fmt_ts_millis(millis) for millis in millis_list ]
+
+
+def test_batch_numeric_strings():
+    assert fmt_ts_millis_batch([ "1700000000000", "" ]) == [ fmt_ts_millis(1700000000000), None ]
+
+
+def test_batch_empty():
+    assert fmt_ts_millis_batch([]) == []
+    assert fmt_ts_millis_batch([ None, 0 ]) == [ None, None ]
+
+
+def test_adjust_ts_batch():
+    dcts = [ { "creation_timestamp": millis, "last_updated_timestamp": 1700000000000 } for millis in millis_list ]
+    expected = [ dict(dct) for dct in dcts ]
+    for dct in expected:
+        data_utils.adjust_ts(dct, [ "creation_timestamp", "last_updated_timestamp" ])
+    data_utils.adjust_ts_batch(dcts, [ "creation_timestamp", "last_updated_timestamp", "missing_timestamp" ])
+    assert dcts == expected
+
+
+def test_adjust_ts_batch_from_dataframe():
+    keys = [ "creation_timestamp", "last_updated_timestamp" ]
+    pandas_millis_list = millis_list[:-1] # year 9999 is out of range for pandas nanosecond timestamps
+    dcts = [ { "creation_timestamp": millis, "last_updated_timestamp": 1700000000000 } for millis in pandas_millis_list ]
+    expected = [ dict(dct) for dct in dcts ]
+    for dct in expected:
+        data_utils.adjust_ts(dct, keys)
+    df = pd.DataFrame(dcts)
+    list_utils.to_datetime(df, keys)
+    data_utils.adjust_ts_batch(dcts, keys, df)
+    assert dcts == expected
+
+
+def test_datetime64_batch():
+    values = pd.to_datetime(pd.Series([ 1700000000, 0, None ]), unit="s").to_numpy()
+    assert fmt_datetime64_batch(values) == [ fmt_ts_millis(1700000000000), None, None ]
+
+
+def test_adjust_ts_batch_no_keys():
+    dcts = [ { "creation_timestamp": 1700000000000 } ]
+    data_utils.adjust_ts_batch(dcts, None)
+    assert dcts == [ { "creation_timestamp": 1700000000000 } ]
+
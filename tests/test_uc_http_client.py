@@ -0,0 +1,78 @@
+"""
+Test the Unity Catalog composite client against the tracking server.
+UC resources are routed to a second client of the same OSS 'api/2.0/mlflow' API, which has the same contract.
+"""
+
+import pytest
+from mlflow_reports.client import mlflow_client
+from mlflow_reports.client.http_client import HttpClient, UnityCatalogHttpClient
+from mlflow_reports.common.http_iterators import SearchModelVersionsIterator, SearchRunsIterator
+from tests.utils_test import mlflow_client as client, mk_uuid, create_experiment
+
+
+class _RecordingHttpClient(HttpClient):
+    def __init__(self, api_name):
+        super().__init__(api_name)
+        self.resources = []
+    def stream(self, method, resource, params=None, chunk_size=64*1024):
+        self.resources.append(resource)
+        return super().stream(method, resource, params, chunk_size)
+
+
+def mk_uc_client():
+    return UnityCatalogHttpClient(_RecordingHttpClient("api/2.0/mlflow"), _RecordingHttpClient("api/2.0/mlflow"))
+
+
+@pytest.fixture
+def uc_client(monkeypatch):
+    """
+    Makes mlflow_client use a UC composite client.
+    """
+    uc_client = mk_uc_client()
+    monkeypatch.setattr(mlflow_client, "_client", uc_client)
+    return uc_client
+
+
+def create_model_versions(num_versions, exp=None):
+    model_name = mk_uuid()
+    client.create_registered_model(model_name)
+    exp = exp or create_experiment()
+    for _ in range(0, num_versions):
+        run = client.create_run(exp.experiment_id)
+        client.create_model_version(model_name, run.info.artifact_uri, run.info.run_id)
+    return model_name, exp
+
+
+def test_stream_model_versions(uc_client):
+    model_name, _ = create_model_versions(3)
+    filter = f"name = '{model_name}'"
+    versions = list(mlflow_client.iter_model_versions(filter, stream_pages=True))
+    assert versions == list(SearchModelVersionsIterator(uc_client, filter=filter))
+    assert len(versions) == 3
+    assert uc_client._uc_client.resources == [ "model-versions/search" ]
+    assert uc_client._mlflow_client.resources == []
+
+
+def test_stream_runs(uc_client):
+    _, exp = create_model_versions(2)
+    runs = list(mlflow_client.iter_runs([ exp.experiment_id ], stream_pages=True))
+    assert runs == list(SearchRunsIterator(uc_client, [ exp.experiment_id ]))
+    assert len(runs) == 2
+    assert uc_client._mlflow_client.resources == [ "runs/search" ]
+    assert uc_client._uc_client.resources == []
+
+
+def test_get_experiment_with_runs(uc_client):
+    from mlflow_reports.data import get_experiment
+    _, exp = create_model_versions(2)
+    dct = get_experiment.get(exp.experiment_id, get_runs=True)
+    assert dct["experiment"]["experiment_id"] == exp.experiment_id
+    assert len(dct["runs"]) == 2
+
+
+def test_get_registered_model_with_versions(uc_client):
+    from mlflow_reports.data import get_registered_model
+    model_name, _ = create_model_versions(3)
+    dct = get_registered_model.get(model_name, get_versions=True)
+    assert dct["registered_model"]["name"] == model_name
+    assert sorted(vr["version"] for vr in dct["versions"]) == [ "1", "2", "3" ]
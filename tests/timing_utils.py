@@ -0,0 +1,28 @@
+"""
+Timing helpers of the micro-benchmarks. Dependency-free so unit test modules can import it.
+
+Wall-clock assertions are not deterministic on a loaded machine so they only run when
+MLFLOW_REPORTS_CHECK_BENCHMARK_TIME=true.
+"""
+
+import os
+import time
+import pytest
+
+_CHECK_TIME = os.environ.get("MLFLOW_REPORTS_CHECK_BENCHMARK_TIME", "false").lower() == "true"
+
+check_time = pytest.mark.skipif(not _CHECK_TIME, reason="Set MLFLOW_REPORTS_CHECK_BENCHMARK_TIME=true to run wall-clock benchmarks")
+
+
+def best_time(func, number=3, setup=None):
+    """
+    Returns the best wall-clock seconds of 'number' calls of func after one warm-up call.
+    :param setup: Optional function called untimed before each call. Its result is passed to func.
+    """
+    def _time():
+        args = (setup(),) if setup else ()
+        start = time.perf_counter()
+        func(*args)
+        return time.perf_counter() - start
+    _time()
+    return round(min(_time() for _ in range(0, number)), 4)